@@ -0,0 +1,100 @@
+""" Benchmark interpolating periods into frames
+
+Compares the NumPy interpolation used by `_BaseChart.get_interpolated_df` with the previous
+`reindex` & `DataFrame.interpolate` implementation, and checks both give the same DataFrame.
+
+Run with `python benchmarks/interpolation.py`
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from pandas_alive._base_chart import _BaseChart
+
+
+def reindex_interpolate(
+    df: pd.DataFrame, steps_per_period: int, interpolate_period: bool
+) -> pd.DataFrame:
+    """ Previous implementation of `get_interpolated_df` with `reindex` & `DataFrame.interpolate`
+    """
+    interpolated_df = df.reset_index()
+    interpolated_df.index = interpolated_df.index * steps_per_period
+    new_index = range(interpolated_df.index[-1] + 1)
+    interpolated_df = interpolated_df.reindex(new_index)
+    if interpolate_period:
+        if interpolated_df.iloc[:, 0].dtype.kind == "M":
+            first, last = interpolated_df.iloc[[0, -1], 0]
+            dr = pd.date_range(first, last, periods=len(interpolated_df.index))
+            interpolated_df.iloc[:, 0] = dr
+        else:
+            interpolated_df.iloc[:, 0] = interpolated_df.iloc[:, 0].interpolate()
+    else:
+        interpolated_df.iloc[:, 0] = interpolated_df.iloc[:, 0].fillna(method="ffill")
+
+    interpolated_df = interpolated_df.set_index(interpolated_df.columns[0])
+    if interpolate_period and isinstance(df.index, pd.DatetimeIndex):
+        interpolated_df = interpolated_df.interpolate(method="time")
+    else:
+        interpolated_df = interpolated_df.interpolate()
+    return interpolated_df
+
+
+class _Chart:
+    """ Minimal stand in for a chart, `get_interpolated_df` only reads `self.df`
+    """
+
+    get_interpolation_coordinates = _BaseChart.get_interpolation_coordinates
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+
+
+def main():
+    rng = np.random.default_rng(0)
+    cases = [
+        # (periods, columns, steps_per_period, interpolate_period)
+        (100, 10, 10, True),
+        (365, 200, 10, True),
+        (365, 1000, 30, True),
+        (365, 1000, 30, False),
+    ]
+    print(f"{'periods':>8} {'columns':>8} {'steps':>6} {'interp':>7} {'pandas':>10} {'numpy':>10} {'speedup':>8}")
+    for periods, columns, steps, interpolate_period in cases:
+        df = pd.DataFrame(
+            rng.random((periods, columns)) * 1000,
+            index=pd.date_range("2020-01-01", periods=periods),
+            columns=[f"col{i}" for i in range(columns)],
+        )
+        chart = _Chart(df)
+
+        expected = reindex_interpolate(df, steps, interpolate_period)
+        result = _BaseChart.get_interpolated_df(chart, df, steps, interpolate_period)
+        pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+        number = 3
+        pandas_time = (
+            timeit.timeit(
+                lambda: reindex_interpolate(df, steps, interpolate_period),
+                number=number,
+            )
+            / number
+        )
+        numpy_time = (
+            timeit.timeit(
+                lambda: _BaseChart.get_interpolated_df(
+                    chart, df, steps, interpolate_period
+                ),
+                number=number,
+            )
+            / number
+        )
+        print(
+            f"{periods:>8} {columns:>8} {steps:>6} {str(interpolate_period):>7} "
+            f"{pandas_time:>9.3f}s {numpy_time:>9.3f}s {pandas_time / numpy_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+""" Benchmark peak memory while constructing a chart
+
+Each case builds a chart from a wide DataFrame in a fresh process and reports how far the peak
+resident set size (RSS) rose above the size of the input, with and without `copy=False`.
+
+Run with `python benchmarks/memory.py`
+"""
+
+import resource
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+import pandas_alive
+
+
+def peak_rss_mb() -> float:
+    """ Peak resident set size of this process so far in MB (Linux reports `ru_maxrss` in KB)
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def construct(kind: str, rows: int, columns: int, copy: bool):
+    """ Build a single chart and print the input size and peak RSS before and after construction
+    """
+    df = pd.DataFrame(
+        np.random.default_rng(0).random((rows, columns)) * 1000,
+        index=pd.date_range("2020-01-01", periods=rows),
+        columns=[f"col{i}" for i in range(columns)],
+    )
+    before = peak_rss_mb()
+    df.plot_animated(kind=kind, steps_per_period=1, copy=copy)
+    after = peak_rss_mb()
+    print(df.memory_usage().sum() / 1024 ** 2, before, after)
+
+
+def main():
+    cases = [
+        # (kind, rows, columns)
+        ("race", 5000, 2000),
+        ("line", 5000, 2000),
+    ]
+    print(f"{'kind':>6} {'input':>9} {'copy=True':>10} {'copy=False':>11}")
+    for kind, rows, columns in cases:
+        increases = []
+        for copy in (True, False):
+            output = subprocess.run(
+                [sys.executable, __file__, kind, str(rows), str(columns), str(copy)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            input_mb, before, after = map(float, output.splitlines()[-1].split())
+            increases.append(after - before)
+        print(
+            f"{kind:>6} {input_mb:>7.0f}MB {increases[0]:>8.0f}MB {increases[1]:>9.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        kind, rows, columns, copy = sys.argv[1:]
+        construct(kind, int(rows), int(columns), copy == "True")
+    else:
+        main()
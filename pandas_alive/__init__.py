@@ -17,7 +17,13 @@ Must begin with a pandas DataFrame containing 'wide' data where:
 # Register animated_plot accessor for Pandas DataFrames and Series:
 import pandas as pd
 from pandas.core.accessor import CachedAccessor
-from .plotting import AnimatedAccessor, plot, animate_multiple_plots
+from .plotting import (
+    AnimatedAccessor,
+    BatchResult,
+    animate_multiple_plots,
+    plot,
+    render_batch,
+)
 
 from .base import load_dataset
 
@@ -5,6 +5,7 @@ Methods & Attributes defined will be shared on all other chart types, is also in
 """
 
 import datetime
+import functools
 import typing
 
 import attr
@@ -14,10 +15,18 @@ import matplotlib.pyplot as plt
 import matplotlib.units as munits
 import numpy as np
 import pandas as pd
-from matplotlib import ticker
+from matplotlib import ticker, transforms
 from matplotlib.animation import FuncAnimation, PillowWriter
 from matplotlib.colors import Colormap, to_rgba
 
+from ._interpolation import (
+    EASING_FUNCTIONS,
+    INTERPOLATE_METHODS,
+    FrameInterpolator,
+    interpolate_array,
+    interpolate_values,
+)
+
 # For conciseDateFormatter for all plots https://matplotlib.org/3.1.0/gallery/ticks_and_spines/date_concise_formatter.html
 converter = mdates.ConciseDateConverter()
 munits.registry[np.datetime64] = converter
@@ -52,6 +61,116 @@ DARK24 = [
     "#AF0038",
 ]
 
+# Video tag of `FuncAnimation.to_html5_video`
+HTML5_VIDEO_TAG = """<video width="{width}" height="{height}" controls autoplay loop>
+  <source type="video/mp4" src="data:video/mp4;base64,{video}">
+  Your browser does not support the video tag.
+</video>"""
+
+
+def trailing_reduce(values: np.ndarray, window: int, func: np.ufunc) -> np.ndarray:
+    """ Reduce the last `window` entries up to each entry, eg a trailing minimum with `np.minimum`
+
+    Each pass doubles the span reduced, so this takes log2(window) passes over `values` rather than one pass per entry of the window.
+
+    Args:
+        values (np.ndarray): Values to reduce, shape (n,)
+        window (int): Number of entries to reduce, including the entry itself. Must be at least 1.
+        func (np.ufunc): Binary ufunc to reduce with where repeating an entry doesn't change the result, eg `np.minimum` or `np.maximum`
+
+    Returns:
+        np.ndarray: Reduction of `values[max(0, i - window + 1) : i + 1]` for every `i`
+    """
+    result = np.array(values)
+    span = 1
+    while span * 2 <= window:
+        result[span:] = func(result[span:], result[:-span])
+        span *= 2
+    remaining = min(window - span, len(result))
+    if remaining:
+        # Spans of `span` ending at i and at i - remaining cover the window, overlapping
+        result[remaining:] = func(result[remaining:], result[:-remaining])
+    return result
+
+
+def layout_rc_key() -> typing.Tuple:
+    """ Settings of `matplotlib.rcParams` that change the layout measured by `calculate_new_figsize`, for use in cache keys
+
+    Returns:
+        typing.Tuple: Figure dpi, layout and font settings
+    """
+    return tuple(
+        str(matplotlib.rcParams[key])
+        for key in (
+            "figure.dpi",
+            "figure.autolayout",
+            "figure.constrained_layout.use",
+            "font.family",
+            "font.size",
+            "xtick.labelsize",
+            "ytick.labelsize",
+            "axes.titlesize",
+        )
+    )
+
+
+def apply_figure_layout(fig: plt.Figure) -> None:
+    """ Run the layout of `fig` that drawing it would (eg `figure.autolayout`), without rendering anything
+
+    Text is measured through an Agg renderer, the figure itself is never rasterised.
+
+    Args:
+        fig (plt.Figure): Figure to lay out
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    renderer = FigureCanvasAgg(fig).get_renderer()
+    if hasattr(fig, "get_layout_engine"):
+        # matplotlib >= 3.6
+        engine = fig.get_layout_engine()
+        if engine is not None:
+            engine.execute(fig)
+        return
+    if fig.get_constrained_layout():
+        fig.execute_constrained_layout(renderer)
+    if fig.get_tight_layout():
+        fig.tight_layout(renderer=renderer)
+
+
+@functools.lru_cache(maxsize=256)
+def measure_axes_layout(
+    figsize: typing.Tuple[float, float],
+    tick_label_size: typing.Union[int, float, str],
+    labels: typing.Tuple[str, ...],
+    max_label: str,
+    rc_key: typing.Tuple,
+) -> typing.Tuple[transforms.Bbox, transforms.Bbox]:
+    """ Position of a subplot before and after labelling its ticks with the columns and largest value
+
+    Cached across charts, as the layout only depends on the arguments.
+
+    Args:
+        figsize (typing.Tuple[float, float]): Figure size in inches
+        tick_label_size (typing.Union[int, float, str]): Size of tick labels
+        labels (typing.Tuple[str, ...]): Column labels for the y ticks
+        max_label (str): Largest value, labelling every x tick
+        rc_key (typing.Tuple): `layout_rc_key()`, so changes to `rcParams` aren't served from the cache
+
+    Returns:
+        typing.Tuple[transforms.Bbox, transforms.Bbox]: Axes position before & after labelling
+    """
+    fig = plt.Figure(figsize=figsize)
+    ax = fig.add_subplot()
+    ax.tick_params(labelrotation=0, labelsize=tick_label_size)
+
+    apply_figure_layout(fig)
+    orig_pos = ax.get_position()
+    ax.set_yticklabels(labels)
+    ax.set_xticklabels([max_label] * len(ax.get_xticks()))
+
+    apply_figure_layout(fig)
+    return orig_pos.frozen(), ax.get_position().frozen()
+
 
 @attr.s()
 class _BaseChart:
@@ -64,6 +183,7 @@ class _BaseChart:
 
     df: pd.DataFrame = attr.ib()
     interpolate_period: bool = attr.ib()
+    interpolate_method: str = attr.ib()
     steps_per_period: int = attr.ib()
     period_length: int = attr.ib()
     period_fmt: str = attr.ib()
@@ -80,8 +200,18 @@ class _BaseChart:
     dpi: int = attr.ib()
     writer: str = attr.ib()
     enable_progress_bar: bool = attr.ib()
+    copy: bool = attr.ib()
     kwargs = attr.ib()
 
+    # Set to True when `anim_func` builds on the state left by every previous frame,
+    # so parallel workers must replay all earlier frames rather than only the first
+    replay_frames = False
+    # Charts supporting blitting override this with an attribute
+    blit = False
+    # Charts reading a single frame at a time override this with an attribute,
+    # `self.df` is then a `FrameInterpolator` rather than a DataFrame of every frame
+    lazy_frames = False
+
     def __attrs_post_init__(self):
         """
         Post initialisation steps to run
@@ -94,7 +224,8 @@ class _BaseChart:
         if isinstance(self.df, pd.Series):
             self.df = pd.DataFrame(self.df)
 
-        self.df = self.df.copy()
+        # A shallow copy shares the values with the input, only its columns are replaced below
+        self.df = self.df.copy(deep=self.copy)
         # from matplotlib import rcParams
 
         # rcParams.update({"figure.autolayout": True})
@@ -106,7 +237,8 @@ class _BaseChart:
         #         f"If using interpolate_period, ensure the index is a DatetimeIndex (eg, use df.index = pd.to_datetime(df.index))"
         #     )
 
-        self.orig_df = self.df.copy()
+        # Values are never modified in place, so the original periods can share them
+        self.orig_df = self.df.copy(deep=False)
         self.colors = self.get_colors(self.cmap)  # Get colors for plotting
         if not isinstance(self.df.columns, pd.MultiIndex):
             self.data_cols = self.get_data_cols(
@@ -121,9 +253,7 @@ class _BaseChart:
         print(f"Generating {self.__class__.__name__}, plotting {self.data_cols}")
 
         # Careful to use self.df in later calculations (eg, df_rank), use orig_df if needed
-        self.df = self.get_interpolated_df(
-            self.df, self.steps_per_period, self.interpolate_period
-        )
+        self.df = self.interpolate_frames(self.df)
         if self.fig is None:
             self.fig, self.ax = self.create_figure()
             self.figsize = self.fig.get_size_inches()
@@ -152,6 +282,10 @@ class _BaseChart:
         """
         if self.fig is not None and not isinstance(self.fig, plt.Figure):
             raise TypeError("`fig` must be a matplotlib Figure instance")
+        if self.interpolate_method not in INTERPOLATE_METHODS:
+            raise ValueError(
+                f"`interpolate_method` must be one of {INTERPOLATE_METHODS}"
+            )
         if self.writer:
             import matplotlib.animation as manimation
 
@@ -213,7 +347,7 @@ class _BaseChart:
                 cmap = DARK24 if cmap == "dark24" else plt.cm.get_cmap(cmap)
             except ValueError:
                 # Try setting a list of repeating colours if no cmap found (for single colours)
-                cmap = [to_rgba(cmap)] * len(self.get_data_cols(self.df))
+                cmap = [to_rgba(cmap)] * self.df.shape[1]
             except:
                 raise ValueError(
                     "Provide a suitable color name or color map as per matplotlib"
@@ -258,21 +392,24 @@ class _BaseChart:
             ax (matplotlib.pyplot.Axes): Axes to apply limits to
         """
         # TODO fix max for x and y?
+        if getattr(self, "frame_limits", None) is None:
+            self.frame_limits = self.calculate_frame_limits()
+        limits = self.frame_limits
         if self.fixed_max:
-            xlim_start = df.index.min()
+            xlim_start = limits["index_min"][-1]
             # For avoiding UserWarning on first frame with identical start and end limits
             if isinstance(xlim_start, pd.Timestamp):
-                xlim_end = self.df.index.max() + pd.Timedelta(seconds=1)
+                xlim_end = limits["index_max"][-1] + pd.Timedelta(seconds=1)
             else:
-                xlim_end = self.df.index.max() + 1e-6
+                xlim_end = limits["index_max"][-1] + 1e-6
         else:
-            xlim_start = df.index[: i + 1].min()
+            xlim_start = limits["index_min"][i]
 
             if isinstance(xlim_start, pd.Timestamp):
                 # For avoiding UserWarning on first frame with identical start and end limits
-                xlim_end = self.df.index[: i + 1].max() + pd.Timedelta(seconds=1)
+                xlim_end = limits["index_max"][i] + pd.Timedelta(seconds=1)
             else:
-                xlim_end = self.df.index[: i + 1].max() + 1e-6
+                xlim_end = limits["index_max"][i] + 1e-6
 
         # ufunc error occurs in anaconda environments if not converted to datetime instead of Timestamp
         if isinstance(xlim_start, pd.Timestamp):
@@ -280,31 +417,70 @@ class _BaseChart:
         else:
             ax.set_xlim(xlim_start, xlim_end)
         # self.ax.set_xlim(self.df.index[: i + 1].min(), self.df.index[: i + 1].max())
-        
+
+        values_min = limits["values_min"][-1]
+        values_max = limits["values_max"][-1]
         # Avoid lines/scatter crossing vertical ylim and looking cut off
-        ylim_scale = (self.df.values.max() - self.df.values.min())*0.05
+        ylim_scale = (values_max - values_min) * 0.05
         ylim_bot_scale = ylim_scale
         ylim_top_scale = ylim_scale
         # remove tolerance on ylim_bot/_top when data doesn't cross zero values
-        if self.df.values.min() >= 0:
+        if values_min >= 0:
             ylim_bot_scale = 0
-        if self.df.values.max() <= 0:
+        if values_max <= 0:
             ylim_top_scale = 0
         if self.fixed_max:
-            # ax.set_ylim(self.df.min().min(skipna=True)*ylim_scale, self.df.max().max(skipna=True)*ylim_scale)
-            ax.set_ylim(self.df.values.min() - ylim_bot_scale, self.df.values.max() + ylim_top_scale)
+            ax.set_ylim(values_min - ylim_bot_scale, values_max + ylim_top_scale)
         else:
-            ax.set_ylim(self.df.iloc[: i + 1].values.min() - ylim_bot_scale, self.df.iloc[: i + 1].values.max() + ylim_top_scale)
-            # ax.set_ylim(
-            #     self.df.iloc[: i + 1]
-            #     .select_dtypes(include=[np.number])
-            #     .min()
-            #     .min(skipna=True)*ylim_scale,
-            #     self.df.iloc[: i + 1]
-            #     .select_dtypes(include=[np.number])
-            #     .max()
-            #     .max(skipna=True)*ylim_scale,
-            # )
+            ax.set_ylim(
+                limits["values_min"][i] - ylim_bot_scale,
+                limits["values_max"][i] + ylim_top_scale,
+            )
+
+    def get_index_coordinates(self) -> np.ndarray:
+        """ Convert the index of every frame once to the numbers `matplotlib` plots, so frames can pass views of them
+
+        Returns:
+            np.ndarray: Dates as `mdates.date2num`, other numeric indexes as floats and any other index unchanged
+        """
+        index = self.df.index
+        if index.dtype.kind == "M":
+            return mdates.date2num(index)
+        if index.dtype.kind in "iuf":
+            return index.values.astype(float)
+        return index.values
+
+    def calculate_frame_limits(
+        self, window: int = None
+    ) -> typing.Dict[str, typing.Sequence]:
+        """
+        Calculate the running minimum & maximum of the index and values up to every frame
+
+        Computed once so per frame axis limits are a lookup rather than a rescan of every earlier row of the DataFrame.
+        As with `DataFrame.values.min()`, a NaN value propagates to the values limits of every later frame (or of the next `window` frames).
+
+        Args:
+            window (int, optional): Only include the last `window` frames up to each frame. Defaults to None for every frame from the start.
+
+        Returns:
+            typing.Dict[str, typing.Sequence]: `index_min` & `index_max` as `pd.Index`, `values_min` & `values_max` as `np.ndarray`, each with one entry per frame
+        """
+        values = self.df.values
+        if window is not None:
+            index = np.asarray(self.df.index)
+            return {
+                "index_min": pd.Index(trailing_reduce(index, window, np.minimum)),
+                "index_max": pd.Index(trailing_reduce(index, window, np.maximum)),
+                "values_min": trailing_reduce(values.min(axis=1), window, np.minimum),
+                "values_max": trailing_reduce(values.max(axis=1), window, np.maximum),
+            }
+        index = pd.Series(self.df.index)
+        return {
+            "index_min": pd.Index(index.cummin()),
+            "index_max": pd.Index(index.cummax()),
+            "values_min": np.minimum.accumulate(values.min(axis=1)),
+            "values_max": np.maximum.accumulate(values.max(axis=1)),
+        }
 
     def rename_data_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -345,8 +521,118 @@ class _BaseChart:
 
         return data_cols
 
+    def get_interpolation_coordinates(
+        self,
+        df: pd.DataFrame,
+        steps_per_period: int,
+        interpolate_period: bool,
+        interpolate_method: str = "linear",
+    ) -> typing.Tuple[pd.Index, np.ndarray, np.ndarray, typing.Optional[str]]:
+        """ Get the index of every frame and the coordinates to interpolate values between periods with
+
+        Args:
+            df (pd.DataFrame): Input dataframe
+            steps_per_period (int): The number of steps to go from one period to the next
+            interpolate_period (bool): Whether to interpolate the period, must be datetime index
+            interpolate_method (str, optional): How values move from one period to the next, one of "linear", "time", "smoothstep" or "cubic". Defaults to "linear".
+
+        Raises:
+            ValueError: If `interpolate_method="time"` is used without `interpolate_period` or with an index that isn't datetime or numeric and increasing
+
+        Returns:
+            typing.Tuple[pd.Index, np.ndarray, np.ndarray, typing.Optional[str]]: Index of every frame, coordinate of every frame, coordinate of every period and the easing function name if any
+        """
+        # Period interpolated to match other charts for multiple plotting
+        # Matches the previous `reindex` & `DataFrame.interpolate` output for "linear"
+        index = df.index
+        if index.dtype == object and index.inferred_type == "datetime":
+            # Dates in an object index, eg map columns transposed with "geometry"
+            index = pd.DatetimeIndex(index)
+        n_periods = len(index)
+        n_frames = (n_periods - 1) * steps_per_period + 1
+        frame_positions = np.arange(n_frames, dtype=float)
+        period_positions = np.arange(n_periods, dtype=float) * steps_per_period
+        index_kind = index.dtype.kind
+
+        if interpolate_period and index_kind == "M":
+            new_index = pd.date_range(index[0], index[-1], periods=n_frames)
+        elif steps_per_period == 1:
+            # Every frame is a period
+            new_index = index.copy()
+        elif interpolate_period and index_kind in "iuf":
+            new_index = pd.Index(
+                interpolate_array(
+                    frame_positions, period_positions, index.values[:, None]
+                )[:, 0]
+            )
+        else:
+            # Forward fill the index, NaN between periods if it can't be interpolated
+            new_index = index.take(np.arange(n_frames) // steps_per_period)
+            if interpolate_period or index_kind in "iub":
+                new_index = new_index.astype(float if index_kind in "iu" else object)
+            if interpolate_period:
+                new_index = new_index.where(
+                    np.arange(n_frames) % steps_per_period == 0, np.nan
+                )
+        if isinstance(new_index, pd.DatetimeIndex):
+            new_index = pd.DatetimeIndex(new_index, freq=None)
+        new_index.name = df.iloc[:0].reset_index().columns[0]
+
+        if interpolate_method == "time":
+            if not interpolate_period or index_kind not in "Miuf":
+                raise ValueError(
+                    '`interpolate_method="time"` requires `interpolate_period=True` and a datetime or numeric index'
+                )
+            if not index.is_monotonic_increasing:
+                raise ValueError(
+                    '`interpolate_method="time"` requires an increasing index'
+                )
+            x = new_index.asi8 if index_kind == "M" else new_index.values
+            xp = index.asi8 if index_kind == "M" else index.values
+        elif interpolate_period and index_kind == "M":
+            # Weighted by the evenly spaced dates of the new index
+            x = new_index.asi8
+            xp = x[::steps_per_period]
+        else:
+            x = frame_positions
+            xp = period_positions
+        easing = (
+            interpolate_method if interpolate_method in EASING_FUNCTIONS else None
+        )
+
+        return new_index, x, xp, easing
+
+    def interpolate_frames(
+        self, df: pd.DataFrame
+    ) -> typing.Union[pd.DataFrame, FrameInterpolator]:
+        """ Interpolate the periods of the chart into frames, on demand if `lazy_frames` is set
+
+        Args:
+            df (pd.DataFrame): Input dataframe
+
+        Returns:
+            typing.Union[pd.DataFrame, FrameInterpolator]: Interpolated dataframe, or a `FrameInterpolator` computing each frame when it is read
+        """
+        if not self.lazy_frames:
+            return self.get_interpolated_df(
+                df,
+                self.steps_per_period,
+                self.interpolate_period,
+                self.interpolate_method,
+            )
+
+        new_index, x, xp, easing = self.get_interpolation_coordinates(
+            df, self.steps_per_period, self.interpolate_period, self.interpolate_method
+        )
+        numeric = [dtype.kind in "iuf" for dtype in df.dtypes]
+        return FrameInterpolator(df.loc[:, numeric], new_index, x, xp, easing)
+
     def get_interpolated_df(
-        self, df: pd.DataFrame, steps_per_period: int, interpolate_period: bool
+        self,
+        df: pd.DataFrame,
+        steps_per_period: int,
+        interpolate_period: bool,
+        interpolate_method: str = "linear",
     ) -> pd.DataFrame:
         """ Get interpolated dataframe to span total animation
 
@@ -354,38 +640,39 @@ class _BaseChart:
             df (pd.DataFrame): Input dataframe
             steps_per_period (int): The number of steps to go from one period to the next. Data will show linearly between each period
             interpolate_period (bool): Whether to interpolate the period, must be datetime index
+            interpolate_method (str, optional): How values move from one period to the next, one of "linear", "time", "smoothstep" or "cubic". Defaults to "linear".
 
         Returns:
             pd.DataFrame: Interpolated dataframe
         """
-
-        # Period interpolated to match other charts for multiple plotting
-        # https://stackoverflow.com/questions/52701330/pandas-reindex-and-interpolate-time-series-efficiently-reindex-drops-data
-
-        interpolated_df = df.reset_index()
-        interpolated_df.index = interpolated_df.index * steps_per_period
-        new_index = range(interpolated_df.index[-1] + 1)
-        interpolated_df = interpolated_df.reindex(new_index)
-        if interpolate_period:
-            if interpolated_df.iloc[:, 0].dtype.kind == "M":
-                first, last = interpolated_df.iloc[[0, -1], 0]
-                dr = pd.date_range(first, last, periods=len(interpolated_df.index))
-                interpolated_df.iloc[:, 0] = dr
-            else:
-                interpolated_df.iloc[:, 0] = interpolated_df.iloc[:, 0].interpolate()
-        else:
-            interpolated_df.iloc[:, 0] = interpolated_df.iloc[:, 0].fillna(
-                method="ffill"
-            )
-
-        interpolated_df = interpolated_df.set_index(interpolated_df.columns[0])
-        # if self.interpolate_period == True and not isinstance(
-        #     self.df.index, pd.DatetimeIndex
-        # ):
-        if interpolate_period and isinstance(self.df.index, pd.DatetimeIndex):
-            interpolated_df = interpolated_df.interpolate(method="time")
-        else:
-            interpolated_df = interpolated_df.interpolate()
+        new_index, x, xp, easing = self.get_interpolation_coordinates(
+            df, steps_per_period, interpolate_period, interpolate_method
+        )
+        n_frames = len(new_index)
+
+        # Only numeric columns are interpolated, others are NaN between periods
+        numeric = np.array([dtype.kind in "iuf" for dtype in df.dtypes], dtype=bool)
+        # Boolean indexing copies every value, only needed to drop non-numeric columns
+        values = df.values if numeric.all() else df.values[:, numeric]
+        interpolated_df = pd.DataFrame(
+            interpolate_values(x, xp, values, easing),
+            index=new_index,
+            columns=df.columns[numeric],
+        )
+        if not numeric.all():
+            is_period = np.arange(n_frames) % steps_per_period == 0
+            for position in np.flatnonzero(~numeric):
+                column = df.iloc[:, position].values
+                if steps_per_period > 1:
+                    column = np.full(n_frames, np.nan, dtype=object)
+                    column[is_period] = df.iloc[:, position].values
+                interpolated_df[df.columns[position]] = column
+            interpolated_df = interpolated_df[df.columns]
+        if steps_per_period == 1:
+            # Nothing to fill in between periods, so columns keep their dtype
+            restore = numeric & ~df.isna().any().values & (df.dtypes != float).values
+            if restore.any():
+                interpolated_df = interpolated_df.astype(df.dtypes[restore].to_dict())
 
         return interpolated_df
 
@@ -417,13 +704,17 @@ class _BaseChart:
         return range(len(self.df.index))
 
     def make_animation(
-        self, frames: typing.Union[typing.Iterable, int], init_func: typing.Callable
+        self,
+        frames: typing.Union[typing.Iterable, int],
+        init_func: typing.Callable,
+        blit: bool = None,
     ) -> FuncAnimation:
         """ Method for creating animation
 
         Args:
             frames (int): Number of frames to animate
             init_func (function): Initialization function for chart
+            blit (bool, optional): Whether FuncAnimation should blit, if None use the chart's `blit`. Defaults to None.
 
         Returns:
             FuncAnimation: FuncAnimation instance for extending with save, etc
@@ -431,7 +722,12 @@ class _BaseChart:
 
         interval = self.period_length / self.steps_per_period
         return FuncAnimation(
-            self.fig, self.anim_func, frames, init_func, interval=interval
+            self.fig,
+            self.anim_func,
+            frames,
+            init_func,
+            interval=interval,
+            blit=self.blit if blit is None else blit,
         )
 
     def calculate_new_figsize(self, real_fig: plt.figure) -> typing.List[float]:
@@ -443,23 +739,14 @@ class _BaseChart:
         Returns:
             typing.List[float]: The dimensions [left, bottom, width, height] of the new axes. All quantities are in fractions of figure width and height.
         """
-        import io
-
-        fig = plt.Figure(figsize=self.figsize)
-
-        ax = fig.add_subplot()
-
-        max_val = self.df.values.max().max()
-        # ax.tick_params(labelrotation=0, axis="y", labelsize=self.tick_label_size)
-        ax.tick_params(labelrotation=0, labelsize=self.tick_label_size)
-
-        fig.canvas.print_figure(io.BytesIO())
-        orig_pos = ax.get_position()
-        ax.set_yticklabels(self.df.columns)
-        ax.set_xticklabels([max_val] * len(ax.get_xticks()))
-
-        fig.canvas.print_figure(io.BytesIO(), format="png")
-        new_pos = ax.get_position()
+        max_val = self.df.max().max()
+        orig_pos, new_pos = measure_axes_layout(
+            tuple(self.figsize),
+            self.tick_label_size,
+            tuple(str(column) for column in self.df.columns),
+            str(max_val),
+            layout_rc_key(),
+        )
 
         coordx, prev_coordx = new_pos.x0, orig_pos.x0
         coordy, prev_coordy = new_pos.y0, orig_pos.y0
@@ -537,16 +824,18 @@ class _BaseChart:
                     s = self.period_fmt.format(x=idx_val)
             else:
                 s = self.df.index.astype(str)[i]
-            num_texts = len(self.ax.texts)
-            if num_texts == 0:
+            # Kept by reference as `ax.texts` checks every child of the axes,
+            # which can be thousands of persistent bars
+            period_text = getattr(self, "period_label_text", None)
+            if period_text is None or period_text.axes is None:
                 # first frame
-                self.ax.text(
+                self.period_label_text = self.ax.text(
                     s=s,
                     transform=self.ax.transAxes,
                     **self.get_period_label(self.period_label),
                 )
             else:
-                self.ax.texts[0].set_text(s)
+                period_text.set_text(s)
 
         if self.period_summary_func:
             values = self.df.iloc[i]
@@ -557,10 +846,15 @@ class _BaseChart:
                     f"The dictionary returned from `{name}` must contain "
                     '"x", "y", and "s"'
                 )
-            if len(self.ax.texts) != 2:
-                self.ax.text(transform=self.ax.transAxes, **text_dict)
+            # Keep a reference rather than relying on its position in `ax.texts`,
+            # as charts may add their own persistent texts after it
+            summary_text = getattr(self, "period_summary_text", None)
+            if summary_text is None or summary_text.axes is None:
+                self.period_summary_text = self.ax.text(
+                    transform=self.ax.transAxes, **text_dict
+                )
             else:
-                self.ax.texts[1].set_text(text_dict["s"])
+                summary_text.set_text(text_dict["s"])
 
     def clearing(self):
         """
@@ -572,55 +866,143 @@ class _BaseChart:
             for item in ax.lines + ax.collections + ax.containers + ax.texts:
                 item.remove()
     
-    def save(self, filename: str) -> None:
+    def get_animated_artists(self) -> typing.List[matplotlib.artist.Artist]:
+        """ Artists that change from frame to frame, redrawn over a cached background when blitting
+
+        Returns:
+            typing.List[matplotlib.artist.Artist]: Lines, collections, texts and legend of the chart axes
+        """
+        artists = [*self.ax.lines, *self.ax.collections, *self.ax.texts]
+        legend = self.ax.get_legend()
+        if legend is not None:
+            artists.append(legend)
+        return artists
+
+    def get_frame_capture(self) -> typing.Callable[[], np.ndarray]:
+        """ Get function that draws the current frame and returns it as an RGBA array
+
+        Returns:
+            typing.Callable[[], np.ndarray]: Blits the animated artists over a cached background if `blit` is enabled, otherwise draws the whole figure
+        """
+        from ._rendering import FrameBlitter, capture_frame
+
+        if self.blit:
+            return FrameBlitter(self.fig, self.get_animated_artists).capture
+        return functools.partial(capture_frame, self.fig)
+
+    def render_frames(self, workers: int = None) -> typing.Iterator[np.ndarray]:
+        """ Render every frame of the animation in order
+
+        Args:
+            workers (int, optional): Number of worker processes to render frames with, output is identical to rendering in a single process. Defaults to None.
+
+        Yields:
+            np.ndarray: RGBA array of shape (height, width, 4) for each frame, only valid until the next frame is rendered
+        """
+        if workers and workers > 1:
+            from ._rendering import render_frames_parallel
+
+            for rgba in render_frames_parallel(self, self.get_frames(), workers):
+                if self.enable_progress_bar:
+                    self.update_progress_bar()
+                yield rgba
+        else:
+            capture = self.get_frame_capture()
+            for i in self.get_frames():
+                self.anim_func(i)
+                yield capture()
+
+    def save(
+        self,
+        filename: str,
+        workers: int = None,
+        global_palette: bool = False,
+        codec: str = None,
+        crf: int = None,
+        preset: str = None,
+        pix_fmt: str = "yuv420p",
+        threads: int = None,
+    ) -> None:
         """ Save method for FuncAnimation.
 
+        Movies are streamed into ffmpeg as their frames are rendered when it is available, the encoder settings are only used in this case.
+
         Args:
             filename (str): File name with extension to save animation to, supported formats at https://matplotlib.org/3.1.1/api/animation_api.html
+            workers (int, optional): Number of worker processes to render frames with, output is identical to rendering in a single process. Defaults to None.
+            global_palette (bool, optional): For GIFs, quantise every frame to the palette of the first frame instead of a palette per frame. Defaults to False.
+            codec (str, optional): For movies, ffmpeg video encoder, if None use `rcParams["animation.codec"]`. Defaults to None.
+            crf (int, optional): For movies, constant rate factor of the encoder, lower is higher quality. Defaults to None.
+            preset (str, optional): For movies, encoder preset trading speed for compression, eg "ultrafast" or "slow" for h264. Defaults to None.
+            pix_fmt (str, optional): For movies, pixel format of the encoded video. Defaults to "yuv420p".
+            threads (int, optional): For movies, number of threads ffmpeg encodes with. Defaults to None.
         """
 
         # Inspiration for design pattern https://github.com/altair-viz/altair/blob/c55707730935159e4e2d2c789a6dd2bc3f1ec0f2/altair/utils/save.py
         # https://altair-viz.github.io/user_guide/saving_charts.html
-        
+
         if self.enable_progress_bar:
             self.setup_progress_bar()
 
-        anim = self.make_animation(self.get_frames(), self.init_func)
         self.fps = 1000 / self.period_length * self.steps_per_period
         interval = self.period_length / self.steps_per_period
-        num_frames = len(self.get_frames())
+
+        from ._rendering import FFMpegPipeWriter
 
         extension = filename.split(".")[-1]
+        pipe_video = extension != "gif" and FFMpegPipeWriter.is_available()
+        if (
+            workers
+            and workers > 1
+            and (self.writer or not (extension == "gif" or pipe_video))
+        ):
+            import warnings
+
+            warnings.warn(
+                "Rendering with `workers` is only supported without a `writer`, and for movies when ffmpeg is installed, rendering in a single process"
+            )
+            workers = None
+
         try:
             if self.writer:
+                anim = self.make_animation(
+                    self.get_frames(), self.init_func, blit=False
+                )
                 anim.save(filename, fps=self.fps, dpi=self.dpi, writer=self.writer)
+            elif extension == "gif":
+                import matplotlib
+
+                matplotlib.use("Agg")
+                from ._rendering import GifWriter
+
+                # Frames are written as they are rendered, so memory use is flat
+                with GifWriter(
+                    filename, duration=interval, global_palette=global_palette
+                ) as gif:
+                    for rgba in self.render_frames(workers):
+                        gif.write_frame(rgba)
+            elif pipe_video:
+                import matplotlib
+
+                matplotlib.use("Agg")
+
+                # Frames are encoded by ffmpeg while the next ones are rendered
+                with FFMpegPipeWriter(
+                    filename,
+                    fps=self.fps,
+                    codec=codec,
+                    crf=crf,
+                    preset=preset,
+                    pix_fmt=pix_fmt,
+                    threads=threads,
+                ) as video:
+                    for rgba in self.render_frames(workers):
+                        video.write_frame(rgba)
             else:
-                if extension == "gif":
-                    import io
-                    import matplotlib
-
-                    matplotlib.use("Agg")
-                    from PIL import Image
-
-                    frames = []
-                    for i in range(0, num_frames):
-                        self.anim_func(i)
-                        buffer = io.BytesIO()
-                        self.fig.savefig(buffer, format="png")
-                        buffer.seek(0)
-                        image = Image.open(buffer)
-                        plt.close()
-                        frames.append(image)
-                    frames[0].save(
-                        filename,
-                        save_all=True,
-                        append_images=frames[:],
-                        optimize=False,
-                        duration=interval,
-                        loop=0,
-                    )
-                else:
-                    anim.save(filename, fps=self.fps, dpi=self.dpi)
+                anim = self.make_animation(
+                    self.get_frames(), self.init_func, blit=False
+                )
+                anim.save(filename, fps=self.fps, dpi=self.dpi)
             if self.enable_progress_bar:
                 self.progress_bar.close()
             # Clearing axes contents after save, so that fig's axes can be re-used in a 
@@ -645,22 +1027,77 @@ class _BaseChart:
     #         anim._encoded_video = video.encode("base64")
     #     return VIDEO_TAG.format(anim._encoded_video)
 
-    def get_html5_video(self):
+    def get_html5_video(
+        self,
+        workers: int = None,
+        codec: str = "h264",
+        crf: int = None,
+        preset: str = None,
+        pix_fmt: str = "yuv420p",
+        threads: int = None,
+    ) -> str:
         """ Convert the animation to an HTML5 <video> tag.
 
-        This saves the animation as an h264 video, encoded in base64 directly into the HTML5 video tag. This respects the rc parameters for the writer as well as the bitrate. This also makes use of the interval to control the speed, and uses the repeat parameter to decide whether to loop.
+        This saves the animation as an h264 video, encoded in base64 directly into the HTML5 video tag. This makes use of the interval to control the speed and loops the video. Videos larger than `rcParams["animation.embed_limit"]` are not embedded.
+
+        Frames are streamed into ffmpeg as they are rendered, like movies written by `save`. Without ffmpeg this falls back to `FuncAnimation.to_html5_video`, which ignores the encoder settings & `workers`.
+
+        Args:
+            workers (int, optional): Number of worker processes to render frames with, output is identical to rendering in a single process. Defaults to None.
+            codec (str, optional): ffmpeg video encoder, browsers expect h264. Defaults to "h264".
+            crf (int, optional): Constant rate factor of the encoder, lower is higher quality. Defaults to None.
+            preset (str, optional): Encoder preset trading speed for compression, eg "ultrafast" or "slow" for h264. Defaults to None.
+            pix_fmt (str, optional): Pixel format of the encoded video. Defaults to "yuv420p".
+            threads (int, optional): Number of threads ffmpeg encodes with. Defaults to None.
 
         Returns:
-            HTML5 <video> tag: Encoded h264 video
+            str: HTML5 <video> tag of the h264 video, or a message that the video is too large to embed
         """
+        import warnings
 
-        anim = self.make_animation(self.get_frames(), self.init_func)
+        from ._rendering import FFMpegPipeWriter
 
-        # html_tag = self.encode_html5_video(anim)
-        html_tag = anim.to_html5_video()
-        if "too large to embed" in html_tag:
-            import warnings
+        if not FFMpegPipeWriter.is_available():
+            anim = self.make_animation(self.get_frames(), self.init_func, blit=False)
+            html_tag = anim.to_html5_video()
+        else:
+            import base64
+            import os
+            import tempfile
 
+            matplotlib.use("Agg")
+            if self.enable_progress_bar:
+                self.setup_progress_bar()
+            with tempfile.TemporaryDirectory() as tmpdir:
+                filename = os.path.join(tmpdir, "temp.m4v")
+                with FFMpegPipeWriter(
+                    filename,
+                    fps=1000 / self.period_length * self.steps_per_period,
+                    codec=codec,
+                    crf=crf,
+                    preset=preset,
+                    pix_fmt=pix_fmt,
+                    threads=threads,
+                ) as video:
+                    for rgba in self.render_frames(workers):
+                        video.write_frame(rgba)
+                    height, width = rgba.shape[:2]
+                with open(filename, "rb") as f:
+                    video_bytes = f.read()
+            if self.enable_progress_bar:
+                self.progress_bar.close()
+            self.clearing()
+
+            # Same tag & size limit as `FuncAnimation.to_html5_video`
+            video_base64 = base64.b64encode(video_bytes).decode("ascii")
+            embed_limit = matplotlib.rcParams["animation.embed_limit"] * 1024 ** 2
+            if len(video_base64) >= embed_limit:
+                html_tag = "Video too large to embed."
+            else:
+                html_tag = HTML5_VIDEO_TAG.format(
+                    width=width, height=height, video=video_base64
+                )
+        if "too large to embed" in html_tag:
             warnings.warn(
                 "HTML5 Tag is too large to embed, try another format such as mp4, GIF or otherwise."
             )
@@ -0,0 +1,306 @@
+""" Interpolation of periods into animation frames
+
+Upsamples the known periods of a DataFrame with NumPy, building each interpolated array in a single allocation rather than reindexing to a frame full of NaNs and calling `DataFrame.interpolate`.
+`FrameInterpolator` instead interpolates each frame on demand, without storing every frame.
+
+"""
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+def smoothstep(weight: np.ndarray) -> np.ndarray:
+    """ Ease in and out of each period with the smoothstep polynomial 3w^2 - 2w^3
+
+    Args:
+        weight (np.ndarray): Fraction of the way through each period, from 0 to 1
+
+    Returns:
+        np.ndarray: Eased fraction
+    """
+    return weight * weight * (3 - 2 * weight)
+
+
+def ease_cubic(weight: np.ndarray) -> np.ndarray:
+    """ Ease in and out of each period with a cubic, accelerating over the first half and decelerating over the second
+
+    Args:
+        weight (np.ndarray): Fraction of the way through each period, from 0 to 1
+
+    Returns:
+        np.ndarray: Eased fraction
+    """
+    return np.where(weight < 0.5, 4 * weight ** 3, 1 - (2 - 2 * weight) ** 3 / 2)
+
+
+EASING_FUNCTIONS: typing.Dict[str, typing.Callable] = {
+    "smoothstep": smoothstep,
+    "cubic": ease_cubic,
+}
+INTERPOLATE_METHODS = ("linear", "time", *EASING_FUNCTIONS)
+
+
+def interpolate_array(
+    x: np.ndarray, xp: np.ndarray, fp: np.ndarray, easing: str = None
+) -> np.ndarray:
+    """ Interpolate every column of `fp` from the coordinates `xp` onto `x`
+
+    Without easing this is `np.interp` applied to every column at once, so the result is identical to `DataFrame.interpolate`.
+    Values at and after the last coordinate of `xp` are the last value, values before the first coordinate are NaN as pandas only interpolates forward.
+
+    Args:
+        x (np.ndarray): Increasing coordinates of the frames, shape (frames,)
+        xp (np.ndarray): Increasing coordinates of the known values, shape (periods,)
+        fp (np.ndarray): Known values without NaN, shape (periods, columns)
+        easing (str, optional): Name of a function in `EASING_FUNCTIONS` applied to the fraction of the way through each period. Defaults to None for linear.
+
+    Returns:
+        np.ndarray: Interpolated values, shape (frames, columns)
+    """
+    x = np.asarray(x, dtype=float)
+    xp = np.asarray(xp, dtype=float)
+    fp = np.asarray(fp, dtype=float)
+
+    if len(xp) == 1:
+        out = np.repeat(fp, len(x), axis=0)
+    else:
+        period = np.searchsorted(xp, x, side="right") - 1
+        np.clip(period, 0, len(xp) - 2, out=period)
+        offset = x - xp[period]
+        # Repeated coordinates give infinite slopes, only ever used at the coordinate itself
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if easing is None:
+                # Same operations as `np.interp`, slope * (x - xp[j]) + fp[j]
+                out = ((fp[1:] - fp[:-1]) / np.diff(xp)[:, None]).take(period, axis=0)
+                out *= offset[:, None]
+            else:
+                weight = EASING_FUNCTIONS[easing](offset / np.diff(xp)[period])
+                out = (fp[1:] - fp[:-1]).take(period, axis=0)
+                out *= weight[:, None]
+        out += fp.take(period, axis=0)
+        at_period = offset == 0
+        out[at_period] = fp[period[at_period]]
+        out[x >= xp[-1]] = fp[-1]
+    out[x < xp[0]] = np.nan
+    return out
+
+
+def interpolate_values(
+    x: np.ndarray,
+    xp: np.ndarray,
+    values: np.ndarray,
+    easing: str = None,
+    dtype: np.dtype = float,
+) -> np.ndarray:
+    """ Interpolate every column of `values` from the coordinates `xp` onto `x`, skipping NaN values
+
+    Columns without NaN are interpolated together, the remaining columns are interpolated between their own valid values.
+
+    Args:
+        x (np.ndarray): Increasing coordinates of the frames, shape (frames,)
+        xp (np.ndarray): Increasing coordinates of each row of `values`, shape (periods,)
+        values (np.ndarray): Known values, shape (periods, columns)
+        easing (str, optional): Name of a function in `EASING_FUNCTIONS`. Defaults to None for linear.
+        dtype (np.dtype, optional): Type of the result. Other than float64, frames are interpolated in chunks and cast into the result, so no float64 array of every frame is allocated. Defaults to float.
+
+    Returns:
+        np.ndarray: Interpolated values, shape (frames, columns)
+    """
+    if np.dtype(dtype) != np.float64:
+        x = np.asarray(x)
+        out = np.empty((len(x), np.shape(values)[1]), dtype=dtype)
+        chunk_size = max(1, 2 ** 20 // max(out.shape[1], 1))
+        for start in range(0, len(x), chunk_size):
+            out[start : start + chunk_size] = interpolate_values(
+                x[start : start + chunk_size], xp, values, easing
+            )
+        return out
+
+    xp = np.asarray(xp, dtype=float)
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    if valid.all():
+        return interpolate_array(x, xp, values, easing)
+
+    out = np.full((len(x), values.shape[1]), np.nan)
+    complete = valid.all(axis=0)
+    if complete.any():
+        out[:, complete] = interpolate_array(x, xp, values[:, complete], easing)
+    for column in np.flatnonzero(~complete & valid.any(axis=0)):
+        rows = valid[:, column]
+        out[:, column] = interpolate_array(
+            x, xp[rows], values[rows, column : column + 1], easing
+        )[:, 0]
+    return out
+
+
+class FrameInterpolator:
+    """ Frames of a DataFrame interpolated on demand from the periods either side of them
+
+    Only the periods are stored, so memory depends on the size of the input rather than the number of frames.
+    Every frame is identical to the same row of `interpolate_values` for all frames at once.
+    Provides the parts of the `pd.DataFrame` interface the charts read frames with: `index`, `columns`, `shape`, `iloc`, `max()` & `min()`.
+
+    Args:
+        periods (pd.DataFrame): Numeric values of each period
+        index (pd.Index): Index of every frame
+        x (np.ndarray): Increasing coordinates of the frames, shape (frames,)
+        xp (np.ndarray): Increasing coordinates of the periods, shape (periods,)
+        easing (str, optional): Name of a function in `EASING_FUNCTIONS`. Defaults to None for linear.
+    """
+
+    def __init__(
+        self,
+        periods: pd.DataFrame,
+        index: pd.Index,
+        x: np.ndarray,
+        xp: np.ndarray,
+        easing: str = None,
+    ):
+        self.periods = periods.astype(float)
+        self.index = index
+        self.columns = periods.columns
+        self.easing = easing
+        self._values = self.periods.values
+        self._x = np.asarray(x, dtype=float)
+        self._xp = np.asarray(xp, dtype=float)
+        # Period at or before each frame
+        self._frame_period = np.searchsorted(self._xp, self._x, side="right") - 1
+
+        # For each period and column, the closest period with a value at or before it (-1 if none)
+        # and at or after it (number of periods if none), so NaN values are interpolated over
+        n_periods = len(self._xp)
+        positions = np.arange(n_periods)[:, None]
+        valid = ~np.isnan(self._values)
+        self._previous_valid = np.maximum.accumulate(
+            np.where(valid, positions, -1), axis=0
+        )
+        next_valid = np.where(valid, positions, n_periods)
+        self._next_valid = np.vstack(
+            [
+                np.minimum.accumulate(next_valid[::-1], axis=0)[::-1],
+                np.full((1, next_valid.shape[1]), n_periods),
+            ]
+        )
+
+        self.iloc = _FrameIndexer(self)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def shape(self) -> typing.Tuple[int, int]:
+        return len(self.index), len(self.columns)
+
+    def max(self, skipna: bool = True) -> pd.Series:
+        """ Largest value of each column across all frames
+
+        Args:
+            skipna (bool, optional): Exclude NaN values, otherwise a column with any NaN is NaN. Defaults to True.
+
+        Returns:
+            pd.Series: Largest value of each column
+        """
+        return self._reduce(np.fmax if skipna else np.maximum)
+
+    def min(self, skipna: bool = True) -> pd.Series:
+        """ Smallest value of each column across all frames
+
+        Args:
+            skipna (bool, optional): Exclude NaN values, otherwise a column with any NaN is NaN. Defaults to True.
+
+        Returns:
+            pd.Series: Smallest value of each column
+        """
+        return self._reduce(np.fmin if skipna else np.minimum)
+
+    def _reduce(self, func: np.ufunc, chunk_size: int = 1024) -> pd.Series:
+        """ Reduce every frame with `func`, interpolating `chunk_size` frames at a time
+
+        Frames don't always fall on the periods (eg `interpolate_period` spreads them evenly), so the frames themselves are reduced rather than the periods.
+
+        Args:
+            func (np.ufunc): One of `np.fmax`, `np.fmin`, `np.maximum` or `np.minimum`
+            chunk_size (int, optional): Frames interpolated at once. Defaults to 1024.
+
+        Returns:
+            pd.Series: Reduced value of each column
+        """
+        result = None
+        for start in range(0, len(self), chunk_size):
+            chunk = func.reduce(
+                self.get_values(slice(start, start + chunk_size)), axis=0
+            )
+            result = chunk if result is None else func(result, chunk)
+        return pd.Series(result, index=self.columns)
+
+    def get_values(
+        self, frames: typing.Union[int, slice, np.ndarray], columns: np.ndarray = None
+    ) -> np.ndarray:
+        """ Interpolate the values of every column at the given frames
+
+        Args:
+            frames (typing.Union[int, slice, np.ndarray]): Positions of the frames
+            columns (np.ndarray, optional): Positions of the columns to interpolate. Defaults to None for every column.
+
+        Returns:
+            np.ndarray: Values with shape (frames, columns)
+        """
+        frames = np.atleast_1d(np.arange(len(self))[frames])
+        if columns is None:
+            columns = np.arange(self._values.shape[1])
+        n_periods = len(self._xp)
+        x = self._x[frames][:, None]
+        period = self._frame_period[frames][:, None]
+        before = self._previous_valid[np.maximum(period, 0), columns]
+        before[np.broadcast_to(period < 0, before.shape)] = -1
+        after = self._next_valid[period + 1, columns]
+
+        has_before = before >= 0
+        has_after = after < n_periods
+        before = np.where(has_before, before, 0)
+        after = np.where(has_after, after, before)
+        fp_before = self._values[before, columns]
+        xp_before = self._xp[before]
+        offset = x - xp_before
+
+        # Same operations as `interpolate_array` between the two closest values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.easing is None:
+                out = (self._values[after, columns] - fp_before) / (
+                    self._xp[after] - xp_before
+                )
+                out *= offset
+            else:
+                weight = EASING_FUNCTIONS[self.easing](
+                    offset / (self._xp[after] - xp_before)
+                )
+                out = self._values[after, columns] - fp_before
+                out *= weight
+        out += fp_before
+        at_period = (offset == 0) | ~has_after
+        out[at_period] = fp_before[at_period]
+        out[~has_before] = np.nan
+        return out
+
+
+class _FrameIndexer:
+    """ Positional indexer for `FrameInterpolator`, mirroring `DataFrame.iloc` for rows
+    """
+
+    def __init__(self, frames: FrameInterpolator):
+        self.frames = frames
+
+    def __getitem__(
+        self, key: typing.Union[int, slice, np.ndarray]
+    ) -> typing.Union[pd.Series, pd.DataFrame]:
+        values = self.frames.get_values(key)
+        if np.ndim(key) == 0 and not isinstance(key, slice):
+            return pd.Series(
+                values[0], index=self.frames.columns, name=self.frames.index[key]
+            )
+        return pd.DataFrame(
+            values, index=self.frames.index[key], columns=self.frames.columns
+        )
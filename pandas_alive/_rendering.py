@@ -0,0 +1,504 @@
+""" Frame rendering helpers shared by all chart types
+
+Renders the frames of a chart to raw RGBA arrays, either serially or split into chunks across worker processes, and streams them into GIF or ffmpeg encoded video files.
+
+"""
+
+import collections
+import io
+import math
+import multiprocessing
+import subprocess
+import typing
+
+import numpy as np
+from matplotlib import animation, rcParams
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+
+# State of the chart held by each worker process, set by `_init_worker`
+_WORKER_CHART = None
+_WORKER_NEXT_FRAME = 0
+_WORKER_CAPTURE = None
+
+
+def _get_agg_canvas(fig) -> typing.Optional[FigureCanvasAgg]:
+    """ Agg canvas of figure, attaching one to figures without a backend
+    """
+    canvas = fig.canvas
+    if type(canvas) is FigureCanvasBase:
+        canvas = FigureCanvasAgg(fig)
+    if isinstance(canvas, FigureCanvasAgg):
+        return canvas
+    return None
+
+
+def capture_frame(fig) -> np.ndarray:
+    """ Draw figure and return its pixels as an RGBA array
+
+    Reads the Agg canvas buffer directly, avoiding the PNG encode/decode round trip of `savefig`.
+    The array is a view on the canvas buffer and will be overwritten by the next draw, copy it if it needs to be kept.
+
+    Args:
+        fig (plt.Figure): Figure to draw
+
+    Returns:
+        np.ndarray: Array of shape (height, width, 4) with dtype uint8
+    """
+    canvas = _get_agg_canvas(fig)
+    if canvas is not None:
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba())
+
+    # Canvas from another backend, still skip compression by saving raw RGBA
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="rgba", dpi=fig.dpi)
+    width, height = (int(size) for size in fig.bbox.size)
+    return np.frombuffer(buffer.getbuffer(), np.uint8).reshape(height, width, 4)
+
+
+class FrameBlitter:
+    """ Capture frames by restoring a cached background and only drawing the animated artists
+
+    The background (axes, ticks, grid, title, etc) is rendered once and recaptured whenever the figure size or the limits of any axes change.
+    Animated artists are drawn on top in the same order as a full draw, so frames are identical to `capture_frame`.
+
+    Args:
+        fig (plt.Figure): Figure to draw
+        get_artists (typing.Callable[[], typing.Iterable[Artist]]): Returns the artists that change between frames
+    """
+
+    def __init__(self, fig, get_artists: typing.Callable[[], typing.Iterable]):
+        self.fig = fig
+        self.get_artists = get_artists
+        self._key = None
+        self._background = None
+
+    def capture(self) -> np.ndarray:
+        """ Draw current frame and return its pixels as an RGBA array
+
+        Returns:
+            np.ndarray: Array of shape (height, width, 4) with dtype uint8, see `capture_frame`
+        """
+        canvas = _get_agg_canvas(self.fig)
+        if canvas is None:
+            return capture_frame(self.fig)
+
+        artists = set(self.get_artists())
+        for artist in artists:
+            artist.set_animated(True)
+        try:
+            key = (
+                tuple(self.fig.bbox.bounds),
+                tuple((ax.get_xlim(), ax.get_ylim()) for ax in self.fig.axes),
+            )
+            if key != self._key:
+                # Full draw skips animated artists, leaving the static background
+                canvas.draw()
+                self._background = canvas.copy_from_bbox(self.fig.bbox)
+                self._key = key
+            else:
+                canvas.restore_region(self._background)
+
+            renderer = canvas.get_renderer()
+            for ax in sorted(self.fig.axes, key=lambda ax: ax.get_zorder()):
+                animated = [a for a in ax.get_children() if a in artists]
+                for artist in sorted(animated, key=lambda a: a.get_zorder()):
+                    artist.draw(renderer)
+        finally:
+            for artist in artists:
+                artist.set_animated(False)
+        return np.asarray(canvas.buffer_rgba())
+
+
+def get_chunks(
+    frames: typing.Sequence[int], workers: int, chunksize: int = None
+) -> typing.List[typing.Sequence[int]]:
+    """ Split frames into contiguous chunks to be rendered by workers
+
+    Args:
+        frames (typing.Sequence[int]): Frames to render
+        workers (int): Number of worker processes
+        chunksize (int, optional): Number of frames per chunk, if None aim for ~4 chunks per worker capped at 8 frames per chunk. Defaults to None.
+
+    Returns:
+        typing.List[typing.Sequence[int]]: List of chunks of frames in order
+    """
+    if chunksize is None:
+        chunksize = max(1, min(8, math.ceil(len(frames) / (workers * 4))))
+    return [frames[i : i + chunksize] for i in range(0, len(frames), chunksize)]
+
+
+def _get_context() -> multiprocessing.context.BaseContext:
+    """ Prefer forking workers so the chart does not need to be pickled
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _init_worker(chart) -> None:
+    """ Initialise worker process with its own copy of the chart
+
+    Args:
+        chart (_BaseChart): Chart to render, inherited on fork or unpickled on spawn
+    """
+    global _WORKER_CHART, _WORKER_NEXT_FRAME, _WORKER_CAPTURE
+    import matplotlib
+
+    matplotlib.use("Agg")
+    chart.enable_progress_bar = False
+    _WORKER_CHART = chart
+    _WORKER_NEXT_FRAME = 0
+    _WORKER_CAPTURE = chart.get_frame_capture()
+
+
+def _render_chunk(chunk: typing.Sequence[int]) -> typing.List[np.ndarray]:
+    """ Render a chunk of frames in a worker process
+
+    Brings the worker's chart up to the state serial rendering would have at the start of the chunk, then renders each frame in the chunk.
+
+    Args:
+        chunk (typing.Sequence[int]): Contiguous frames to render
+
+    Returns:
+        typing.List[np.ndarray]: RGBA array for each frame in chunk
+    """
+    global _WORKER_NEXT_FRAME
+    chart = _WORKER_CHART
+    start = chunk[0]
+    if chart.replay_frames:
+        for frame in range(_WORKER_NEXT_FRAME, start):
+            chart.anim_func(frame)
+    elif _WORKER_NEXT_FRAME == 0 and start > 0:
+        chart.anim_func(0)
+
+    rendered = []
+    for frame in chunk:
+        chart.anim_func(frame)
+        rendered.append(_WORKER_CAPTURE().copy())
+    _WORKER_NEXT_FRAME = chunk[-1] + 1
+    return rendered
+
+
+def render_frames_parallel(
+    chart, frames: typing.Sequence[int], workers: int, chunksize: int = None
+) -> typing.Iterator[np.ndarray]:
+    """ Render frames of chart across worker processes
+
+    Frames are split into contiguous chunks, rendered in worker processes and yielded back in order. At most two chunks per worker are in flight at once, so memory does not grow with the number of frames.
+
+    Args:
+        chart (_BaseChart): Chart to render
+        frames (typing.Sequence[int]): Frames to render
+        workers (int): Number of worker processes
+        chunksize (int, optional): Number of frames per chunk, see `get_chunks`. Defaults to None.
+
+    Yields:
+        np.ndarray: RGBA array of shape (height, width, 4) for each frame in order
+    """
+    chunks = iter(get_chunks(list(frames), workers, chunksize))
+    with _get_context().Pool(
+        workers, initializer=_init_worker, initargs=(chart,)
+    ) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(_render_chunk, (chunk,)))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            rendered = pending.popleft().get()
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append(pool.apply_async(_render_chunk, (next_chunk,)))
+            yield from rendered
+
+
+def get_changed_box(
+    previous: np.ndarray, current: np.ndarray
+) -> typing.Tuple[int, int, int, int]:
+    """ Get bounding box of pixels that changed between two frames
+
+    Args:
+        previous (np.ndarray): Previous frame of shape (height, width, channels)
+        current (np.ndarray): Current frame of the same shape
+
+    Returns:
+        typing.Tuple[int, int, int, int]: (left, top, right, bottom) of changed pixels, a single pixel if nothing changed
+    """
+    changed = np.any(previous != current, axis=2)
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not rows.size:
+        return 0, 0, 1, 1
+    cols = np.flatnonzero(changed.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+
+def _get_palette_bytes(image: Image.Image) -> bytes:
+    """ Palette of image as a full 256 colour GIF colour table
+    """
+    palette = bytes(image.getpalette()[:768])
+    return palette + bytes(768 - len(palette))
+
+
+class GifWriter:
+    """ Incremental GIF encoder
+
+    Frames are quantised, LZW encoded and written to the file as they are received, so memory use does not depend on the number of frames.
+    Only the region that changed since the previous frame is encoded.
+
+    Example:
+        ``with GifWriter("out.gif", duration=100) as gif: gif.write_frame(rgba)``
+
+    Args:
+        filename (str): File name to write GIF to
+        duration (float): Display time of each frame in milliseconds
+        loop (int, optional): Number of times to loop, 0 loops forever. Defaults to 0.
+        global_palette (bool, optional): Quantise every frame to the palette of the first frame instead of a palette per frame, colours not in the first frame map to their nearest palette colour. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        duration: float,
+        loop: int = 0,
+        global_palette: bool = False,
+    ):
+        self.filename = filename
+        self.duration = duration
+        self.loop = loop
+        self.global_palette = global_palette
+        self._fp = None
+        self._previous = None
+        self._palette = None
+
+    def __enter__(self) -> "GifWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write_header(self, width: int, height: int) -> None:
+        """ Open file and write GIF header, logical screen, global colour table & loop extension
+        """
+        self._fp = open(self.filename, "wb")
+        flags = 0x80 | 0x70 | 0x07 if self._palette is not None else 0
+        self._fp.write(
+            b"GIF89a"
+            + width.to_bytes(2, "little")
+            + height.to_bytes(2, "little")
+            + bytes([flags, 0, 0])
+        )
+        if self._palette is not None:
+            self._fp.write(_get_palette_bytes(self._palette))
+        self._fp.write(
+            b"!\xff\x0bNETSCAPE2.0\x03\x01"
+            + self.loop.to_bytes(2, "little")
+            + b"\x00"
+        )
+
+    def write_frame(self, rgba: np.ndarray) -> None:
+        """ Quantise and append frame to GIF
+
+        Args:
+            rgba (np.ndarray): Frame of shape (height, width, 3 or 4) with dtype uint8, alpha is ignored
+
+        Raises:
+            ValueError: Frame size differs from the first frame
+        """
+        rgb = np.ascontiguousarray(rgba[..., :3])
+        height, width = rgb.shape[:2]
+        if self._previous is None:
+            box = (0, 0, width, height)
+            if self.global_palette:
+                self._palette = Image.fromarray(rgb).convert(
+                    "P", palette=Image.ADAPTIVE
+                )
+            self._write_header(width, height)
+        elif rgb.shape != self._previous.shape:
+            raise ValueError(
+                f"All frames must be the same size, expected {self._previous.shape[:2]} but got {rgb.shape[:2]}"
+            )
+        else:
+            box = get_changed_box(self._previous, rgb)
+        self._previous = rgb
+
+        left, top, right, bottom = box
+        frame = Image.fromarray(rgb[top:bottom, left:right])
+        if self._palette is not None:
+            frame = frame.quantize(palette=self._palette, dither=Image.NONE)
+            flags = 0
+        else:
+            frame = frame.convert("P", palette=Image.ADAPTIVE)
+            flags = 0x80 | 0x07
+
+        delay = int(self.duration / 10)
+        self._fp.write(b"!\xf9\x04\x00" + delay.to_bytes(2, "little") + b"\x00\x00")
+        self._fp.write(
+            b","
+            + left.to_bytes(2, "little")
+            + top.to_bytes(2, "little")
+            + (right - left).to_bytes(2, "little")
+            + (bottom - top).to_bytes(2, "little")
+            + bytes([flags])
+        )
+        if self._palette is None:
+            self._fp.write(_get_palette_bytes(frame))
+        # LZW minimum code size, encoded sub-blocks & block terminator
+        self._fp.write(b"\x08" + frame.tobytes("gif", "P") + b"\x00")
+
+    def close(self) -> None:
+        """ Write GIF trailer and close file
+        """
+        if self._fp is not None:
+            self._fp.write(b";")
+            self._fp.close()
+            self._fp = None
+
+
+class FFMpegPipeWriter:
+    """ Incremental video encoder streaming raw RGBA frames into a persistent ffmpeg process
+
+    ffmpeg is started when the first frame arrives and encodes it while later frames are rendered, frames are written to its stdin straight from the canvas buffer.
+    Frames with an odd width or height are padded by a pixel to even, as required by chroma subsampled pixel formats like "yuv420p".
+
+    Example:
+        ``with FFMpegPipeWriter("out.mp4", fps=10, crf=23) as video: video.write_frame(rgba)``
+
+    Args:
+        filename (str): File name to write video to, ffmpeg chooses the container from its extension
+        fps (float): Frames per second
+        codec (str, optional): ffmpeg video encoder, if None use `rcParams["animation.codec"]`. Defaults to None.
+        crf (int, optional): Constant rate factor, lower is higher quality, if None use the encoder's default. Defaults to None.
+        preset (str, optional): Encoder preset trading speed for compression, eg "ultrafast" or "slow" for h264, if None use the encoder's default. Defaults to None.
+        pix_fmt (str, optional): Pixel format of the encoded video, if None let ffmpeg choose. Defaults to "yuv420p".
+        threads (int, optional): Number of threads ffmpeg encodes with, if None let ffmpeg choose. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        fps: float,
+        codec: str = None,
+        crf: int = None,
+        preset: str = None,
+        pix_fmt: str = "yuv420p",
+        threads: int = None,
+    ):
+        self.filename = filename
+        self.fps = fps
+        self.codec = codec or rcParams["animation.codec"]
+        self.crf = crf
+        self.preset = preset
+        self.pix_fmt = pix_fmt
+        self.threads = threads
+        self._proc = None
+        self._args = None
+        self._shape = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """ Whether the ffmpeg binary in `rcParams["animation.ffmpeg_path"]` can be found
+        """
+        return animation.FFMpegWriter.isAvailable()
+
+    def __enter__(self) -> "FFMpegPipeWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_args(self, width: int, height: int) -> typing.List[str]:
+        """ Command line to start ffmpeg with, reading frames of the given size from stdin
+
+        Args:
+            width (int): Width of each frame in pixels
+            height (int): Height of each frame in pixels
+
+        Returns:
+            typing.List[str]: ffmpeg command line
+        """
+        args = [
+            rcParams["animation.ffmpeg_path"],
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-vcodec",
+            "rawvideo",
+            "-s",
+            f"{width}x{height}",
+            "-pix_fmt",
+            "rgba",
+            "-r",
+            str(self.fps),
+            "-i",
+            "pipe:",
+            "-vcodec",
+            self.codec,
+        ]
+        if self.pix_fmt:
+            args += ["-pix_fmt", self.pix_fmt]
+        if width % 2 or height % 2:
+            args += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+        if self.crf is not None:
+            args += ["-crf", str(self.crf)]
+        if self.preset:
+            args += ["-preset", self.preset]
+        if self.threads is not None:
+            args += ["-threads", str(self.threads)]
+        return args + [self.filename]
+
+    def write_frame(self, rgba: np.ndarray) -> None:
+        """ Append frame to video
+
+        Args:
+            rgba (np.ndarray): Frame of shape (height, width, 4) with dtype uint8
+
+        Raises:
+            ValueError: Frame size differs from the first frame
+            subprocess.CalledProcessError: ffmpeg exited before every frame was written
+        """
+        if self._proc is None:
+            height, width = rgba.shape[:2]
+            self._shape = rgba.shape
+            self._args = self.get_args(width, height)
+            self._proc = subprocess.Popen(
+                self._args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        elif rgba.shape != self._shape:
+            raise ValueError(
+                f"All frames must be the same size, expected {self._shape[:2]} but got {rgba.shape[:2]}"
+            )
+        try:
+            self._proc.stdin.write(np.ascontiguousarray(rgba))
+        except BrokenPipeError:
+            # Raises with ffmpeg's error output
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """ Wait for ffmpeg to encode the remaining frames and finish the file
+
+        Raises:
+            subprocess.CalledProcessError: ffmpeg failed, with its error output as `stderr`
+        """
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        # Only errors are logged, so stderr can't fill its pipe while frames are written
+        stderr = proc.stderr.read()
+        proc.stderr.close()
+        if proc.wait():
+            raise subprocess.CalledProcessError(
+                proc.returncode, self._args, stderr=stderr
+            )
@@ -5,10 +5,13 @@ This module contains functions for chart types.
 """
 
 import datetime
+import functools
+import numbers
 import typing
 from typing import Mapping
 
 import attr
+import matplotlib
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import matplotlib.units as munits
@@ -18,7 +21,8 @@ from matplotlib import colors, ticker, transforms
 from matplotlib.animation import FuncAnimation
 from matplotlib.colors import Colormap
 
-from ._base_chart import _BaseChart
+from ._base_chart import _BaseChart, apply_figure_layout, layout_rc_key
+from ._interpolation import FrameInterpolator, interpolate_values
 
 # For conciseDateFormatter for all plots https://matplotlib.org/3.1.0/gallery/ticks_and_spines/date_concise_formatter.html
 converter = mdates.ConciseDateConverter()
@@ -27,6 +31,56 @@ munits.registry[datetime.date] = converter
 munits.registry[datetime.datetime] = converter
 
 
+@functools.lru_cache(maxsize=256)
+def measure_race_axes_layout(
+    figsize: typing.Tuple[float, float],
+    tick_label_size: typing.Union[int, float, str],
+    orientation: str,
+    title: str,
+    labels: typing.Tuple[str, ...],
+    max_label: str,
+    rc_key: typing.Tuple,
+) -> typing.Tuple[transforms.Bbox, transforms.Bbox]:
+    """ Position of the axes of a bar chart race before and after labelling its ticks with the columns and largest value
+
+    Cached across charts, as the layout only depends on the arguments.
+
+    Args:
+        figsize (typing.Tuple[float, float]): Figure size in inches
+        tick_label_size (typing.Union[int, float, str]): Size of tick labels
+        orientation (str): "h" for horizontal or "v" for vertical bars
+        title (str): Title of the axes
+        labels (typing.Tuple[str, ...]): Column labels for the category ticks
+        max_label (str): Largest value, labelling every value tick
+        rc_key (typing.Tuple): `layout_rc_key()`, so changes to `rcParams` aren't served from the cache
+
+    Returns:
+        typing.Tuple[transforms.Bbox, transforms.Bbox]: Axes position before & after labelling
+    """
+    fig = plt.Figure(figsize=figsize)
+    ax = fig.add_subplot()
+    fake_cols = [chr(i + 70) for i in range(len(labels))]
+
+    if orientation == "h":
+        ax.barh(fake_cols, [1] * len(labels))
+        ax.tick_params(labelrotation=0, axis="y", labelsize=tick_label_size)
+    else:
+        ax.bar(fake_cols, [1] * len(labels))
+        ax.tick_params(labelrotation=30, axis="x", labelsize=tick_label_size)
+    ax.set_title(title)
+    apply_figure_layout(fig)
+    orig_pos = ax.get_position()
+
+    if orientation == "h":
+        ax.set_yticklabels(labels)
+        ax.set_xticklabels([max_label] * len(ax.get_xticks()))
+    else:
+        ax.set_xticklabels(labels, ha="right")
+        ax.set_yticklabels([max_label] * len(ax.get_yticks()))
+    apply_figure_layout(fig)
+    return orig_pos.frozen(), ax.get_position().frozen()
+
+
 @attr.s()
 class BarChartRace(_BaseChart):
     """ BarChart implementation for bar chart races
@@ -46,6 +100,8 @@ class BarChartRace(_BaseChart):
     fixed_order: typing.Union[list, bool] = attr.ib()
 
     perpendicular_bar_func: typing.Callable = attr.ib()
+    reuse_bars: bool = attr.ib()
+    lazy_frames: bool = attr.ib()
 
     def __attrs_post_init__(self):
         """ Properties to be determined after initialization
@@ -71,20 +127,31 @@ class BarChartRace(_BaseChart):
 
         self.validate_params()
 
-        self.df_rank = self.calculate_ranks(self.orig_df)
-
         if self.fixed_order:
 
             n = self.df.shape[1] + 1
             m = self.df.shape[0]
-            rank_row = np.arange(1, n)
+            rank_row = np.arange(1, n, dtype=np.float32)
             if (self.sort == "desc" and self.orientation == "h") or (
                 self.sort == "asc" and self.orientation == "v"
             ):
                 rank_row = rank_row[::-1]
 
-            ranks_arr = np.repeat(rank_row.reshape(1, -1), m, axis=0)
-            self.df_rank = pd.DataFrame(data=ranks_arr, columns=cols)
+            # Constant for every frame, so every frame is a read only view of the same row
+            self._ranks = np.broadcast_to(rank_row, (m, n - 1))
+            visible = (rank_row > 0) & (rank_row < self.n_visible + 1)
+            self.transition_columns = [np.flatnonzero(visible)]
+            self.frame_transition = np.zeros(m, dtype=int)
+        else:
+            self._ranks = self.calculate_ranks(self.orig_df)
+            (
+                self.transition_columns,
+                self.frame_transition,
+            ) = self.calculate_visible_columns(self.orig_df)
+
+        if not self.lazy_frames:
+            # Visible columns are read from one array, a view unless the columns have different dtypes
+            self._frame_values = self.df.values
 
         self.orig_index = self.df.index.astype("str")
 
@@ -92,6 +159,10 @@ class BarChartRace(_BaseChart):
 
         self.ax.tick_params(labelsize=self.tick_label_size)
 
+        # Populated on the first frame when `reuse_bars=True`
+        self._bar_patches: typing.List[matplotlib.patches.Rectangle] = []
+        self._bar_labels: typing.List[matplotlib.text.Text] = []
+
     def validate_params(self):
         """ Validate parameters provided to chart instance
 
@@ -140,28 +211,148 @@ class BarChartRace(_BaseChart):
             y_label = 0.8
         return x_label, y_label
 
-    def calculate_ranks(self, df: pd.DataFrame) -> pd.DataFrame:
-        """ Calculate expanded dataframe to match length of animation
+    def rank_periods(self, df: pd.DataFrame) -> np.ndarray:
+        """ Calculate the rank of every column in each period
+
+        Ranks match `df.rank(axis=1, method="first", ascending=False)` clipped to `n_visible + 1`,
+        ties are ranked in column order and NaN values are left as NaN.
+        Only the top `n_visible` columns are sorted, found with `np.partition`, as every other column is clipped.
+
+        Args:
+            df (pd.DataFrame): Values of each period
 
         Returns:
-            typing.Tuple[pd.DataFrame,pd.DataFrame]: df_values contains interpolated values, df_rank contains interpolated rank
+            np.ndarray: `float32` rank of every column in each period, shape (periods, columns)
         """
+        # Sorting the negated values ranks the largest first and NaN values last
+        keys = -np.asarray(df.values, dtype=float)
+        n_visible = min(self.n_visible, keys.shape[1])
+        ranks = np.full(keys.shape, self.n_visible + 1, dtype=np.float32)
+        ranks[np.isnan(keys)] = np.nan
+        if n_visible:
+            # Every key up to the n_visible-th smallest, including any ties with it
+            kth = np.partition(keys, n_visible - 1, axis=1)[
+                :, n_visible - 1 : n_visible
+            ]
+            candidates = ~(keys > kth) & ~np.isnan(keys)
+            visible_ranks = np.arange(1, n_visible + 1, dtype=np.float32)
+            for period, period_keys in enumerate(keys):
+                columns = np.flatnonzero(candidates[period])
+                # A stable sort keeps ties in column order
+                order = np.argsort(period_keys[columns], kind="stable")[:n_visible]
+                ranks[period, columns[order]] = visible_ranks[: len(order)]
 
-        df_rank = df.rank(axis=1, method="first", ascending=False).clip(
-            upper=self.n_visible + 1
-        )
         if (self.sort == "desc" and self.orientation == "h") or (
             self.sort == "asc" and self.orientation == "v"
         ):
             # This flips all rankings, eg if n_visible = 5 then score 1 in table becomes (6-1 = 5)
-            df_rank = self.n_visible + 1 - df_rank
+            np.subtract(self.n_visible + 1, ranks, out=ranks)
+        return ranks
+
+    def calculate_ranks(
+        self, df: pd.DataFrame
+    ) -> typing.Union[np.ndarray, FrameInterpolator]:
+        """ Calculate the rank of every column in each period and interpolate them to every frame
+
+        Args:
+            df (pd.DataFrame): Values of each period
+
+        Returns:
+            typing.Union[np.ndarray, FrameInterpolator]: `float32` rank of every column in each frame with shape (frames, columns), or a `FrameInterpolator` if `lazy_frames` is set
+        """
+        ranks = self.rank_periods(df)
+        if self.lazy_frames:
+            return self.interpolate_frames(
+                pd.DataFrame(ranks, index=df.index, columns=self.df.columns)
+            )
+        # Interpolated between the same coordinates as the values
+        _, x, xp, easing = self.get_interpolation_coordinates(
+            df, self.steps_per_period, self.interpolate_period, self.interpolate_method
+        )
+        return interpolate_values(x, xp, ranks, easing, dtype=np.float32)
+
+    def calculate_visible_columns(
+        self, df: pd.DataFrame
+    ) -> typing.Tuple[typing.List[np.ndarray], np.ndarray]:
+        """ Find the columns that can be visible in each transition from one period to the next
+
+        Between two periods the rank of a column moves steadily from one to the other, so it can only be visible if it is visible in either period.
+        Missing periods are filled in as they are for the frames, so a column is judged by the ranks it is interpolated between.
+
+        Args:
+            df (pd.DataFrame): Values of each period
 
-        df_rank = self.get_interpolated_df(
-            df_rank, self.steps_per_period, self.interpolate_period
+        Returns:
+            typing.Tuple[typing.List[np.ndarray], np.ndarray]: Positions of the columns that can be visible in each transition, and the transition of every frame
+        """
+        _, x, xp, easing = self.get_interpolation_coordinates(
+            df, self.steps_per_period, self.interpolate_period, self.interpolate_method
         )
-        # new_index = range(df.index.max() + 1)
-        # df_rank = df_rank.reindex(new_index).interpolate()
-        return df_rank
+        ranks = interpolate_values(xp, xp, self.rank_periods(df), easing)
+        # NaN ranks compare False, so they're never visible
+        with np.errstate(invalid="ignore"):
+            visible = (ranks > 0) & (ranks < self.n_visible + 1)
+        visible[:-1] |= visible[1:]
+        transition_columns = [np.flatnonzero(period) for period in visible]
+
+        frame_transition = np.searchsorted(xp, x, side="right") - 1
+        np.clip(frame_transition, 0, len(xp) - 1, out=frame_transition)
+        return transition_columns, frame_transition
+
+    def get_visible_columns(self, i: int) -> np.ndarray:
+        """ Get the positions of the columns that can be visible in a frame
+
+        Args:
+            i (int): index of current frame in animation
+
+        Returns:
+            np.ndarray: Increasing positions of the columns, at least every column visible in this frame
+        """
+        return self.transition_columns[self.frame_transition[i]]
+
+    def get_ranks(self, i: int, columns: np.ndarray = None) -> np.ndarray:
+        """ Get the rank of each column in a frame
+
+        Args:
+            i (int): index of current frame in animation
+            columns (np.ndarray, optional): Positions of the columns. Defaults to None for every column.
+
+        Returns:
+            np.ndarray: `float32` rank of each column, NaN for columns without a value
+        """
+        if isinstance(self._ranks, FrameInterpolator):
+            return self._ranks.get_values(i, columns)[0].astype(np.float32)
+        if columns is None:
+            return self._ranks[i]
+        return self._ranks[i, columns]
+
+    @property
+    def df_rank(self) -> pd.DataFrame:
+        """ Rank of every column in each frame, built from the ranks the chart keeps when read
+
+        Returns:
+            pd.DataFrame: Rank of every column with a row per frame, NaN for columns without a value
+        """
+        if isinstance(self._ranks, FrameInterpolator):
+            return self._ranks.iloc[:]
+        if self.fixed_order:
+            # Every frame shares the same read only row
+            return pd.DataFrame(np.array(self._ranks), columns=self.df.columns)
+        return pd.DataFrame(self._ranks, index=self.df.index, columns=self.df.columns)
+
+    def get_bar_lengths(self, i: int, columns: np.ndarray) -> np.ndarray:
+        """ Get the value of each column in a frame
+
+        Args:
+            i (int): index of current frame in animation
+            columns (np.ndarray): Positions of the columns
+
+        Returns:
+            np.ndarray: Value of each column
+        """
+        if isinstance(self.df, FrameInterpolator):
+            return self.df.get_values(i, columns)[0]
+        return self._frame_values[i, columns]
 
     def create_figure(self) -> typing.Tuple[plt.figure, plt.axes]:
         """ Create Bar chart figure
@@ -176,13 +367,13 @@ class BarChartRace(_BaseChart):
         if self.orientation == "h":
             ax.set_ylim(limit)
             if self.fixed_max:
-                ax.set_xlim(0, self.df.values.max().max() * 1.05 * 1.11)
+                ax.set_xlim(0, self.df.max().max() * 1.05 * 1.11)
             ax.grid(True, axis="x", color="white")
             ax.xaxis.set_major_formatter(ticker.StrMethodFormatter("{x:,.0f}"))
         else:
             ax.set_xlim(limit)
             if self.fixed_max:
-                ax.set_ylim(0, self.df.values.max().max() * 1.05 * 1.11)
+                ax.set_ylim(0, self.df.max().max() * 1.05 * 1.11)
             ax.grid(True, axis="y", color="white")
             ax.set_xticklabels(ax.get_xticklabels(), ha="right", rotation=30)
             ax.yaxis.set_major_formatter(ticker.StrMethodFormatter("{x:,.0f}"))
@@ -204,31 +395,16 @@ class BarChartRace(_BaseChart):
         Returns:
             typing.List[float]: The dimensions [left, bottom, width, height] of the new axes. All quantities are in fractions of figure width and height.
         """
-        import io
-
-        # df_values = self.prepare_data()
-        fig = plt.Figure(figsize=self.figsize)
-        # if self.title:
-        # fig.tight_layout(rect=[0, 0, 1, 0.9])  # To include title
-        ax = fig.add_subplot()
-        fake_cols = [chr(i + 70) for i in range(self.df.shape[1])]
-
         max_val = self.df.max().max()
-        if self.orientation == "h":
-            ax.barh(fake_cols, [1] * self.df.shape[1])
-            self.extracted_from_calculate_new_figsize_15(ax, 0, "y", fig, io)
-            orig_pos = ax.get_position()
-            ax.set_yticklabels(self.df.columns)
-            ax.set_xticklabels([max_val] * len(ax.get_xticks()))
-        else:
-            ax.bar(fake_cols, [1] * self.df.shape[1])
-            self.extracted_from_calculate_new_figsize_15(ax, 30, "x", fig, io)
-            orig_pos = ax.get_position()
-            ax.set_xticklabels(self.df.columns, ha="right")
-            ax.set_yticklabels([max_val] * len(ax.get_yticks()))
-
-        fig.canvas.print_figure(io.BytesIO(), format="png")
-        new_pos = ax.get_position()
+        orig_pos, new_pos = measure_race_axes_layout(
+            tuple(self.figsize),
+            self.tick_label_size,
+            self.orientation,
+            self.title,
+            tuple(str(column) for column in self.df.columns),
+            str(max_val),
+            layout_rc_key(),
+        )
 
         coordx, prev_coordx = new_pos.x0, orig_pos.x0
         coordy, prev_coordy = new_pos.y0, orig_pos.y0
@@ -252,32 +428,28 @@ class BarChartRace(_BaseChart):
         height = orig_pos.y1 - bottom
         return [left, bottom, width, height]
 
-    def extracted_from_calculate_new_figsize_15(self, ax, labelrotation, axis, fig, io):
-        ax.tick_params(
-            labelrotation=labelrotation, axis=axis, labelsize=self.tick_label_size
-        )
-
-        ax.set_title(self.title)
-        fig.canvas.print_figure(io.BytesIO())
-
     def plot_bars(self, i: int) -> None:
         """ Plot bars in bar chart race on axes
 
         Args:
             i (int): index of current frame in animation
         """
-        bar_location = self.df_rank.iloc[i].values
-
-        bar_location[np.isnan(bar_location)] = 0
+        # Only the columns that can be visible in this frame, rather than every column
+        columns = self.get_visible_columns(i)
+        bar_location = self.get_ranks(i, columns)
 
-        top_filt = (bar_location > 0) & (bar_location < self.n_visible + 1)
+        with np.errstate(invalid="ignore"):
+            top_filt = (bar_location > 0) & (bar_location < self.n_visible + 1)
+        columns = columns[top_filt]
         bar_location = bar_location[top_filt]
 
-        bar_length = self.df.iloc[i].values[top_filt]
-        cols = self.df.columns[top_filt]
-        colors = self.bar_colors[top_filt]
+        bar_length = self.get_bar_lengths(i, columns)
+        cols = self.df.columns[columns]
+        colors = self.bar_colors[columns]
 
-        if self.orientation == "h":
+        if self.reuse_bars:
+            self.update_bars(i, columns, bar_location, bar_length, cols)
+        elif self.orientation == "h":
             self.ax.barh(
                 bar_location,
                 bar_length,
@@ -286,8 +458,6 @@ class BarChartRace(_BaseChart):
                 color=colors,
                 # **self.kwargs,
             )
-            if not self.fixed_max:
-                self.ax.set_xlim(self.ax.get_xlim()[0], bar_length.max() * 1.1)
         else:
             self.ax.bar(
                 bar_location,
@@ -297,12 +467,18 @@ class BarChartRace(_BaseChart):
                 color=colors,
                 **self.kwargs,
             )
-            if not self.fixed_max:
+        if not self.fixed_max:
+            if self.orientation == "h":
+                self.ax.set_xlim(self.ax.get_xlim()[0], bar_length.max() * 1.1)
+            else:
                 self.ax.set_ylim(self.ax.get_ylim()[0], bar_length.max() * 1.16)
 
         super().show_period(i)
 
-        if self.label_bars:
+        if self.reuse_bars:
+            if self.label_bars:
+                self.update_bar_labels(columns, bar_location, bar_length)
+        elif self.label_bars:
             for text in self.ax.texts[int(bool(self.period_label)) :]:
                 text.remove()
             if self.orientation == "h":
@@ -340,7 +516,9 @@ class BarChartRace(_BaseChart):
                 val = pd.Series(bar_length).agg(self.perpendicular_bar_func)
             else:
                 values = self.df.iloc[i]
-                ranks = self.df_rank.iloc[i]
+                ranks = pd.Series(
+                    self.get_ranks(i), index=values.index, name=values.name
+                )
                 val = self.perpendicular_bar_func(values, ranks)
 
             if not self.ax.lines:
@@ -355,6 +533,127 @@ class BarChartRace(_BaseChart):
                 else:
                     line.set_ydata([val] * 2)
 
+    def create_bars(self, i: int, columns: np.ndarray) -> None:
+        """ Create one bar per column, to be updated in place by every frame with `reuse_bars`
+
+        Bars outside of `n_visible` are placed on a visible bar so they don't stretch the data limits of the axes, then hidden.
+
+        Args:
+            i (int): index of the first frame in animation
+            columns (np.ndarray): Positions of the columns visible in this frame
+        """
+        visible_location = self.get_ranks(i, columns)
+        fill_location = visible_location[0] if len(columns) else 1
+        bar_location = np.full(self.df.shape[1], fill_location, dtype=np.float32)
+        bar_location[columns] = visible_location
+        bar_length = np.zeros(self.df.shape[1])
+        bar_length[columns] = self.get_bar_lengths(i, columns)
+
+        if self.orientation == "h":
+            bars = self.ax.barh(
+                bar_location, bar_length, ec="white", color=self.bar_colors,
+            )
+            axis = self.ax.yaxis
+        else:
+            bars = self.ax.bar(
+                bar_location,
+                bar_length,
+                ec="white",
+                color=self.bar_colors,
+                **self.kwargs,
+            )
+            axis = self.ax.xaxis
+        self._bar_patches = bars.patches
+        # Every bar starts visible, so the first update hides all but `columns`
+        self._bar_columns = np.arange(len(self._bar_patches))
+
+        # Category tick labels follow the bars by updating the locator & formatter in place
+        self._tick_locator = ticker.FixedLocator([])
+        self._tick_formatter = ticker.FixedFormatter([])
+        axis.set_major_locator(self._tick_locator)
+        axis.set_major_formatter(self._tick_formatter)
+
+    def update_bars(
+        self,
+        i: int,
+        columns: np.ndarray,
+        bar_location: np.ndarray,
+        bar_length: np.ndarray,
+        cols: pd.Index,
+    ) -> None:
+        """ Move the persistent bars and category tick labels to this frame, creating them if needed
+
+        Only the bars visible in this or the previous frame are updated.
+
+        Args:
+            i (int): index of current frame in animation
+            columns (np.ndarray): Increasing positions of the columns visible in this frame
+            bar_location (np.ndarray): Rank of each visible bar
+            bar_length (np.ndarray): Value of each visible bar
+            cols (pd.Index): Column name of each visible bar
+        """
+        # Bars are removed by `clearing` after every save
+        if not self._bar_patches or self._bar_patches[0].axes is None:
+            self.create_bars(i, columns)
+
+        for position in np.setdiff1d(self._bar_columns, columns):
+            self._bar_patches[position].set_visible(False)
+        self._bar_columns = columns
+        for position, location, length in zip(columns, bar_location, bar_length):
+            bar = self._bar_patches[position]
+            bar.set_visible(True)
+            if self.orientation == "h":
+                bar.set_y(location - bar.get_height() / 2)
+                bar.set_width(length)
+            else:
+                bar.set_x(location - bar.get_width() / 2)
+                bar.set_height(length)
+
+        self._tick_locator.locs = np.asarray(bar_location)
+        self._tick_formatter.seq = list(cols)
+        self.ax.stale = True
+
+    def update_bar_labels(
+        self, columns: np.ndarray, bar_location: np.ndarray, bar_length: np.ndarray
+    ) -> None:
+        """ Move the persistent bar labels to the end of each visible bar and update their text, creating them if needed
+
+        Args:
+            columns (np.ndarray): Increasing positions of the columns visible in this frame
+            bar_location (np.ndarray): Rank of each visible bar
+            bar_length (np.ndarray): Value of each visible bar
+        """
+        # Created after the period label, which `show_period` expects to be the first text
+        if not self._bar_labels or self._bar_labels[0].axes is None:
+            if self.orientation == "h":
+                label_kwargs = {"rotation": 0, "ha": "left", "va": "center"}
+            else:
+                label_kwargs = {"rotation": 90, "ha": "center", "va": "bottom"}
+            self._bar_labels = [
+                self.ax.text(0, 0, "", fontsize=self.bar_label_size, **label_kwargs)
+                for _ in self._bar_patches
+            ]
+            self._label_columns = np.arange(len(self._bar_labels))
+
+        if self.orientation == "h":
+            points = np.column_stack([bar_length, bar_location])
+            offset = np.array([0.01, 0])
+        else:
+            points = np.column_stack([bar_location, bar_length])
+            offset = np.array([0, 0.015])
+        positions = self.ax.transLimits.inverted().transform(
+            self.ax.transLimits.transform(points) + offset
+        )
+
+        for position in np.setdiff1d(self._label_columns, columns):
+            self._bar_labels[position].set_visible(False)
+        self._label_columns = columns
+        for position, label_position, length in zip(columns, positions, bar_length):
+            label = self._bar_labels[position]
+            label.set_visible(True)
+            label.set_position(label_position)
+            label.set_text(f"{length:,.0f}")
+
     def anim_func(self, i: int) -> None:
         """ Animation function, removes all bars and updates legend/period annotation.
 
@@ -363,8 +662,9 @@ class BarChartRace(_BaseChart):
         """
         if self.enable_progress_bar:
             self.update_progress_bar()
-        for bar in self.ax.containers:
-            bar.remove()
+        if not self.reuse_bars:
+            for bar in self.ax.containers:
+                bar.remove()
         self.plot_bars(i)
         if self.period_fmt:
             self.show_period(i)
@@ -391,93 +691,160 @@ class ScatterChart(_BaseChart):
 
     size: typing.Union[int, str] = attr.ib()
     add_legend: bool = attr.ib()
+    blit: bool = attr.ib()
+    merge_series: bool = attr.ib()
 
     def __attrs_post_init__(self):
         """ Properties to be determined after initialization
         """
         super().__attrs_post_init__()
         self.colors = self.get_colors(self.cmap)
-        self._points: typing.Dict = {}
-        for name in self.data_cols:
-            self._points[name] = {"x": [], "y": [], "size": []}
+        self.frame_limits = self.calculate_frame_limits()
         if isinstance(self.size, str) and self.size not in self.data_cols:
             raise ValueError(
                 f"Size provided as string: {self.size}, not present in dataframe columns"
             )
 
+        # Offsets & sizes of every frame calculated once, frames pass views of them
+        self._series = [name for name, _ in zip(self.data_cols, self.colors)]
+        x = self.get_index_coordinates()
+        if isinstance(self.size, str):
+            self._sizes = np.abs(self.df[self.size].values)
+        else:
+            self._sizes = np.full(len(x), self.size, dtype=float)
+        if self.merge_series:
+            # Points ordered by frame then series, so the points up to a frame are the
+            # first rows of the offsets, sizes & colours
+            n_series = len(self._series)
+            self._offsets = np.empty((len(x), n_series, 2))
+            self._offsets[:, :, 0] = x[:, None]
+            self._offsets[:, :, 1] = self.df[self._series].values
+            self._offsets = self._offsets.reshape(-1, 2)
+            self._sizes = np.repeat(self._sizes, n_series)
+            self._merged_kwargs = dict(self.kwargs)
+            self._facecolors = self.get_point_colors(len(x), n_series)
+        else:
+            self._offsets = {
+                name: np.column_stack([x, self.df[name].values])
+                for name in self._series
+            }
+        self._points: typing.Dict[str, matplotlib.collections.PathCollection] = {}
+
+    def get_point_colors(self, n_frames: int, n_series: int) -> np.ndarray:
+        """
+        Colour of every point drawn with `merge_series`, ordered by frame then series
+
+        A colour given in kwargs as `c`, `color` or `facecolor(s)` takes the place of the colours of the series. It may be a single colour, one colour per series or one colour per point.
+
+        Args:
+            n_frames (int): Number of frames
+            n_series (int): Number of series
+
+        Raises:
+            ValueError: Number of colours must be 1, the number of series or the number of points
+
+        Returns:
+            np.ndarray: RGBA colours of shape (n_frames * n_series, 4)
+        """
+        point_colors = self.colors[:n_series]
+        for key in ("c", "color", "facecolor", "facecolors"):
+            if key in self._merged_kwargs:
+                point_colors = self._merged_kwargs.pop(key)
+        point_colors = colors.to_rgba_array(point_colors)
+        n_points = n_frames * n_series
+        if len(point_colors) == 1:
+            return np.repeat(point_colors, n_points, axis=0)
+        if len(point_colors) == n_series:
+            return np.tile(point_colors, (n_frames, 1))
+        if len(point_colors) == n_points:
+            return point_colors
+        raise ValueError(
+            f"Expected 1, {n_series} or {n_points} colours for merged series, got {len(point_colors)}"
+        )
+
     def plot_point(self, i: int) -> None:
         """
         Plot points for scatter on chart
 
+        The first frame creates a `PathCollection` for each series, or a single one for all series with `merge_series`, following frames update their offsets & sizes.
 
         Args:
             i (int): Frame to be plotted, will take slice of DataFrame at this index
-
-        Raises:
-            ValueError: Size label must be a column in DataFrame
         """
         if not self.fixed_max:
             super().set_x_y_limits(self.df, i, self.ax)
         # If fixed_max is true then run it once to improve performance
         elif i == 0:
             super().set_x_y_limits(self.df, i, self.ax)
-        j = 0
-        for name, color in zip(self.data_cols, self.colors):
-            self._points[name]["x"] = self.df[name].index[: i + 1]
-            self._points[name]["y"] = self.df[name].iloc[: i + 1]
-            if isinstance(self.size, str) and self.size in self.data_cols:
-                self._points[name]["size"] = abs(self.df[self.size].iloc[: i + 1])
-            else:
-                self._points[name]["size"] = np.full((i + 1), self.size)
+
+        if self.merge_series:
+            n_points = (i + 1) * len(self._series)
             if i == 0:
-                self.sc = self.ax.scatter(
-                    self._points[name]["x"],
-                    self._points[name]["y"],
-                    s=self._points[name]["size"],
-                    color=color,
-                    label=name,
-                    edgecolors="none",
-                    **self.kwargs,
+                # Scattering the index itself sets up the units of the x axis (eg dates)
+                self._points["merged"] = self.ax.scatter(
+                    self.df.index[:1].repeat(len(self._series)),
+                    self._offsets[:n_points, 1],
+                    s=self._sizes[:n_points],
+                    facecolors=self._facecolors[:n_points],
+                    **self._merged_kwargs,
                 )
-                if self.add_legend:
-                    handles, labels = self.ax.get_legend_handles_labels()
-                    legend = self.ax.legend(handles[:], labels[:], fontsize="x-small")
-                    for handle in legend.legendHandles:
-                        handle.set_sizes([15])
             else:
-                # update all points
-                self.ax.collections[j].set_color(color)
-                if isinstance(self.df.index, pd.DatetimeIndex):
-                    # date_array = np.c_[mdates.date2num(self._points[name]["x"]), self._points[name]["y"]]
-                    self.ax.collections[j].set_offsets(
-                        np.c_[
-                            mdates.date2num(self._points[name]["x"]),
-                            self._points[name]["y"],
-                        ]
+                self._points["merged"].set_offsets(self._offsets[:n_points])
+                self._points["merged"].set_sizes(self._sizes[:n_points])
+                self._points["merged"].set_facecolor(self._facecolors[:n_points])
+        else:
+            for name, color in zip(self._series, self.colors):
+                if i == 0:
+                    self._points[name] = self.ax.scatter(
+                        self.df.index[:1],
+                        self._offsets[name][:1, 1],
+                        s=self._sizes[:1],
+                        color=color,
+                        label=name,
+                        **self.kwargs,
                     )
                 else:
-                    self.ax.collections[j].set_offsets(
-                        np.c_[self._points[name]["x"], self._points[name]["y"]]
-                    )
-                self.ax.collections[j].set_sizes(self._points[name]["size"])
-            j += 1
-
-    def anim_func(self, i: int) -> None:
+                    self._points[name].set_offsets(self._offsets[name][: i + 1])
+                    self._points[name].set_sizes(self._sizes[: i + 1])
+
+        if self.add_legend and i == 0:
+            if self.merge_series:
+                handles = [
+                    self.ax.scatter([], [], color=color)
+                    for color in self._facecolors[: len(self._series)]
+                ]
+                labels = self._series
+            else:
+                handles, labels = self.ax.get_legend_handles_labels()
+            legend = self.ax.legend(handles, labels, fontsize="x-small")
+            for handle in legend.legendHandles:
+                handle.set_sizes([15])
+                handle.set_edgecolor("none")
+            if self.merge_series:
+                # Only needed as legend handles, not drawn on the axes
+                for handle in handles:
+                    handle.remove()
+
+    def anim_func(self, i: int) -> typing.List[matplotlib.artist.Artist]:
         """ Animation function, plots all scatter points and updates legend/period annotation.
 
         Args:
             i (int): Index of frame of animation
+
+        Returns:
+            typing.List[matplotlib.artist.Artist]: Artists updated in this frame, for blitting
         """
         if self.enable_progress_bar:
             self.update_progress_bar()
         self.plot_point(i)
         if self.period_fmt:
             self.show_period(i)
+        return self.get_animated_artists()
 
-    def init_func(self) -> None:
+    def init_func(self) -> typing.List[matplotlib.artist.Artist]:
         """ Initialization function for animation
         """
-        self.ax.scatter([], [])
+        return [self.ax.scatter([], [])]
 
 
 @attr.s
@@ -495,15 +862,40 @@ class LineChart(_BaseChart):
     label_events: typing.Dict[str, str] = attr.ib()
     fill_under_line_color: str = attr.ib()
     add_legend: bool = attr.ib()
+    blit: bool = attr.ib()
+    trailing_window: int = attr.ib()
 
     def __attrs_post_init__(self):
         """ Properties to be determined after initialization
         """
         super().__attrs_post_init__()
+        self.validate_params()
         self.line_colors = self.get_colors(self.cmap)
-        self._lines: typing.Dict = {}
-        for name in self.data_cols:
-            self._lines[name] = {"x": [], "y": []}
+        # With fixed_max the axes show every frame, so the limits ignore the window
+        self.frame_limits = self.calculate_frame_limits(
+            None if self.fixed_max else self.trailing_window
+        )
+
+        # Converted to arrays once, so each frame only passes views of them to the lines
+        self._line_x = self.get_index_coordinates()
+        self._line_y = {name: self.df[name].values for name in self.data_cols}
+        self._lines: typing.Dict[str, matplotlib.lines.Line2D] = {}
+        self._fills: typing.Dict[str, typing.Dict] = {}
+
+    def validate_params(self):
+        """ Validate parameters provided to chart instance
+
+        Raises:
+            ValueError: If `trailing_window` is provided and isn't a positive integer
+        """
+        super().validate_params()
+
+        if self.trailing_window is not None and (
+            not isinstance(self.trailing_window, numbers.Integral)
+            or isinstance(self.trailing_window, bool)
+            or self.trailing_window < 1
+        ):
+            raise ValueError("`trailing_window` must be a positive integer")
 
     def plot_line(self, i: int) -> None:
         """ Function for plotting all lines in dataframe
@@ -517,58 +909,30 @@ class LineChart(_BaseChart):
         # If fixed_max is true then run it once to improve performance
         elif i == 0:
             super().set_x_y_limits(self.df, i, self.ax)
-        j = 0
-        # fills = [""]
+        start = 0
+        if self.trailing_window is not None:
+            start = max(0, i + 1 - self.trailing_window)
+        x = self._line_x[start : i + 1]
         for name, color in zip(self.data_cols, self.line_colors):
-            self._lines[name]["x"] = self.df[name].index[: i + 1]
-            self._lines[name]["y"] = self.df[name].iloc[: i + 1]
+            y = self._line_y[name][start : i + 1]
             if i == 0:
-                self.ax.plot(
-                    self._lines[name]["x"],
-                    self._lines[name]["y"],
-                    self.line_width,
+                # Plotting the index itself sets up the units of the x axis (eg dates),
+                # later frames pass the converted values
+                (self._lines[name],) = self.ax.plot(
+                    self.df.index[: i + 1],
+                    y,
+                    linewidth=self.line_width,
                     color=color,
                     label=name,
                     **self.kwargs,
                 )
-                if self.add_legend:
-                    handles, labels = self.ax.get_legend_handles_labels()
-                    self.ax.legend(handles[::2], labels[::2], fontsize="x-small")
-                # if self.fill_under_line_color:
-                #     self.ax.fill_between(
-                #         self._lines[name]["x"],
-                #         self._lines[name]["y"],
-                #         color=self.get_single_color(self.fill_under_line_color),
-                #         alpha=0.5,
-                #     )
-                #     fills = self.ax.collections[-1]
             else:
-                # update all lines
-                self.ax.lines[j].set_color(color)
-                self.ax.lines[j].set_data(
-                    self._lines[name]["x"], self._lines[name]["y"]
-                )
-            j += 1
+                self._lines[name].set_data(x, y)
             if self.fill_under_line_color:
-                # Fills need to be removed and re-generated, or else `matplotlib`
-                # adds a new one per frame, performance degrades and alpha doesn't show properly.
-                if i == 0:
-                    self.ax.fill_between(
-                        self._lines[name]["x"],
-                        self._lines[name]["y"],
-                        color=self.get_single_color(self.fill_under_line_color),
-                        alpha=0.5,
-                    )
-                    self.fills = self.ax.collections[-1]
-                else:
-                    self.fills.remove()
-                    self.ax.fill_between(
-                        self._lines[name]["x"],
-                        self._lines[name]["y"],
-                        color=self.get_single_color(self.fill_under_line_color),
-                        alpha=0.5,
-                    )
-                    self.fills = self.ax.collections[-1]
+                self.update_fill(name, start, i)
+
+        if self.add_legend and i == 0:
+            self.ax.legend(fontsize="x-small")
 
         # Set label_events once, it improves loop performance by x 4.
         if self.label_events and i == 0:
@@ -592,22 +956,73 @@ class LineChart(_BaseChart):
                     fontsize="x-small",
                 )
 
-    def anim_func(self, i: int) -> None:
+    def update_fill(self, name: str, start: int, i: int) -> None:
+        """ Update the fill under a line to cover frames `start` to `i`
+
+        Each line has a single `PolyCollection` and a vertex array of its valid points, allocated on the first frame.
+        Every frame writes the bottom corners and the point closing the edge into the three rows after the last visible point, restores the rows the previous frame wrote over, and passes a view of the visible rows to the collection.
+        Missing values are skipped rather than splitting the fill.
+
+        Args:
+            name (str): Column of the line
+            start (int): First frame visible
+            i (int): Index of frame for animation
+        """
+        x = self._line_x
+        y = self._line_y[name]
+        if i == 0:
+            positions = np.flatnonzero(~np.isnan(y))
+            verts = np.empty((len(positions) + 3, 2))
+            verts[: len(positions), 0] = x[positions]
+            verts[: len(positions), 1] = y[positions]
+            self._fills[name] = {"positions": positions, "verts": verts, "end": None}
+            self._fills[name]["collection"] = self.ax.add_collection(
+                matplotlib.collections.PolyCollection(
+                    [],
+                    closed=False,
+                    color=self.get_single_color(self.fill_under_line_color),
+                    alpha=0.5,
+                ),
+                autolim=False,
+            )
+        fill = self._fills[name]
+        positions, verts = fill["positions"], fill["verts"]
+        if fill["end"] is not None:
+            restore = positions[fill["end"] : fill["end"] + 3]
+            verts[fill["end"] : fill["end"] + len(restore), 0] = x[restore]
+            verts[fill["end"] : fill["end"] + len(restore), 1] = y[restore]
+
+        first, end = np.searchsorted(positions, [start, i + 1])
+        if first == end:
+            fill["end"] = None
+            fill["collection"].set_verts([])
+            return
+        verts[end] = verts[end - 1, 0], 0
+        verts[end + 1] = verts[first, 0], 0
+        verts[end + 2] = verts[first]
+        fill["end"] = end
+        fill["collection"].set_verts([verts[first : end + 3]], closed=False)
+
+    def anim_func(self, i: int) -> typing.List[matplotlib.artist.Artist]:
         """ Animation function, updates all lines and legend/period annotation.
 
         Args:
             i (int): Index of frame of animation
+
+        Returns:
+            typing.List[matplotlib.artist.Artist]: Artists updated in this frame, for blitting
         """
         if self.enable_progress_bar:
             self.update_progress_bar()
         self.plot_line(i)
         if self.period_fmt:
             self.show_period(i)
+        return self.get_animated_artists()
 
-    def init_func(self) -> None:
+    def init_func(self) -> typing.List[matplotlib.artist.Artist]:
         """ Initialization function for animation
         """
-        self.ax.plot([], [])
+        return self.ax.plot([], [])
 
 
 @attr.s
@@ -621,6 +1036,8 @@ class PieChart(_BaseChart):
         PieChart: Animated Pie Chart class for use with multiple plots or save
     """
 
+    lazy_frames: bool = attr.ib()
+
     def __attrs_post_init__(self):
         """ Properties to be determined after initialization
         """
@@ -629,57 +1046,165 @@ class PieChart(_BaseChart):
 
         self.wedge_colors = dict(zip(self.data_cols, self.wedge_colors))
 
-        self._wedges: typing.Dict = {}
-        for name in self.data_cols:
-            self._wedges[name] = {"size": []}
+        # Layout arguments of `ax.pie`, with its defaults, used to move the wedges & labels each frame
+        self.pie_layout = {
+            "startangle": 0,
+            "counterclock": True,
+            "radius": 1,
+            "center": (0, 0),
+            "explode": None,
+            "labeldistance": 1.1,
+            "rotatelabels": False,
+            "autopct": None,
+            "pctdistance": 0.6,
+            "normalize": True,
+        }
+        self.pie_layout.update(
+            (key, value) for key, value in self.kwargs.items() if key in self.pie_layout
+        )
 
-    def plot_wedge(self, i: int) -> None:
-        """ Function for plotting all lines in dataframe
+        if not self.lazy_frames:
+            self._wedge_values = self.df[self.data_cols].values
+            self._wedge_angles = self.calculate_wedge_angles(self._wedge_values)
+        self._wedges: typing.List[matplotlib.patches.Wedge] = []
+        self._shadows: typing.List[matplotlib.patches.Shadow] = []
+        self._pie_artists: typing.List[matplotlib.artist.Artist] = []
 
-        Args:
-            i (int): Index of frame for animation
-        """
+    def calculate_wedge_angles(self, values: np.ndarray) -> typing.Dict[str, np.ndarray]:
+        """ Calculate the angles of every wedge in every frame, as `ax.pie` would for each frame
 
-        for text in self.ax.texts[int(bool(self.period_fmt)) :]:
-            text.remove()
+        Missing values are treated as empty wedges.
 
-        # super().set_x_y_limits(self.df, i)
-        # print(self.df[self.data_cols].notnull())
-        filt_nan = self.df[self.data_cols].iloc[i].notnull()
+        Args:
+            values (np.ndarray): Size of each wedge, shape (frames, columns)
 
-        # print(self.df[self.data_cols].iloc[i][filt_nan])
+        Raises:
+            ValueError: If any value is negative
 
-        wedges = self.df[self.data_cols].iloc[i][filt_nan]
+        Returns:
+            typing.Dict[str, np.ndarray]: `fracs` of the pie, `theta1` & `theta2` in degrees and the middle `thetam` in radians of each wedge, each with shape (frames, columns)
+        """
+        sizes = np.nan_to_num(np.asarray(values, dtype=np.float32))
+        if np.any(sizes < 0):
+            raise ValueError("Wedge sizes 'x' must be non negative values")
+        fracs = sizes
+        if self.pie_layout["normalize"]:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                fracs = sizes / sizes.sum(axis=1, keepdims=True)
+            # Frames without any values have no wedges to show
+            fracs = np.nan_to_num(fracs)
+
+        # Each wedge starts where the previous one ended
+        steps = fracs if self.pie_layout["counterclock"] else -fracs
+        bounds = np.cumsum(
+            np.hstack(
+                [np.full((len(fracs), 1), self.pie_layout["startangle"] / 360), steps]
+            ),
+            axis=1,
+        )
+        start, end = bounds[:, :-1], bounds[:, 1:]
+        return {
+            "fracs": fracs,
+            "theta1": 360 * np.minimum(start, end),
+            "theta2": 360 * np.maximum(start, end),
+            "thetam": np.pi * (start + end),
+        }
 
-        wedge_color_list = []
-        for label in wedges.index:
-            wedge_color_list.append(self.wedge_colors[label])
+    def plot_wedge(self, i: int) -> None:
+        """ Function for plotting all wedges in dataframe
 
-        self.ax.pie(
-            wedges.values, labels=wedges.index, colors=wedge_color_list, **self.kwargs
-        )
+        The first frame creates a wedge & label for every column with `ax.pie`, following frames update their angles & positions.
+        Wedges of missing values are hidden, along with their shadows.
 
-        # for name, color in zip(self.data_cols, self.wedge_colors):
+        Args:
+            i (int): Index of frame for animation
+        """
+        if i == 0:
+            for artist in self._pie_artists:
+                # Artists of a previous save, unless already cleared from the axes
+                if artist.axes is not None:
+                    artist.remove()
+            n_patches, n_texts = len(self.ax.patches), len(self.ax.texts)
+            pie = self.ax.pie(
+                np.ones(len(self.data_cols)),
+                labels=self.data_cols,
+                colors=[self.wedge_colors[label] for label in self.data_cols],
+                **self.kwargs,
+            )
+            self._wedges = pie[0]
+            self._labels = pie[1]
+            self._autotexts = pie[2] if len(pie) > 2 else []
+            self._pie_artists = [
+                *self.ax.patches[n_patches:],
+                *self.ax.texts[n_texts:],
+            ]
+            # With `shadow=True` each wedge has a shadow drawing the path of its wedge
+            self._shadows = [
+                patch
+                for patch in self._pie_artists
+                if isinstance(patch, matplotlib.patches.Shadow)
+            ]
+
+        if self.lazy_frames:
+            values = self.df.get_values(i)
+            angles = self.calculate_wedge_angles(values)
+            values, angles = values[0], {key: row[0] for key, row in angles.items()}
+        else:
+            values = self._wedge_values[i]
+            angles = {key: row[i] for key, row in self._wedge_angles.items()}
+        visible = ~np.isnan(values)
+
+        layout = self.pie_layout
+        center_x = np.full(len(values), float(layout["center"][0]))
+        center_y = np.full(len(values), float(layout["center"][1]))
+        if layout["explode"] is not None:
+            center_x += np.multiply(layout["explode"], np.cos(angles["thetam"]))
+            center_y += np.multiply(layout["explode"], np.sin(angles["thetam"]))
+        cos, sin = np.cos(angles["thetam"]), np.sin(angles["thetam"])
+
+        for j, wedge in enumerate(self._wedges):
+            wedge.set_visible(visible[j])
+            wedge.set_center((center_x[j], center_y[j]))
+            wedge.set_theta1(angles["theta1"][j])
+            wedge.set_theta2(angles["theta2"][j])
+        for shadow in self._shadows:
+            shadow.set_visible(shadow.patch.get_visible())
+
+        if layout["labeldistance"] is not None:
+            distance = layout["labeldistance"] * layout["radius"]
+            label_x = center_x + distance * cos
+            label_y = center_y + distance * sin
+            for j, label in enumerate(self._labels):
+                label.set_visible(visible[j])
+                label.set_position((label_x[j], label_y[j]))
+                label.set_horizontalalignment("left" if label_x[j] > 0 else "right")
+                if layout["rotatelabels"]:
+                    label.set_verticalalignment("bottom" if label_y[j] > 0 else "top")
+                    label.set_rotation(
+                        np.rad2deg(angles["thetam"][j]) + (0 if label_x[j] > 0 else 180)
+                    )
 
-        #     self._wedges[name]["size"].append(self.df[name].index[i])
-        #     # self._lines[name]["y"].append(self.df[name].iloc[i])
-        #     self.ax.pie(
-        #         self._wedges[name]["size"],
-        #         label=name,
-        #         color=color,
-        #         **self.kwargs,
-        #     )
+        if self._autotexts:
+            distance = layout["pctdistance"] * layout["radius"]
+            pct_x = center_x + distance * cos
+            pct_y = center_y + distance * sin
+            for j, autotext in enumerate(self._autotexts):
+                pct = 100.0 * angles["fracs"][j]
+                autotext.set_visible(visible[j])
+                autotext.set_position((pct_x[j], pct_y[j]))
+                if isinstance(layout["autopct"], str):
+                    autotext.set_text(layout["autopct"] % pct)
+                else:
+                    autotext.set_text(layout["autopct"](pct))
 
     def anim_func(self, i: int) -> None:
-        """ Animation function, removes all wedges and updates legend/period annotation.
+        """ Animation function, updates all wedges and legend/period annotation.
 
         Args:
             i (int): Index of frame of animation
         """
         if self.enable_progress_bar:
             self.update_progress_bar()
-        for wedge in self.ax.patches:
-            wedge.remove()
         self.plot_wedge(i)
         if self.period_fmt:
             self.show_period(i)
@@ -708,12 +1233,16 @@ class BarChart(_BaseChart):
         super().__attrs_post_init__()
         self.bar_colors = self.get_colors(self.cmap)
 
-        self._bars: typing.Dict = {}
-        for name in self.data_cols:
-            self._bars[name] = {"x": [], "y": []}
+        self.frame_limits = self.calculate_frame_limits()
+        self._bars: typing.Dict[str, matplotlib.container.BarContainer] = {}
+        # Number of frames with their bars shown
+        self._n_bars = 0
 
     def plot_bars(self, i: int) -> None:
-        """ Function for plotting all lines in dataframe
+        """ Function for plotting the bars of every frame up to `i` for all columns in dataframe
+
+        The first frame creates one bar per frame for every column, hidden until their frame is reached.
+        Every frame then only shows or hides the bars between the previous frame and this one, so frames can be drawn in any order.
 
         Args:
             i (int): Index of frame for animation
@@ -721,37 +1250,49 @@ class BarChart(_BaseChart):
         if not self.fixed_max:
             super().set_x_y_limits(self.df, i, self.ax)
             self.ax.set_ylim(
-                self.df.iloc[: i + 1].values.min(),
-                self.df.iloc[: i + 1].values.max() + 1e-6,
+                self.frame_limits["values_min"][i],
+                self.frame_limits["values_max"][i] + 1e-6,
             )
         # If fixed_max is true then run it once to improve performance
         elif i == 0:
             super().set_x_y_limits(self.df, i, self.ax)
             # bars are flat at the bottom/top, so no need to apply a tolerance like
             # with line/scatter charts.
-            self.ax.set_ylim(self.df.values.min(), self.df.values.max())
-
-        for name, color in zip(self.data_cols, self.bar_colors):
-            self._bars[name]["x"].append(self.df[name].index[i])
-            self._bars[name]["y"].append(self.df[name].iloc[i])
-            self.ax.bar(
-                self._bars[name]["x"],
-                self._bars[name]["y"],
-                # self.line_width,
-                color=color,
-                **self.kwargs,
+            self.ax.set_ylim(
+                self.frame_limits["values_min"][-1], self.frame_limits["values_max"][-1]
             )
 
+        if i == 0:
+            for container in self._bars.values():
+                # Bars of a previous save, unless already cleared from the axes
+                if container in self.ax.containers:
+                    container.remove()
+            for name, color in zip(self.data_cols, self.bar_colors):
+                self._bars[name] = self.ax.bar(
+                    self.df.index, self.df[name].values, color=color, **self.kwargs,
+                )
+                for bar in self._bars[name]:
+                    bar.set_visible(False)
+            self._n_bars = 0
+
+        n_bars = i + 1
+        for container in self._bars.values():
+            if n_bars > self._n_bars:
+                for bar in container[self._n_bars : n_bars]:
+                    bar.set_visible(True)
+            else:
+                for bar in container[n_bars : self._n_bars]:
+                    bar.set_visible(False)
+        self._n_bars = n_bars
+
     def anim_func(self, i: int) -> None:
-        """ Animation function, removes all bars and updates legend/period annotation.
+        """ Animation function, shows the bars of this frame and updates legend/period annotation.
 
         Args:
             i (int): Index of frame of animation
         """
         if self.enable_progress_bar:
             self.update_progress_bar()
-        for bar in self.ax.containers:
-            bar.remove()
         self.plot_bars(i)
         if self.period_fmt:
             self.show_period(i)
@@ -841,6 +1382,20 @@ class BubbleChart(_BaseChart):
             self.ax.set_xlim(BBox[0], BBox[1])
             self.ax.set_ylim(BBox[2], BBox[3])
 
+        # Values of every point in every frame, each frame passes views of one row
+        self._offsets = np.stack(
+            [
+                self.get_point_values(self.mapping["x"]),
+                self.get_point_values(self.mapping["y"]),
+            ],
+            axis=-1,
+        )
+        if "size" in self.mapping:
+            self._sizes = self.get_point_values(self.mapping["size"])
+        if self.color_bar:
+            self._colors = self.get_point_values(self.mapping["color"])
+        self.sc = None
+
         # TODO Add geopandas for map plots
         # self.ax = self.show_image(
         #     self.ax,
@@ -850,52 +1405,72 @@ class BubbleChart(_BaseChart):
         #     aspect="equal",
         # )
 
+    def get_point_values(self, column_key: str) -> np.ndarray:
+        """ Values of a level 0 column label for every point in every frame
+
+        Args:
+            column_key (str): Label in level 0 of the columns, or a column of a DataFrame without a MultiIndex for a single point
+
+        Returns:
+            np.ndarray: Values with shape (frames, points)
+        """
+        return self.df[column_key].values.reshape(len(self.df), -1)
+
     def plot_point(self, i: int) -> None:
         """
         Plot points from MultiIndexed DataFrame
 
-        Optionally size & colour can be provided and if so, the string provided must be present in the level 0 column labels
+        Optionally size & colour can be provided and if so, the string provided must be present in the level 0 column labels.
+        The first frame creates the scatter collection, following frames update its offsets, sizes & colours.
 
         Args:
             i (int): Frame to plot, will slice DataFrame at this index
         """
-        for output_key, column_key in self.mapping.items():
-            self._points[output_key] = self.df[column_key].iloc[i]
-
-        self.sc = self.ax.scatter(
-            x=self._points["x"],
-            y=self._points["y"],
-            s=self._points["size"]
-            if isinstance(self.size_data_label, str)
-            else self.size_data_label,
-            c=self._points["color"] if self.color_bar else self.color_data_label,
-            cmap=self.cmap,
-            alpha=0.8,
-            **self.kwargs,
-        )
-        # setting up colorbar when color is a pd column and doesn't exist
-        # already from a previous animation run with the same custom figure.
-        if i == 0 and self.color_bar:
-            self.cbar = self.fig.colorbar(self.sc)
-            # this sets colorbar scales & settings to remain constant for all frames
-            self.cbar.ax.tick_params(labelsize="small")
-            self.cbar.set_label(
-                label="Size & Colour = " + self.color_data_label, fontsize="x-small"
+        if i == 0:
+            # Collection of a previous save, unless already cleared from the axes
+            if self.sc is not None and self.sc.axes is not None:
+                self.sc.remove()
+            self.sc = self.ax.scatter(
+                x=self._offsets[i, :, 0],
+                y=self._offsets[i, :, 1],
+                s=self._sizes[i]
+                if isinstance(self.size_data_label, str)
+                else self.size_data_label,
+                c=self._colors[i] if self.color_bar else self.color_data_label,
+                cmap=self.cmap,
+                alpha=0.8,
+                **self.kwargs,
             )
+            # setting up colorbar when color is a pd column
+            if self.color_bar:
+                self.cbar = self.fig.colorbar(self.sc)
+                # this sets colorbar scales & settings to remain constant for all frames
+                self.cbar.ax.tick_params(labelsize="small")
+                self.cbar.set_label(
+                    label="Size & Colour = " + self.color_data_label, fontsize="x-small"
+                )
+                # the limits stay set on the collection as its values are updated
+                self.sc.set_clim(self.vmin, self.vmax)
+            return
+
+        self.sc.set_offsets(self._offsets[i])
+        if not self.fixed_max:
+            # Grow the limits to include this frame, as scattering a new collection would
+            self.ax.update_datalim(self._offsets[i])
+            self.ax.autoscale_view()
+        if isinstance(self.size_data_label, str):
+            self.sc.set_sizes(self._sizes[i])
         if self.color_bar:
-            # this is required for all iterations to update colour on bubbles
-            self.sc.set_clim(self.vmin, self.vmax)
+            self.sc.set_array(self._colors[i])
 
     def anim_func(self, i: int) -> None:
-        """ Animation function, removes bubbles and updates legend/period annotation.
+        """ Animation function, updates bubbles and legend/period annotation.
 
         Args:
             i (int): Index of frame of animation
         """
         if self.enable_progress_bar:
             self.update_progress_bar()
-        for path in self.ax.collections:
-            path.remove()
         self.plot_point(i)
         if self.period_fmt:
             self.show_period(i)
@@ -2,6 +2,9 @@
 """
 
 import datetime
+import hashlib
+import json
+import os
 import typing
 from typing import Mapping
 
@@ -15,9 +18,31 @@ import pandas as pd
 
 from matplotlib import colors, ticker, transforms
 from matplotlib.animation import FuncAnimation
+from matplotlib.cm import ScalarMappable
+from matplotlib.collections import PathCollection
 from matplotlib.colors import Colormap
 
 from ._base_chart import _BaseChart
+from ._interpolation import interpolate_values
+
+# Keyword arguments `GeoDataFrame.plot` handles itself rather than passing on to
+# `Axes.scatter`, maps of points given any of these are drawn by geopandas
+GEOPANDAS_PLOT_KWARGS = {
+    "autolim",
+    "axes",
+    "cax",
+    "categorical",
+    "categories",
+    "classification_kwds",
+    "color",
+    "colormap",
+    "column",
+    "figsize",
+    "k",
+    "markersize",
+    "missing_kwds",
+    "scheme",
+}
 
 
 @attr.s
@@ -33,13 +58,16 @@ class MapChart(_BaseChart):
     """
 
     basemap_format: typing.Dict = attr.ib()
+    basemap_cache_dir: str = attr.ib()
     enable_markersize: bool = attr.ib()
     scale_markersize: float = attr.ib()
+    simplify_tolerance: float = attr.ib()
 
     def __attrs_post_init__(self):
         """ Properties to be determined after initialization
         """
-        self.df = self.df.copy()
+        # A shallow copy shares the values with the input, only its columns are replaced below
+        self.df = self.df.copy(deep=self.copy)
         try:
             import descartes
         except:
@@ -47,20 +75,21 @@ class MapChart(_BaseChart):
                 "Ensure to install `descartes` if using geopandas with pandas_alive"
             )
 
-        from shapely.geometry import Point
-
-        for shape in self.df.geometry:
-            if type(shape) == Point:
-                self.enable_markersize = True
-                break
+        geom_types = self.df.geom_type
+        # Points are sized by their values, unless given a fixed `markersize`
+        if (geom_types == "Point").any() and "markersize" not in self.kwargs:
+            self.enable_markersize = True
 
         if self.df.crs != "EPSG:3857" and self.basemap_format:
             self.df = self.df.to_crs(3857)
 
+        integer_periods = all(
+            dtype.kind in "iu" for dtype in self.df.dtypes.drop("geometry")
+        )
         # Convert all columns except geometry to datetime
         try:
             self.df = self.convert_data_cols_to_datetime(self.df)
-            self.df = self.get_interpolated_geo_df(self.df)
+            self._frame_index, self._frame_values = self.get_frame_values(self.df)
         except:
             import warnings
 
@@ -68,11 +97,20 @@ class MapChart(_BaseChart):
                 "Pandas_Alive failed to convert columns to datetime, setting interpolate_period to False and retrying..."
             )
             self.interpolate_period = False
-            self.df = self.get_interpolated_geo_df(self.df)
-
-        temp_gdf = self.df.copy()
-        self.df = pd.DataFrame(self.df)
-        self.df = self.df.drop("geometry", axis=1)
+            self._frame_index, self._frame_values = self.get_frame_values(self.df)
+
+        # Only the geometry is kept, the values of every frame are in `_frame_values`
+        geometry_gdf = self.df[["geometry"]]
+        # The figure is laid out like other charts from the frames and values of each geometry
+        self.df = pd.DataFrame(
+            self._frame_values.T,
+            index=geometry_gdf.index,
+            columns=self._frame_index,
+            copy=False,
+        )
+        if self.steps_per_period == 1 and integer_periods:
+            # Integer periods are kept as integers without frames between them
+            self.df = self.df.astype(int)
 
         # if self.fig is None:
         #     self.fig, self.ax = self.create_figure()
@@ -93,7 +131,33 @@ class MapChart(_BaseChart):
         if self.enable_progress_bar:
             self.setup_progress_bar()
 
-        self.df = temp_gdf
+        self.df = geometry_gdf
+
+        self._frame_colors, self._frame_limits = self.get_frame_colors(
+            self._frame_values
+        )
+        # Maps of only points are drawn as a single scatter of these coordinates, see `create_scatter`
+        self._point_coordinates = None
+        if (geom_types == "Point").all() and not GEOPANDAS_PLOT_KWARGS.intersection(
+            self.kwargs
+        ):
+            self._point_coordinates = np.column_stack(
+                [self.df.geometry.x, self.df.geometry.y]
+            )
+        # Collections drawn on the map, with the row of the geometry of each element
+        self._collections = []
+        # Collections of the geometries without a value drawn with `missing_kwds`, and
+        # which rows they are, see `plot_missing_geometry`
+        self._missing_collections = []
+        self._missing_rows = None
+        # Simplified geometry by extent and tolerance, see `get_map_geometry`
+        self._map_geometry = {}
+        self._basemap = None
+        self._basemap_attribution = None
+        # Extent the basemap was last added for and how it was drawn
+        self._basemap_extent = None
+        self._basemap_drawing = None
+        self._colorbar = None
 
     def get_data_cols(self, gdf: geopandas.GeoDataFrame) -> typing.List:
         """
@@ -111,7 +175,7 @@ class MapChart(_BaseChart):
         self, gdf: geopandas.GeoDataFrame
     ) -> geopandas.GeoDataFrame:
         """
-        Convert all data columns to datetime with `pd.to_datetime`
+        Convert all data columns to datetime with a single call to `pd.to_datetime`
 
         Args:
             gdf (geopandas.GeoDataFrame): Input GeoDataFrame
@@ -119,86 +183,486 @@ class MapChart(_BaseChart):
         Returns:
             geopandas.GeoDataFrame: GeoDataFrame with data columns converted to `Timestamp`
         """
-        converted_column_names = []
-        for col in gdf.columns:
-            if col != "geometry":
-                col = pd.to_datetime(col)
-
-            converted_column_names.append(col)
-        gdf.columns = converted_column_names
+        is_data = gdf.columns != "geometry"
+        columns = gdf.columns.to_numpy(dtype=object, copy=True)
+        columns[is_data] = pd.to_datetime(gdf.columns[is_data])
+        gdf.columns = columns
         return gdf
 
-    def get_interpolated_geo_df(
+    def get_frame_values(
         self, gdf: geopandas.GeoDataFrame
-    ) -> geopandas.GeoDataFrame:
+    ) -> typing.Tuple[pd.Index, np.ndarray]:
         """
-        Interpolates GeoDataFrame by splitting data from geometry, interpolating and joining back together
+        Interpolate the values of every geometry from the data columns (periods) into frames
+
+        The data columns are interpolated as the rows of a transposed view of their values, so the frames are built in a single array without transposing a DataFrame.
 
         Args:
-            gdf (geopandas.GeoDataFrame): Input GeoDataFrame
+            gdf (geopandas.GeoDataFrame): Input GeoDataFrame with a data column per period
 
         Returns:
-            geopandas.GeoDataFrame: Interpolated GeoDataFrame
+            typing.Tuple[pd.Index, np.ndarray]: Index of the frames and values with shape (frames, geometries)
         """
+        data_cols = self.get_data_cols(gdf)
+        periods = pd.DataFrame(index=pd.Index(data_cols))
+        new_index, x, xp, easing = self.get_interpolation_coordinates(
+            periods,
+            self.steps_per_period,
+            self.interpolate_period,
+            self.interpolate_method,
+        )
+        values = gdf[data_cols].to_numpy(dtype=float)
+        return new_index, interpolate_values(x, xp, values.T, easing)
+
+    def get_color_limits(self, frame_values: np.ndarray) -> np.ndarray:
+        """ Colour limits of every frame, `vmin` & `vmax` if given otherwise the smallest and largest value of the frame like `GeoDataFrame.plot`
 
-        # Separate data from geometry
-        temp_df = pd.DataFrame(gdf)
-        temp_df = temp_df.drop("geometry", axis=1)
-        temp_df = temp_df.T
-        geometry_column = gdf.geometry
+        Args:
+            frame_values (np.ndarray): Values with shape (frames, geometries)
 
-        # Interpolate data
-        interpolated_df = super().get_interpolated_df(
-            temp_df, self.steps_per_period, self.interpolate_period
+        Returns:
+            np.ndarray: Limits with shape (frames, 2)
+        """
+        limits = np.empty((len(frame_values), 2))
+        vmin = self.kwargs.get("vmin")
+        vmax = self.kwargs.get("vmax")
+        # Missing values are skipped, frames without values have NaN limits
+        limits[:, 0] = np.fmin.reduce(frame_values, axis=1) if vmin is None else vmin
+        limits[:, 1] = np.fmax.reduce(frame_values, axis=1) if vmax is None else vmax
+        return limits
+
+    def get_frame_colors(
+        self, frame_values: np.ndarray
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """ Values the geometries are coloured by and the colour limits of every frame
+
+        Like `GeoDataFrame.plot`, with `scheme` each value is replaced by its bin from `mapclassify` and with `categorical` or `categories` by the code of its category, both found again for every frame. Otherwise the values are used as they are, with the limits from `get_color_limits`.
+
+        Args:
+            frame_values (np.ndarray): Values with shape (frames, geometries)
+
+        Raises:
+            ValueError: If a value isn't one of `categories`
+
+        Returns:
+            typing.Tuple[np.ndarray, np.ndarray]: Colour values with shape (frames, geometries) and limits with shape (frames, 2)
+        """
+        scheme = self.kwargs.get("scheme")
+        categories = self.kwargs.get("categories")
+        if scheme is None and not categories and not self.kwargs.get("categorical"):
+            return frame_values, self.get_color_limits(frame_values)
+
+        if scheme is not None:
+            import mapclassify
+
+            classification_kwds = dict(self.kwargs.get("classification_kwds") or {})
+            classification_kwds.setdefault("k", self.kwargs.get("k", 5))
+
+        frame_colors = np.full_like(frame_values, np.nan)
+        # Frames without values have no categories and NaN limits
+        n_categories = np.zeros(len(frame_values))
+        for i, values in enumerate(frame_values):
+            has_value = ~np.isnan(values)
+            if not has_value.any():
+                continue
+            if scheme is not None:
+                binning = mapclassify.classify(
+                    values[has_value], scheme, **classification_kwds
+                )
+                codes, n_categories[i] = binning.yb, len(binning.bins)
+            else:
+                categorical = pd.Categorical(values[has_value], categories=categories)
+                if (categorical.codes == -1).any():
+                    raise ValueError(
+                        "Values not listed in categories: {}".format(
+                            sorted(set(values[has_value][categorical.codes == -1]))
+                        )
+                    )
+                codes, n_categories[i] = categorical.codes, len(categorical.categories)
+            frame_colors[i, has_value] = codes
+
+        limits = np.full((len(frame_values), 2), np.nan)
+        has_categories = n_categories > 0
+        vmin = self.kwargs.get("vmin")
+        vmax = self.kwargs.get("vmax")
+        limits[has_categories, 0] = 0 if vmin is None else vmin
+        limits[has_categories, 1] = (
+            n_categories[has_categories] - 1 if vmax is None else vmax
         )
+        return frame_colors, limits
 
-        # Rejoin data with geometry
-        interpolated_df = interpolated_df.T
-        interpolated_df["geometry"] = geometry_column
+    def get_collection_rows(
+        self, geometry: geopandas.GeoSeries
+    ) -> typing.List[np.ndarray]:
+        """
+        Row of the geometry of each element of the collections `GeoDataFrame.plot` draws
 
-        return geopandas.GeoDataFrame(interpolated_df)
+        Geopandas draws a collection of the polygons, one of the lines and one of the points, in that order and only if there are any. Geometry collections are split into their geometries and multi-part geometries into one element per part, while missing or empty geometries aren't drawn.
 
-    def plot_geo_data(self, i: int, gdf: geopandas.GeoDataFrame) -> None:
+        Args:
+            geometry (geopandas.GeoSeries): Geometry that is drawn
+
+        Returns:
+            typing.List[np.ndarray]: Rows of the elements of each collection drawn
+        """
+        # Collection each type of geometry is drawn in
+        collection_types = {
+            "Polygon": "Polygon",
+            "LineString": "LineString",
+            "LinearRing": "LineString",
+            "Point": "Point",
+        }
+        collection_rows = {"Polygon": [], "LineString": [], "Point": []}
+        for row, geom in enumerate(geometry):
+            if geom is None or geom.is_empty:
+                continue
+            parts = geom.geoms if geom.geom_type == "GeometryCollection" else [geom]
+            for part in parts:
+                collection_type = collection_types.get(
+                    part.geom_type.replace("Multi", "")
+                )
+                if collection_type is None or part.is_empty:
+                    continue
+                n_elements = (
+                    len(part.geoms) if part.geom_type.startswith("Multi") else 1
+                )
+                collection_rows[collection_type].extend([row] * n_elements)
+        return [np.array(rows, dtype=int) for rows in collection_rows.values() if rows]
+
+    def create_collections(self, gdf: geopandas.GeoDataFrame) -> None:
         """
-        Plot GeoDataFrame using the plot accessor from Geopandas
+        Draw every geometry once using the plot accessor from Geopandas, coloured by frame with `plot_geo_data`
 
         https://geopandas.org/reference.html#geopandas.GeoDataFrame.plot
 
+        The elements of each collection geopandas creates are mapped back to rows with `get_collection_rows`, as multi-part geometries are split into one element per part. Binning with `scheme`, categories and missing values are applied to each frame by `plot_geo_data` rather than by geopandas, while a static `color` leaves the collections without values.
+        Maps of only points are drawn with `create_scatter` instead.
+
         Args:
-            i (int): Frame to plot
             gdf (geopandas.GeoDataFrame): Source GeoDataFrame
         """
-        # fig, ax = plt.subplots(figsize=(5,3), dpi=100)
-        # self.ax.clear()
-        column_to_plot = gdf.columns[i]
-        gdf.plot(
-            column=column_to_plot,
-            ax=self.ax,
-            markersize=gdf[column_to_plot] * self.scale_markersize
-            if self.enable_markersize
-            else None,
-            # cmap='Blues',
+        # Removed first so the map is scaled to the geometries alone, like the first save
+        for artist in [collection for collection, _ in self._collections] + [
+            *self._missing_collections,
+            self._basemap,
+            self._basemap_attribution,
+        ]:
+            if artist is not None and artist.axes is not None:
+                artist.remove()
+        self._missing_collections = []
+        self._missing_rows = None
+        self.ax.relim()
+
+        kwargs = dict(self.kwargs)
+        legend = kwargs.pop("legend", False)
+        legend_kwds = kwargs.pop("legend_kwds", None) or {}
+        markersize = kwargs.pop("markersize", None)
+        # Applied to each frame, see `get_frame_colors` and `plot_geo_data`
+        for key in [
+            "vmin",
+            "vmax",
+            "scheme",
+            "k",
+            "classification_kwds",
+            "categorical",
+            "categories",
+            "missing_kwds",
+        ]:
+            kwargs.pop(key, None)
+
+        if self._point_coordinates is not None:
+            # Each element of the scatter is a row, so frames are used as they are
+            self._collections = [(self.create_scatter(**kwargs), slice(None))]
+        else:
+            n_collections = len(self.ax.collections)
+            map_gdf = geopandas.GeoDataFrame(
+                geometry=self.get_map_geometry(gdf), crs=gdf.crs
+            )
+            if kwargs.get("color") is None:
+                # Any values so geopandas maps colours, they are replaced every frame
+                kwargs.update(column=np.zeros(len(gdf)), cmap=self.cmap)
+            map_gdf.plot(
+                ax=self.ax,
+                markersize=np.ones(len(gdf)) if self.enable_markersize else markersize,
+                **kwargs,
+            )
+            self._collections = list(
+                zip(
+                    self.ax.collections[n_collections:],
+                    self.get_collection_rows(map_gdf.geometry),
+                )
+            )
+        if legend and self._colorbar is None:
+            # Not attached to the axes, so the colorbar outlives `clearing`
+            mappable = ScalarMappable(cmap=self._collections[0][0].get_cmap())
+            mappable.set_array(np.array([]))
+            self._colorbar = self.fig.colorbar(mappable, ax=self.ax, **legend_kwds)
+
+        if self.basemap_format:
+            self.add_basemap()
+
+    def create_scatter(self, **kwargs) -> PathCollection:
+        """
+        Draw every point once as a single scatter of `_point_coordinates`, coloured and sized by frame with `plot_geo_data`
+
+        Matches `GeoDataFrame.plot` for points without converting each geometry to coordinates again.
+        Only used without the keyword arguments `GeoDataFrame.plot` handles itself, see `GEOPANDAS_PLOT_KWARGS`.
+
+        Args:
+            kwargs: Keyword arguments for `Axes.scatter`, and `aspect` as per `GeoDataFrame.plot`
+
+        Returns:
+            PathCollection: Scatter with an element per row
+        """
+        aspect = kwargs.pop("aspect", "auto")
+        if aspect == "auto":
+            if self.df.crs and self.df.crs.is_geographic:
+                # Same aspect as geopandas for longitude & latitude
+                _, min_y, _, max_y = self.df.total_bounds
+                aspect = 1 / np.cos(np.mean([min_y, max_y]) * np.pi / 180)
+            else:
+                aspect = "equal"
+        if aspect is not None:
+            self.ax.set_aspect(aspect)
+
+        kwargs.setdefault("marker", "o")
+        n_points = len(self._point_coordinates)
+        return self.ax.scatter(
+            self._point_coordinates[:, 0],
+            self._point_coordinates[:, 1],
+            c=np.arange(n_points),
+            s=np.ones(n_points),
             cmap=self.cmap,
-            **self.kwargs,
+            **kwargs,
         )
 
-        if self.basemap_format:
-            try:
-                import contextily
+    def get_map_geometry(self, gdf: geopandas.GeoDataFrame) -> geopandas.GeoSeries:
+        """
+        Geometry to draw, simplified so no vertex is more than `simplify_tolerance` pixels of the saved figure from the original outline
 
-                if isinstance(self.basemap_format, dict):
-                    contextily.add_basemap(self.ax, **self.basemap_format)
-                else:
-                    contextily.add_basemap(self.ax)
+        Detail smaller than a pixel is lost when the map is rasterised, so the simplified geometry looks the same with far fewer vertices to draw every frame.
+        The tolerance is converted to map units with the extent of the geometry and the size of the axes at `dpi`, and the simplified geometry is cached for each extent and tolerance. Points have no detail to remove and are drawn as they are.
 
-            except ImportError:
+        Args:
+            gdf (geopandas.GeoDataFrame): Source GeoDataFrame
 
-                raise ModuleNotFoundError(
-                    "Ensure contextily is installed for basemap functionality https://github.com/geopandas/contextily"
+        Returns:
+            geopandas.GeoSeries: Geometry of each row
+        """
+        geometry = gdf.geometry
+        if not self.simplify_tolerance:
+            return geometry
+
+        extent = tuple(geometry.total_bounds)
+        min_x, min_y, max_x, max_y = extent
+        position = self.ax.get_position()
+        width, height = self.fig.get_size_inches() * self.dpi
+        # Map units per pixel when the geometry fills the axes with an equal aspect
+        pixel_size = max(
+            (max_x - min_x) / (position.width * width),
+            (max_y - min_y) / (position.height * height),
+        )
+        tolerance = self.simplify_tolerance * pixel_size
+        if not tolerance > 0:
+            return geometry
+
+        key = (extent, tolerance)
+        if key not in self._map_geometry:
+            points = geometry.geom_type.isin(["Point", "MultiPoint"])
+            if points.all():
+                self._map_geometry[key] = geometry
+            else:
+                self._map_geometry[key] = geometry.where(
+                    points, geometry.simplify(tolerance)
                 )
+        return self._map_geometry[key]
+
+    def get_basemap_cache_file(self, extent: typing.Tuple[float, ...]) -> str:
+        """
+        File in `basemap_cache_dir` for the basemap of an extent of the map
+
+        Args:
+            extent (typing.Tuple[float, ...]): Limits of the map as returned by `ax.axis()`
+
+        Returns:
+            str: Path of the file, named by a hash of the basemap format, extent and CRS of the map
+        """
+        key = json.dumps(
+            [self.basemap_format, extent, str(self.df.crs)], sort_keys=True, default=str
+        )
+        name = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.basemap_cache_dir, f"basemap-{name}.npz")
+
+    def add_basemap(self) -> None:
+        """
+        Add basemap with contextily behind the geometries, for the current extent of the map
+
+        The basemap is a single image kept for every frame. How it was drawn is kept as well, so later saves draw the same image again rather than fetching and decoding its tiles.
+        With `basemap_cache_dir` this is also stored on disk by the extent of the map, along with the tiles contextily downloads, so later runs & machines with a copy of the directory don't need to download anything. contextily's own tile cache is put back once the tiles are fetched.
+
+        Raises:
+            ModuleNotFoundError: contextily isn't installed
+        """
+        try:
+            import contextily
+
+        except ImportError:
+
+            raise ModuleNotFoundError(
+                "Ensure contextily is installed for basemap functionality https://github.com/geopandas/contextily"
+            )
+
+        extent = tuple(float(limit) for limit in self.ax.axis())
+        if self._basemap_extent != extent:
+            self._basemap_drawing = None
+            cache_file = None
+            if self.basemap_cache_dir:
+                cache_file = self.get_basemap_cache_file(extent)
+                if os.path.exists(cache_file):
+                    with np.load(cache_file) as drawing:
+                        self._basemap_drawing = dict(drawing)
+
+            if self._basemap_drawing is None:
+                n_images, n_texts = len(self.ax.images), len(self.ax.texts)
+                # The tile cache of contextily is global, so it is only replaced by
+                # one in `basemap_cache_dir` while fetching this basemap
+                previous_memory = contextily.tile.memory
+                if self.basemap_cache_dir:
+                    # Installed with contextily
+                    from joblib import Memory
+
+                    os.makedirs(self.basemap_cache_dir, exist_ok=True)
+                    contextily.tile.memory = Memory(self.basemap_cache_dir, verbose=0)
+                try:
+                    if isinstance(self.basemap_format, dict):
+                        contextily.add_basemap(self.ax, **self.basemap_format)
+                    else:
+                        contextily.add_basemap(self.ax)
+                finally:
+                    contextily.tile.memory = previous_memory
+                image = self.ax.images[n_images]
+                attribution = self.ax.texts[n_texts:]
+                self._basemap_drawing = {
+                    "image": np.asarray(image.get_array()),
+                    "extent": np.array(image.get_extent()),
+                    "interpolation": np.array(image.get_interpolation()),
+                    "zorder": np.array(image.get_zorder()),
+                    "alpha": np.array(
+                        np.nan if image.get_alpha() is None else image.get_alpha()
+                    ),
+                    "axis": np.array(self.ax.axis()),
+                    "attribution": np.array(
+                        attribution[0].get_text() if attribution else ""
+                    ),
+                    "attribution_size": np.array(
+                        attribution[0].get_fontsize() if attribution else 0
+                    ),
+                }
+                image.remove()
+                for text in attribution:
+                    text.remove()
+                if cache_file:
+                    np.savez(cache_file, **self._basemap_drawing)
+            self._basemap_extent = extent
+
+        # Draw the basemap the same way as `contextily.add_basemap`
+        drawing = self._basemap_drawing
+        alpha = float(drawing["alpha"])
+        self._basemap = self.ax.imshow(
+            drawing["image"],
+            extent=tuple(drawing["extent"]),
+            interpolation=str(drawing["interpolation"]),
+            aspect=self.ax.get_aspect(),
+            zorder=float(drawing["zorder"]),
+            alpha=None if np.isnan(alpha) else alpha,
+        )
+        self.ax.axis(tuple(drawing["axis"]))
+        self._basemap_attribution = None
+        if str(drawing["attribution"]):
+            self._basemap_attribution = contextily.add_attribution(
+                self.ax,
+                str(drawing["attribution"]),
+                font_size=float(drawing["attribution_size"]),
+            )
+
+    def plot_geo_data(self, i: int, gdf: geopandas.GeoDataFrame) -> None:
+        """
+        Colour the geometries with their values in frame `i`
+
+        The geometries are only drawn on the first frame (see `create_collections`), later frames update the values, colour limits and marker sizes of the same collections, so their cost doesn't depend on the complexity of the geometries.
+        Geometries without a value in the frame are transparent.
+
+        Args:
+            i (int): Frame to plot
+            gdf (geopandas.GeoDataFrame): Source GeoDataFrame
+        """
+        if not self._collections or self._collections[0][0].axes is None:
+            self.create_collections(gdf)
+
+        values = self._frame_values[i]
+        colors = self._frame_colors[i]
+        vmin, vmax = self._frame_limits[i]
+        # Frames without values leave the limits as they were
+        has_limits = not np.isnan(vmin)
+        # Like `GeoDataFrame.plot`, `color` draws every geometry in that colour
+        has_colors = self.kwargs.get("color") is None
+        for collection, rows in self._collections:
+            if has_colors:
+                collection.set_array(np.ma.masked_invalid(colors[rows]))
+                if has_limits:
+                    collection.set_clim(vmin, vmax)
+            if self.enable_markersize and isinstance(collection, PathCollection):
+                # Missing values have no marker
+                collection.set_sizes(
+                    np.nan_to_num(values[rows] * self.scale_markersize)
+                )
+        if self._colorbar is not None and has_limits:
+            self._colorbar.mappable.set_clim(vmin, vmax)
+        if has_colors and self.kwargs.get("missing_kwds") is not None:
+            self.plot_missing_geometry(np.isnan(values), gdf)
 
         return self.ax
 
+    def plot_missing_geometry(
+        self, missing: np.ndarray, gdf: geopandas.GeoDataFrame
+    ) -> None:
+        """
+        Draw the geometries without a value with `missing_kwds` over the map, like `GeoDataFrame.plot`
+
+        They are only drawn again when the rows without a value change, which is rarely more than a handful of times in an animation.
+
+        Args:
+            missing (np.ndarray): Whether each row is without a value in the frame
+            gdf (geopandas.GeoDataFrame): Source GeoDataFrame
+        """
+        if (
+            self._missing_rows is not None
+            and np.array_equal(missing, self._missing_rows)
+            and all(
+                collection.axes is not None for collection in self._missing_collections
+            )
+        ):
+            return
+        for collection in self._missing_collections:
+            if collection.axes is not None:
+                collection.remove()
+        self._missing_collections = []
+        self._missing_rows = missing
+        if not missing.any():
+            return
+
+        # Styled like the other geometries apart from `missing_kwds`
+        style_kwds = {
+            key: value
+            for key, value in self.kwargs.items()
+            if key not in GEOPANDAS_PLOT_KWARGS
+            and key not in {"aspect", "legend", "legend_kwds", "vmin", "vmax"}
+        }
+        style_kwds.update(self.kwargs["missing_kwds"])
+        n_collections = len(self.ax.collections)
+        self.get_map_geometry(gdf)[missing].plot(ax=self.ax, aspect=None, **style_kwds)
+        self._missing_collections = self.ax.collections[n_collections:]
+
     def anim_func(self, i: int) -> None:
         """ Animation function
 
@@ -208,7 +672,6 @@ class MapChart(_BaseChart):
         if self.enable_progress_bar:
             self.update_progress_bar()
 
-        self.ax.clear()
         self.ax.set_axis_off()
         self.plot_geo_data(i, self.df)
         if self.period_fmt:
@@ -217,19 +680,21 @@ class MapChart(_BaseChart):
     def init_func(self) -> None:
         """ Initialization function for animation
         """
-        column_to_plot = self.df.columns[0]
-        self.df.plot(
-            column=column_to_plot,
-            markersize=self.df[column_to_plot],
-            # cmap='viridis',
-        )
-        # self.ax.scatter([], [])
+        self.plot_geo_data(0, self.df)
+
+    def clearing(self):
+        """
+        Remove the geometries and labels from the map after a save, they are drawn again on the next first frame. The colorbar keeps its contents as it is only added once.
+        """
+        ax = self.ax
+        for item in ax.lines + ax.collections + ax.containers + ax.texts:
+            item.remove()
 
     def get_frames(self):
         """
         Get number of frames to animate
         """
-        return range(len(self.get_data_cols(self.df)))
+        return range(len(self._frame_values))
 
     def show_period(self, i: int) -> None:
         """
@@ -243,20 +708,21 @@ class MapChart(_BaseChart):
         """
         if self.period_label:
             if self.period_fmt:
-                idx_val = self.df.columns[i]
+                idx_val = self._frame_index[i]
                 if type(idx_val) == pd.Timestamp:  # Date time
                     s = idx_val.strftime(self.period_fmt)
                 else:
                     s = self.period_fmt.format(x=idx_val)
             else:
-                s = self.df.columns.astype(str)[i]
-            num_texts = len(self.ax.texts)
-            if num_texts == 0:
+                s = self._frame_index.astype(str)[i]
+            # Kept by reference as the basemap attribution is also in `ax.texts`
+            period_text = getattr(self, "period_label_text", None)
+            if period_text is None or period_text.axes is None:
                 # first frame
-                self.ax.text(
+                self.period_label_text = self.ax.text(
                     s=s,
                     transform=self.ax.transAxes,
                     **self.get_period_label(self.period_label),
                 )
             else:
-                self.ax.texts[0].set_text(s)
+                period_text.set_text(s)
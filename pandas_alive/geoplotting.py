@@ -32,10 +32,21 @@ def geoplot(
     dpi: float = 144,
     writer: str = None,
     enable_progress_bar: bool = False,
+    workers: int = None,
+    global_palette: bool = False,
+    codec: str = None,
+    crf: int = None,
+    preset: str = None,
+    pix_fmt: str = "yuv420p",
+    threads: int = None,
+    interpolate_method: str = "linear",
+    copy: bool = True,
     # Geo Chart
     basemap_format: typing.Dict = None,
+    basemap_cache_dir: str = None,
     enable_markersize: bool = False,
     scale_markersize: float = 1,
+    simplify_tolerance: float = 0.5,
     **kwargs,
 ):
     """
@@ -43,18 +54,29 @@ def geoplot(
 
 
     Args:
+        workers (int, optional): Number of worker processes to render frames with when saving to `filename`. Defaults to None.
+        global_palette (bool, optional): When saving to a GIF, quantise every frame to the palette of the first frame instead of a palette per frame. Defaults to False.
+        codec (str, optional): When saving to a movie with ffmpeg, video encoder, if None use `rcParams["animation.codec"]`. Defaults to None.
+        crf (int, optional): When saving to a movie with ffmpeg, constant rate factor of the encoder, lower is higher quality. Defaults to None.
+        preset (str, optional): When saving to a movie with ffmpeg, encoder preset trading speed for compression, eg "ultrafast" or "slow" for h264. Defaults to None.
+        pix_fmt (str, optional): When saving to a movie with ffmpeg, pixel format of the encoded video. Defaults to "yuv420p".
+        threads (int, optional): When saving to a movie with ffmpeg, number of threads ffmpeg encodes with. Defaults to None.
+        interpolate_method (str, optional): How values move from one period to the next, one of "linear", "time", "smoothstep" or "cubic". Defaults to "linear".
+        copy (bool, optional): Copy `input_df` when building the chart. Set to False for the chart to share the values of `input_df` instead, which must then not be modified while the chart is in use. Defaults to True.
         basemap_format (Dict, optional): If provided with a dictionary with keywords arguments as per https://contextily.readthedocs.io/en/latest/reference.html#contextily.add_basemap, this will add a basemap. Defaults to None.
             Ensure to have contextily installed: https://contextily.readthedocs.io/en/latest/index.html
+        basemap_cache_dir (str, optional): Directory to cache the basemap of each map extent and its downloaded tiles in, so later runs render without fetching tiles again. Defaults to None to cache only for this chart.
         enable_markersize (bool, optional): Set to True if using Points, this will use the values being plotted as the size of the markers. Defaults to False.
         scale_markersize (float, optional): To be used with enable_markersize, this will scale the size of the markers by the number specified. Defaults to 1.
+        simplify_tolerance (float, optional): Simplify lines and polygons before drawing them, removing detail smaller than this many pixels of the saved figure. Set to None to draw the full geometry. Defaults to 0.5.
 
     Returns:
         MapChart: Returns an instance of the MapChart class for use in multiple plots or save.
     """
-    df = input_df.copy()
     map_chart = MapChart(
-        df,
+        input_df,
         interpolate_period=interpolate_period,
+        interpolate_method=interpolate_method,
         steps_per_period=steps_per_period,
         period_length=period_length,
         period_fmt=period_fmt,
@@ -69,11 +91,23 @@ def geoplot(
         dpi=dpi,
         writer=writer,
         enable_progress_bar=enable_progress_bar,
+        copy=copy,
         basemap_format=basemap_format,
+        basemap_cache_dir=basemap_cache_dir,
         enable_markersize=enable_markersize,
         scale_markersize=scale_markersize,
+        simplify_tolerance=simplify_tolerance,
         kwargs=kwargs,
     )
     if filename:
-        map_chart.save(verify_filename(filename))
+        map_chart.save(
+            verify_filename(filename),
+            workers=workers,
+            global_palette=global_palette,
+            codec=codec,
+            crf=crf,
+            preset=preset,
+            pix_fmt=pix_fmt,
+            threads=threads,
+        )
     return map_chart
@@ -7,10 +7,15 @@ Example:
 """
 
 import datetime
+import functools
+import time
+import traceback
 import typing
 from typing import Sequence
 
+import attr
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from matplotlib.animation import FuncAnimation
 from matplotlib.colors import Colormap
@@ -83,6 +88,16 @@ def plot(
     dpi: int = 144,
     writer: str = None,
     enable_progress_bar: bool = False,
+    workers: int = None,
+    global_palette: bool = False,
+    codec: str = None,
+    crf: int = None,
+    preset: str = None,
+    pix_fmt: str = "yuv420p",
+    threads: int = None,
+    interpolate_method: str = "linear",
+    lazy_frames: bool = False,
+    copy: bool = True,
     # Bar chart
     orientation: str = "h",
     sort: str = "desc",
@@ -91,13 +106,17 @@ def plot(
     n_visible: int = None,
     fixed_order: typing.Union[bool, list] = False,
     perpendicular_bar_func: typing.Union[typing.Callable, str] = None,
+    reuse_bars: bool = False,
     # Line Chart
     line_width: int = 2,
     label_events: typing.Dict[str, datetime.datetime] = None,
     fill_under_line_color: str = None,
     add_legend: bool = True,
+    blit: bool = False,
+    trailing_window: int = None,
     # Scatter Chart
     size: int = 2,
+    merge_series: bool = False,
     # Bubble Chart
     x_data_label: str = None,
     y_data_label: str = None,
@@ -190,6 +209,28 @@ def plot(
 
         enable_progress_bar (bool,optional): Enable tqdm bar to show progress on generating animation, see more details at https://github.com/tqdm/tqdm. Defaults to False.
 
+        workers (int, optional): Number of worker processes to render frames with when saving to `filename`, output is identical to rendering in a single process. Defaults to None.
+
+        global_palette (bool, optional): When saving to a GIF, quantise every frame to the palette of the first frame instead of a palette per frame. Faster, but colours not present in the first frame will map to their nearest palette colour. Defaults to False.
+
+        codec (str, optional): When saving to a movie with ffmpeg, video encoder, if None use `rcParams["animation.codec"]`. Defaults to None.
+
+        crf (int, optional): When saving to a movie with ffmpeg, constant rate factor of the encoder, lower is higher quality. Defaults to None.
+
+        preset (str, optional): When saving to a movie with ffmpeg, encoder preset trading speed for compression, eg "ultrafast" or "slow" for h264. Defaults to None.
+
+        pix_fmt (str, optional): When saving to a movie with ffmpeg, pixel format of the encoded video. Defaults to "yuv420p".
+
+        threads (int, optional): When saving to a movie with ffmpeg, number of threads ffmpeg encodes with. Defaults to None.
+
+        interpolate_method (str, optional): How values move from one period to the next. Defaults to "linear".
+            "linear" moves an equal step every frame, "time" weights each frame by the time between the periods of a datetime or numeric index (requires `interpolate_period=True` and an increasing index),
+            "smoothstep" and "cubic" ease in and out of every period.
+
+        lazy_frames (bool, optional): For race and pie charts, interpolate each frame from its neighbouring periods when it is drawn instead of storing every frame up front. Memory use then depends on the number of periods rather than `steps_per_period`. Defaults to False.
+
+        copy (bool, optional): Copy `input_df` when building the chart. Set to False for the chart to share the values of `input_df` instead, which must then not be modified while the chart is in use. Defaults to True.
+
         sort (str, optional): 'asc' or 'desc'. Choose how to sort the bars. Use 'desc' to put largest bars on top and 'asc' to place largest bars on bottom. Defaults to "desc".
 
         label_bars (bool, optional): Whether to label the bars with their value on their right. Defaults to True.
@@ -228,6 +269,8 @@ def plot(
 
             Defaults to None.
 
+        reuse_bars (bool, optional): Create one bar and one bar label per category on the first frame and update them in place every frame, instead of re-creating every bar, label and tick label. Much faster for bar chart races with many frames. Defaults to False.
+
         line_width (int, optional): Line width provided on line charts. Defaults to 2.
 
         label_events (typing.Dict[str,datetime.datetime],optional): Provide list of events to label with a vertical bar on line charts. Defaults to None.
@@ -249,8 +292,14 @@ def plot(
 
             String passed must be in list of named colors by matplotlib https://matplotlib.org/3.1.1/gallery/color/named_colors.html#sphx-glr-gallery-color-named-colors-py
 
+        blit (bool, optional): For line and scatter charts, only redraw the lines, points and labels each frame over a cached background of the axes, ticks and grid. The background is re-rendered whenever the axes limits change, so this is fastest with `fixed_max=True`. Defaults to False.
+
+        trailing_window (int, optional): Only draw the last `trailing_window` frames of each line on line charts, with the axes limits following the window unless `fixed_max=True`. Defaults to None for the whole history.
+
         size (int, optional): Size of scatter points on scatter charts. Defaults to 2.
 
+        merge_series (bool, optional): Draw every series of a scatter chart as a single collection with a colour per point, instead of a collection per series. Faster with many series, although points are drawn in the order of their frames rather than series by series. Defaults to False.
+
         x_data_label (str,optional): For use with Scatter plots, label passed must be in level 0 column in multiindex
 
             Label passed all values will be used for the x-axis
@@ -275,7 +324,8 @@ def plot(
     Returns:
         typing.Union[BarChart, BarChartRace, BubbleChart, LineChart, PieChart, ScatterChart]: Return instance of chart type. Can be used with `pandas_alive.animate_multiple_plots` or `.save()`.
     """
-    df = input_df.copy()
+    # The chart copies the values if `copy` is set
+    df = input_df
     if isinstance(df, pd.Series):
         df = pd.DataFrame(df)
 
@@ -289,6 +339,7 @@ def plot(
         bcr = BarChartRace(
             df,
             interpolate_period=interpolate_period,
+            interpolate_method=interpolate_method,
             steps_per_period=steps_per_period,
             period_length=period_length,
             period_fmt=period_fmt,
@@ -303,6 +354,7 @@ def plot(
             dpi=dpi,
             writer=writer,
             enable_progress_bar=enable_progress_bar,
+            copy=copy,
             # Bar chart
             orientation=orientation,
             sort=sort,
@@ -311,16 +363,28 @@ def plot(
             n_visible=n_visible,
             fixed_order=fixed_order,
             perpendicular_bar_func=perpendicular_bar_func,
+            reuse_bars=reuse_bars,
+            lazy_frames=lazy_frames,
             kwargs=kwargs,
         )
         if filename:
-            bcr.save(verify_filename(filename))
+            bcr.save(
+                verify_filename(filename),
+                workers=workers,
+                global_palette=global_palette,
+                codec=codec,
+                crf=crf,
+                preset=preset,
+                pix_fmt=pix_fmt,
+                threads=threads,
+            )
         return bcr
 
     elif kind == "line":
         line_race = LineChart(
             df,
             interpolate_period=interpolate_period,
+            interpolate_method=interpolate_method,
             steps_per_period=steps_per_period,
             period_length=period_length,
             period_fmt=period_fmt,
@@ -335,19 +399,32 @@ def plot(
             dpi=dpi,
             writer=writer,
             enable_progress_bar=enable_progress_bar,
+            copy=copy,
             line_width=line_width,
             label_events=label_events,
             fill_under_line_color=fill_under_line_color,
             add_legend=add_legend,
+            blit=blit,
+            trailing_window=trailing_window,
             kwargs=kwargs,
         )
         if filename:
-            line_race.save(verify_filename(filename))
+            line_race.save(
+                verify_filename(filename),
+                workers=workers,
+                global_palette=global_palette,
+                codec=codec,
+                crf=crf,
+                preset=preset,
+                pix_fmt=pix_fmt,
+                threads=threads,
+            )
         return line_race
     elif kind == "scatter":
         animated_scatter = ScatterChart(
             df,
             interpolate_period=interpolate_period,
+            interpolate_method=interpolate_method,
             steps_per_period=steps_per_period,
             period_length=period_length,
             period_fmt=period_fmt,
@@ -362,17 +439,30 @@ def plot(
             dpi=dpi,
             writer=writer,
             enable_progress_bar=enable_progress_bar,
+            copy=copy,
             size=size,
             add_legend=add_legend,
+            blit=blit,
+            merge_series=merge_series,
             kwargs=kwargs,
         )
         if filename:
-            animated_scatter.save(verify_filename(filename))
+            animated_scatter.save(
+                verify_filename(filename),
+                workers=workers,
+                global_palette=global_palette,
+                codec=codec,
+                crf=crf,
+                preset=preset,
+                pix_fmt=pix_fmt,
+                threads=threads,
+            )
         return animated_scatter
     elif kind == "pie":
         animated_pie = PieChart(
             df,
             interpolate_period=interpolate_period,
+            interpolate_method=interpolate_method,
             steps_per_period=steps_per_period,
             period_length=period_length,
             period_fmt=period_fmt,
@@ -387,15 +477,28 @@ def plot(
             dpi=dpi,
             writer=writer,
             enable_progress_bar=enable_progress_bar,
+            copy=copy,
+            # Pie chart
+            lazy_frames=lazy_frames,
             kwargs=kwargs,
         )
         if filename:
-            animated_pie.save(verify_filename(filename))
+            animated_pie.save(
+                verify_filename(filename),
+                workers=workers,
+                global_palette=global_palette,
+                codec=codec,
+                crf=crf,
+                preset=preset,
+                pix_fmt=pix_fmt,
+                threads=threads,
+            )
         return animated_pie
     elif kind == "bar":
         animated_bar = BarChart(
             df,
             interpolate_period=interpolate_period,
+            interpolate_method=interpolate_method,
             steps_per_period=steps_per_period,
             period_length=period_length,
             period_fmt=period_fmt,
@@ -410,15 +513,26 @@ def plot(
             dpi=dpi,
             writer=writer,
             enable_progress_bar=enable_progress_bar,
+            copy=copy,
             kwargs=kwargs,
         )
         if filename:
-            animated_bar.save(verify_filename(filename))
+            animated_bar.save(
+                verify_filename(filename),
+                workers=workers,
+                global_palette=global_palette,
+                codec=codec,
+                crf=crf,
+                preset=preset,
+                pix_fmt=pix_fmt,
+                threads=threads,
+            )
         return animated_bar
     elif kind == "bubble":
         animated_bubble = BubbleChart(
             df,
             interpolate_period=interpolate_period,
+            interpolate_method=interpolate_method,
             steps_per_period=steps_per_period,
             period_length=period_length,
             period_fmt=period_fmt,
@@ -435,6 +549,7 @@ def plot(
             dpi=dpi,
             writer=writer,
             enable_progress_bar=enable_progress_bar,
+            copy=copy,
             x_data_label=x_data_label,
             y_data_label=y_data_label,
             size_data_label=size_data_label,
@@ -442,10 +557,63 @@ def plot(
             kwargs=kwargs,
         )
         if filename:
-            animated_bubble.save(verify_filename(filename))
+            animated_bubble.save(
+                verify_filename(filename),
+                workers=workers,
+                global_palette=global_palette,
+                codec=codec,
+                crf=crf,
+                preset=preset,
+                pix_fmt=pix_fmt,
+                threads=threads,
+            )
         return animated_bubble
 
 
+@attr.s
+class _MultiplePlots:
+    """ Charts sharing one figure, updated together so their frames render like those of a single chart
+
+    Args:
+        fig (plt.Figure): Figure every chart is drawn on
+        plots (typing.List[_BaseChart]): Charts to update each frame
+    """
+
+    fig: plt.Figure = attr.ib()
+    plots: typing.List = attr.ib()
+    enable_progress_bar: bool = attr.ib(default=False)
+
+    @property
+    def replay_frames(self) -> bool:
+        """ Whether any of the charts builds on the state left by every previous frame
+        """
+        return any(plot.replay_frames for plot in self.plots)
+
+    def anim_func(self, frame: int) -> None:
+        """ Update every chart to frame
+
+        Args:
+            frame (int): Frame to animate
+
+        Raises:
+            UserWarning: DataFrames for each plot must have the same index length.
+        """
+        for plot in self.plots:
+            try:
+                plot.anim_func(frame)
+            except:
+                raise UserWarning(
+                    f"Ensure all plots share index length {[plot.get_frames() for plot in self.plots]}. Also, when passing a `custom_fig=` ensure it is a `Figure()` instance, and not a `figure()` one. The latter causes very poor performance in `matplotlib` with animations."
+                )
+
+    def get_frame_capture(self) -> typing.Callable[[], np.ndarray]:
+        """ Function drawing the figure and returning its pixels, see `capture_frame`
+        """
+        from ._rendering import capture_frame
+
+        return functools.partial(capture_frame, self.fig)
+
+
 def animate_multiple_plots(
     filename: str,
     plots: typing.List[typing.Union[BarChartRace, LineChart, PieChart, ScatterChart]],
@@ -454,6 +622,13 @@ def animate_multiple_plots(
     title_fontsize: typing.Union[int, float, str] = 16,
     dpi: int = 144,
     enable_progress_bar: bool = False,
+    global_palette: bool = False,
+    workers: int = None,
+    codec: str = None,
+    crf: int = None,
+    preset: str = None,
+    pix_fmt: str = "yuv420p",
+    threads: int = None,
     adjust_subplot_left: float = 0.15,
     adjust_subplot_right: float = 0.9,
     adjust_subplot_bottom: float = 0.1,
@@ -478,6 +653,20 @@ def animate_multiple_plots(
 
         enable_progress_bar (bool, optional): Enable tqdm bar to show progress on generating animation, see more details at https://github.com/tqdm/tqdm. Defaults to False.
 
+        global_palette (bool, optional): When saving to a GIF, quantise every frame to the palette of the first frame instead of a palette per frame. Defaults to False.
+
+        workers (int, optional): Number of worker processes to render frames with, output is identical to rendering in a single process. Defaults to None.
+
+        codec (str, optional): When saving to a movie with ffmpeg, video encoder, if None use `rcParams["animation.codec"]`. Defaults to None.
+
+        crf (int, optional): When saving to a movie with ffmpeg, constant rate factor of the encoder, lower is higher quality. Defaults to None.
+
+        preset (str, optional): When saving to a movie with ffmpeg, encoder preset trading speed for compression, eg "ultrafast" or "slow" for h264. Defaults to None.
+
+        pix_fmt (str, optional): When saving to a movie with ffmpeg, pixel format of the encoded video. Defaults to "yuv420p".
+
+        threads (int, optional): When saving to a movie with ffmpeg, number of threads ffmpeg encodes with. Defaults to None.
+
         adjust_subplot_left (float, optional): the left side of the subplots of the figure. Defaults to 0.15.
 
         adjust_subplot_right (float, optional): the right side of the subplots of the figure. Defaults to 0.9.
@@ -529,26 +718,39 @@ def animate_multiple_plots(
         from tqdm.auto import tqdm
         progress_bar = tqdm(total=num_frames)
     
+    multiple_plots = _MultiplePlots(fig, plots)
+
     def update_all_graphs(frame: int) -> None:
         """
         Function for updating all plots provided as a list via their respective `anim_func` method.
 
         Args:
             frame (int): Frame to animate
-
-        Raises:
-            UserWarning: DataFrames for each plot must have the same index length.
         """
-        for plot in plots:
-            try:
-                plot.anim_func(frame)
-            except:
-                raise UserWarning(
-                    f"Ensure all plots share index length {[plot.get_frames() for plot in plots]}. Also, when passing a `custom_fig=` ensure it is a `Figure()` instance, and not a `figure()` one. The latter causes very poor performance in `matplotlib` with animations."
-                )
+        multiple_plots.anim_func(frame)
         if enable_progress_bar:
             progress_bar.update(1)
-    
+
+    def render_frames() -> typing.Iterator[np.ndarray]:
+        """ Render every frame of the figure in order, across `workers` processes if given
+
+        Yields:
+            np.ndarray: RGBA array of shape (height, width, 4) for each frame, only valid until the next frame is rendered
+        """
+        if workers and workers > 1:
+            from ._rendering import render_frames_parallel
+
+            for rgba in render_frames_parallel(
+                multiple_plots, range(num_frames), workers
+            ):
+                if enable_progress_bar:
+                    progress_bar.update(1)
+                yield rgba
+        else:
+            capture = multiple_plots.get_frame_capture()
+            for frame in range(num_frames):
+                update_all_graphs(frame)
+                yield capture()
 
     # Otherwise titles overlap and adjust_subplot does nothing
     from matplotlib import rcParams
@@ -588,9 +790,9 @@ def animate_multiple_plots(
             # Hodgepodge way of fixing this, should refactor to contain all figures and axes
             # TODO plot.axes_format(self,ax) and pass current ax or desired ax
             if plot.__class__.__name__ == "BarChartRace" and plot.orientation == "h":
-                axes[num].set_xlim(axes[num].get_xlim()[0], plot.df.values.max() * 1.1)
+                axes[num].set_xlim(axes[num].get_xlim()[0], plot.df.max().max() * 1.1)
             elif plot.__class__.__name__ == "BarChartRace" and plot.orientation == "v":
-                axes[num].set_ylim(axes[num].get_ylim()[0], plot.df.values.max() * 1.1)
+                axes[num].set_ylim(axes[num].get_ylim()[0], plot.df.max().max() * 1.1)
         # TODO: add colorbar from bubbleChart if it exists, into multiple plots
 
         plot.init_func()
@@ -611,46 +813,71 @@ def animate_multiple_plots(
         fps = 1000 / plots[0].period_length * plots[0].steps_per_period
         interval = plots[0].period_length / plots[0].steps_per_period
 
-        # Note: `init_func=` is required for multiple plots to work properly,
-        # or else an additional zero frame may appear in the loop showing duplicates.
-        anim = FuncAnimation(
-            fig=fig,
-            func=update_all_graphs,
-            frames=num_frames,
-            interval=interval,
-            init_func=clearing,
-        )
+        def make_animation() -> FuncAnimation:
+            # Note: `init_func=` is required for multiple plots to work properly,
+            # or else an additional zero frame may appear in the loop showing duplicates.
+            return FuncAnimation(
+                fig=fig,
+                func=update_all_graphs,
+                frames=num_frames,
+                interval=interval,
+                init_func=clearing,
+            )
+
+        from ._rendering import FFMpegPipeWriter
 
         extension = filename.split(".")[-1]
+        pipe_video = extension != "gif" and FFMpegPipeWriter.is_available()
+        if (
+            workers
+            and workers > 1
+            and (plots[0].writer or not (extension == "gif" or pipe_video))
+        ):
+            import warnings
+
+            warnings.warn(
+                "Rendering with `workers` is only supported without a `writer`, and for movies when ffmpeg is installed, rendering in a single process"
+            )
         try:
             if plots[0].writer:
-                anim.save(filename, fps=fps, dpi=dpi, writer=plots[0].writer)
-            else:
+                make_animation().save(
+                    filename, fps=fps, dpi=dpi, writer=plots[0].writer
+                )
+            elif extension == "gif" or pipe_video:
+                import matplotlib
+                matplotlib.use("Agg")
+
+                from ._rendering import GifWriter
+
+                # No `FuncAnimation` here, as it would call `clearing` again on the
+                # first draw of the canvas, so clear once up front like its `init_func`
+                clearing()
                 if extension == "gif":
-                    import io
-                    import matplotlib
-                    matplotlib.use("Agg")
-                    from PIL import Image
-
-                    frames = []
-                    for frame in range(0, num_frames):
-                        update_all_graphs(frame)
-                        buffer = io.BytesIO()
-                        fig.savefig(buffer, format="png")
-                        buffer.seek(0)
-                        image = Image.open(buffer)
-                        plt.close()
-                        frames.append(image)
-                    frames[0].save(
-                        filename,
-                        save_all=True,
-                        append_images=frames[:],
-                        optimize=False,
-                        duration=interval,
-                        loop=0,
-                    )
+                    with GifWriter(
+                        filename, duration=interval, global_palette=global_palette
+                    ) as gif:
+                        for rgba in render_frames():
+                            gif.write_frame(rgba)
                 else:
-                    anim.save(filename, fps=fps, dpi=dpi)
+                    # Movies are drawn at `dpi` like `FuncAnimation.save` would
+                    fig_dpi = fig.dpi
+                    fig.set_dpi(dpi)
+                    try:
+                        with FFMpegPipeWriter(
+                            filename,
+                            fps=fps,
+                            codec=codec,
+                            crf=crf,
+                            preset=preset,
+                            pix_fmt=pix_fmt,
+                            threads=threads,
+                        ) as video:
+                            for rgba in render_frames():
+                                video.write_frame(rgba)
+                    finally:
+                        fig.set_dpi(fig_dpi)
+            else:
+                make_animation().save(filename, fps=fps, dpi=dpi)
             if enable_progress_bar:
                 progress_bar.close()
             # Clearing axes contents after save, so that fig, axes can be re-used in a 
@@ -665,6 +892,113 @@ def animate_multiple_plots(
     save_multiple(verify_filename(filename))
 
 
+@attr.s(frozen=True)
+class BatchResult:
+    """ Outcome of a single job rendered by `render_batch`
+
+    Args:
+        filename (str): File the animation was saved to
+        frames (int): Number of frames in the animation, None if the job failed
+        seconds (float): Time taken to create the chart and save it
+        error (str, optional): Traceback of the exception the job raised, None if it succeeded. Defaults to None.
+    """
+
+    filename: str = attr.ib()
+    frames: int = attr.ib()
+    seconds: float = attr.ib()
+    error: str = attr.ib(default=None)
+
+
+def render_job(job: typing.Dict[str, typing.Any]) -> BatchResult:
+    """ Create and save a single chart of a batch
+
+    Args:
+        job (typing.Dict[str, typing.Any]): Keyword arguments for `plot`, including `input_df` and `filename`
+
+    Returns:
+        BatchResult: Output file, number of frames and time taken
+    """
+    start = time.perf_counter()
+    chart = plot(**job)
+    return BatchResult(
+        filename=job["filename"],
+        frames=len(chart.get_frames()),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _init_batch_worker() -> None:
+    """ Initialise worker process to draw without a display
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_batch_job(job: typing.Dict[str, typing.Any]) -> BatchResult:
+    """ Render a job of the batch, returning its error instead of raising it
+
+    Args:
+        job (typing.Dict[str, typing.Any]): Keyword arguments for `plot`, including `input_df` and `filename`
+
+    Returns:
+        BatchResult: Output file, number of frames and time taken, or the error raised
+    """
+    start = time.perf_counter()
+    try:
+        return render_job(job)
+    except Exception:
+        # Formatted, as not every exception survives pickling back from a worker
+        return BatchResult(
+            filename=job["filename"],
+            frames=None,
+            seconds=time.perf_counter() - start,
+            error=traceback.format_exc(),
+        )
+
+
+def render_batch(
+    jobs: typing.Iterable[typing.Dict[str, typing.Any]], workers: int = None
+) -> typing.List[BatchResult]:
+    """ Create and save many animations, spread across worker processes
+
+    Each job is rendered exactly as `plot(**job)` would render it. Worker processes live for the whole batch, so imports, fonts and the figure layout measurements cached by `calculate_new_figsize` are reused by every job a worker renders with the same figure settings, instead of being paid for by a new process or call each time. Each job is sent only to the worker that renders it. A job that raises doesn't stop the batch, its error is returned in its `BatchResult` instead.
+
+    Example:
+        ``render_batch([{"input_df": df, "filename": f"{name}.gif"} for name, df in slices], workers=4)``
+
+    Args:
+        jobs (typing.Iterable[typing.Dict[str, typing.Any]]): Keyword arguments for `plot` of each animation, each must include `input_df` and `filename`
+        workers (int, optional): Number of worker processes to render jobs with, one job at a time per worker. If None render every job in this process. Defaults to None.
+
+    Raises:
+        ValueError: If a job has no `filename` or sets `workers` while the batch is rendered with `workers`
+
+    Returns:
+        typing.List[BatchResult]: Output file, number of frames and time taken, or error, of each job, in the order of `jobs`
+    """
+    jobs = list(jobs)
+    parallel = workers is not None and workers > 1 and len(jobs) > 1
+    for job in jobs:
+        if not job.get("filename"):
+            raise ValueError("Every job must have a `filename` to save to")
+        if parallel and job.get("workers") and job["workers"] > 1:
+            raise ValueError(
+                "Jobs can't set `workers` when the batch is rendered with `workers`"
+            )
+
+    if not parallel:
+        return [_render_batch_job(job) for job in jobs]
+
+    from ._rendering import _get_context
+
+    with _get_context().Pool(
+        min(workers, len(jobs)), initializer=_init_batch_worker
+    ) as pool:
+        # Jobs vary in length, so hand them out one at a time
+        return pool.map(_render_batch_job, jobs, chunksize=1)
+
+
 ##############################################################################
 ########### Class to add Animated plotting methods to Pandas DataFrame
 ##############################################################################
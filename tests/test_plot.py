@@ -1,3 +1,4 @@
+import functools
 import os
 import sys
 
@@ -9,6 +10,9 @@ import numpy as np
 from datetime import datetime, timedelta
 from PIL import Image
 
+from pandas_alive import _base_chart
+from pandas_alive._rendering import FFMpegPipeWriter
+
 myPath = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, "../..")
 
@@ -30,6 +34,37 @@ def example_dataframe():
     return pd.DataFrame(data=test_data, columns=test_columns, index=test_index)
 
 
+@pytest.fixture(scope="function")
+def wide_dataframe():
+    # Enough periods & columns for frames to span several worker chunks, axes limits
+    # to change mid animation and bars to swap places
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.integers(0, 10000, size=(10, 8)),
+        columns=list("ABCDEFGH"),
+        index=pd.date_range("2020-01-01", periods=10, freq="W"),
+    )
+
+
+def assert_same_output(save, tmp_path, first, second, extension="gif"):
+    """ Save an animation with two sets of keyword arguments and assert the files are identical
+
+    Args:
+        save (typing.Callable): Saves the animation to its `filename` keyword argument
+        tmp_path (pathlib.Path): Directory to save both files in
+        first (dict): Keyword arguments of the first save
+        second (dict): Keyword arguments of the second save
+        extension (str, optional): Format to save. Defaults to "gif".
+    """
+    saved = []
+    for name, kwargs in [("first", first), ("second", second)]:
+        filename = str(tmp_path / f"{name}.{extension}")
+        save(filename=filename, **kwargs)
+        with open(filename, "rb") as f:
+            saved.append(f.read())
+    assert saved[0] == saved[1]
+
+
 @pytest.mark.parametrize("kind", ["race", "line", "scatter", "pie", "bar"])
 def test_plot(example_dataframe, kind):
     animated_plot = example_dataframe.plot_animated(filename="test.gif", kind=kind)
@@ -82,3 +117,828 @@ def test_line_chart(example_dataframe, line_width, fill_under_line_color):
     )
     im = Image.open("test.gif")
     assert im.format == "GIF"
+
+
+@pytest.mark.parametrize("kind", ["race", "line", "scatter", "pie", "bar"])
+def test_save_workers(wide_dataframe, kind, tmp_path):
+    save = functools.partial(
+        wide_dataframe.plot_animated, kind=kind, steps_per_period=3
+    )
+    assert_same_output(save, tmp_path, {}, {"workers": 2})
+
+
+@pytest.mark.parametrize("global_palette", [True, False])
+def test_save_gif_palette(example_dataframe, global_palette):
+    animated_plot = example_dataframe.plot_animated(
+        filename="test.gif", global_palette=global_palette
+    )
+    im = Image.open("test.gif")
+    assert im.format == "GIF"
+    assert im.n_frames == len(animated_plot.get_frames())
+
+
+@pytest.mark.parametrize("kind", ["race", "line"])
+def test_capture_frame(example_dataframe, kind):
+    import io
+    from pandas_alive._rendering import capture_frame
+
+    animated_plot = example_dataframe.plot_animated(kind=kind)
+    animated_plot.anim_func(0)
+    buffer = io.BytesIO()
+    animated_plot.fig.savefig(buffer, format="png")
+    buffer.seek(0)
+    assert np.array_equal(
+        capture_frame(animated_plot.fig), np.asarray(Image.open(buffer))
+    )
+
+
+@pytest.mark.parametrize("kind", ["line", "scatter"])
+@pytest.mark.parametrize("fixed_max", [True, False])
+def test_blit(wide_dataframe, kind, fixed_max, tmp_path):
+    # Without fixed_max the limits grow over the animation, recapturing the background
+    save = functools.partial(
+        wide_dataframe.plot_animated, kind=kind, fixed_max=fixed_max, steps_per_period=3
+    )
+    assert_same_output(save, tmp_path, {}, {"blit": True})
+
+
+@pytest.mark.parametrize("kind", ["line", "scatter", "bar"])
+def test_frame_limits(example_dataframe, kind):
+    example_dataframe.iloc[1, 0] = -example_dataframe.iloc[1, 0] - 1
+    chart = example_dataframe.plot_animated(kind=kind, enable_progress_bar=False)
+    for i in range(len(chart.df)):
+        chart.anim_func(i)
+        values = chart.df.iloc[: i + 1].values
+        ylim = chart.ax.get_ylim()
+        assert ylim[0] <= values.min()
+        assert ylim[1] >= values.max()
+
+
+def test_trailing_window(example_dataframe):
+    chart = example_dataframe.plot_animated(
+        kind="line", trailing_window=3, enable_progress_bar=False
+    )
+    for i in range(len(chart.df)):
+        chart.anim_func(i)
+        window = chart.df.iloc[max(0, i - 2) : i + 1]
+        ylim = chart.ax.get_ylim()
+        assert ylim[0] <= window.values.min()
+        assert ylim[1] >= window.values.max()
+        for line in chart._lines.values():
+            assert len(line.get_xdata()) == len(window)
+
+
+def test_trailing_window_integer_types(example_dataframe):
+    # Eg a window calculated from the length of a DataFrame
+    chart = example_dataframe.plot_animated(kind="line", trailing_window=np.int64(3))
+    for i in range(len(chart.df)):
+        chart.anim_func(i)
+    for line in chart._lines.values():
+        assert len(line.get_xdata()) == 3
+    for trailing_window in [0, 2.5, True]:
+        with pytest.raises(ValueError):
+            example_dataframe.plot_animated(kind="line", trailing_window=trailing_window)
+
+
+@pytest.mark.parametrize("trailing_window", [None, 3])
+def test_fill_under_line(example_dataframe, trailing_window):
+    chart = example_dataframe.plot_animated(
+        kind="line",
+        fill_under_line_color="blue",
+        trailing_window=trailing_window,
+        enable_progress_bar=False,
+    )
+    for i in range(len(chart.df)):
+        chart.anim_func(i)
+        for name, line in chart._lines.items():
+            (path,) = chart._fills[name]["collection"].get_paths()
+            xy = line.get_xydata()
+            expected = np.vstack([xy, [[xy[-1, 0], 0], [xy[0, 0], 0], xy[0]]])
+            np.testing.assert_array_equal(path.vertices, expected)
+
+
+def test_scatter_merge_series(example_dataframe):
+    separate = example_dataframe.plot_animated(kind="scatter", size="A")
+    merged = example_dataframe.plot_animated(
+        kind="scatter", size="A", merge_series=True
+    )
+    for i in range(len(separate.df)):
+        separate.anim_func(i)
+        merged.anim_func(i)
+        (collection,) = merged.ax.collections
+        offsets = collection.get_offsets().reshape(i + 1, -1, 2)
+        sizes = collection.get_sizes().reshape(i + 1, -1)
+        for j, name in enumerate(separate.data_cols):
+            np.testing.assert_array_equal(
+                offsets[:, j], separate._points[name].get_offsets()
+            )
+            np.testing.assert_array_equal(
+                sizes[:, j], separate._points[name].get_sizes()
+            )
+        facecolors = collection.get_facecolor().reshape(i + 1, -1, 4)
+        for j, name in enumerate(separate.data_cols):
+            np.testing.assert_array_equal(
+                facecolors[:, j],
+                np.broadcast_to(separate._points[name].get_facecolor(), (i + 1, 4)),
+            )
+
+
+def test_scatter_merge_series_colors(example_dataframe):
+    chart = example_dataframe.plot_animated(
+        kind="scatter", merge_series=True, color="red"
+    )
+    for i in range(len(chart.df)):
+        chart.anim_func(i)
+        (collection,) = chart.ax.collections
+        np.testing.assert_array_equal(
+            collection.get_facecolor(), np.tile([[1, 0, 0, 1]], (2 * (i + 1), 1))
+        )
+
+    n_points = 2 * len(chart.df)
+    point_colors = np.zeros((n_points, 4))
+    point_colors[:, 0] = np.linspace(0, 1, n_points)
+    point_colors[:, 3] = 1
+    chart = example_dataframe.plot_animated(
+        kind="scatter", merge_series=True, c=point_colors
+    )
+    for i in range(len(chart.df)):
+        chart.anim_func(i)
+        (collection,) = chart.ax.collections
+        np.testing.assert_array_equal(
+            collection.get_facecolor(), point_colors[: 2 * (i + 1)]
+        )
+
+    with pytest.raises(ValueError):
+        example_dataframe.plot_animated(
+            kind="scatter", merge_series=True, c=point_colors[:3]
+        )
+
+
+def test_bar_chart_history(example_dataframe, tmp_path):
+    chart = example_dataframe.plot_animated(kind="bar", enable_progress_bar=False)
+    n_columns = len(chart.data_cols)
+    # Frames drawn out of order show the bars of every frame up to them
+    for i in [0, 4, 2, 5, 1]:
+        chart.anim_func(i)
+        visible = [bar for bar in chart.ax.patches if bar.get_visible()]
+        assert len(visible) == (i + 1) * n_columns
+
+    first_file = str(tmp_path / "first.gif")
+    second_file = str(tmp_path / "second.gif")
+    chart.save(first_file)
+    chart.save(second_file)
+    with open(first_file, "rb") as first, open(second_file, "rb") as second:
+        assert first.read() == second.read()
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"startangle": 90, "counterclock": False}])
+def test_pie_wedges(example_dataframe, kwargs):
+    import matplotlib.pyplot as plt
+
+    example_dataframe["C"] = np.nan
+    chart = example_dataframe.plot_animated(
+        kind="pie", autopct="%1.1f%%", enable_progress_bar=False, **kwargs
+    )
+    fig, ax = plt.subplots()
+    for i in range(len(chart.df)):
+        chart.anim_func(i)
+        values = chart.df.iloc[i].dropna()
+        wedges, labels, autotexts = ax.pie(
+            values, labels=values.index, autopct="%1.1f%%", **kwargs
+        )
+        visible = [wedge for wedge in chart._wedges if wedge.get_visible()]
+        assert len(visible) == len(wedges)
+        for wedge, expected in zip(visible, wedges):
+            assert wedge.theta1 == pytest.approx(expected.theta1, abs=1e-4)
+            assert wedge.theta2 == pytest.approx(expected.theta2, abs=1e-4)
+        for text, expected in zip(chart._autotexts, autotexts):
+            assert text.get_text() == expected.get_text()
+        ax.clear()
+    plt.close(fig)
+
+
+def test_pie_shadows(example_dataframe):
+    import matplotlib.patches
+
+    example_dataframe["C"] = np.nan
+    chart = example_dataframe.plot_animated(
+        kind="pie", shadow=True, enable_progress_bar=False
+    )
+    for i in range(len(chart.df)):
+        chart.anim_func(i)
+        shadows = [
+            patch
+            for patch in chart.ax.patches
+            if isinstance(patch, matplotlib.patches.Shadow)
+        ]
+        assert [shadow.patch for shadow in shadows] == chart._wedges
+        for shadow in shadows:
+            assert shadow.get_visible() == shadow.patch.get_visible()
+            np.testing.assert_array_equal(
+                shadow.get_path().vertices, shadow.patch.get_path().vertices
+            )
+    assert [shadow.get_visible() for shadow in shadows] == [True, True, False]
+
+
+def test_bubble_chart():
+    columns = pd.MultiIndex.from_product([["x", "y", "size", "color"], range(5)])
+    df = pd.DataFrame(
+        np.random.random((3, 20)),
+        index=pd.date_range("2020-01-01", periods=3),
+        columns=columns,
+    )
+    chart = df.plot_animated(
+        kind="bubble",
+        x_data_label="x",
+        y_data_label="y",
+        size_data_label="size",
+        color_data_label="color",
+        enable_progress_bar=False,
+    )
+    for i in range(len(chart.df)):
+        chart.anim_func(i)
+        (collection,) = chart.ax.collections
+        frame = chart.df.iloc[i]
+        np.testing.assert_array_equal(
+            collection.get_offsets(),
+            np.column_stack([frame["x"].values, frame["y"].values]),
+        )
+        np.testing.assert_array_equal(collection.get_sizes(), frame["size"].values)
+        np.testing.assert_array_equal(collection.get_array(), frame["color"].values)
+        assert collection.get_clim() == (chart.vmin, chart.vmax)
+
+
+def test_measure_axes_layout():
+    import io
+    import matplotlib
+    import matplotlib.pyplot as plt
+    from pandas_alive._base_chart import layout_rc_key, measure_axes_layout
+
+    with matplotlib.rc_context({"figure.autolayout": True}):
+        args = ((6.5, 3.5), 7, ("a", "a longer label"), "12345.6", layout_rc_key())
+        measure_axes_layout.cache_clear()
+        orig_pos, new_pos = measure_axes_layout(*args)
+        assert measure_axes_layout(*args) == (orig_pos, new_pos)
+        assert measure_axes_layout.cache_info().hits == 1
+
+        # Same positions as rendering the figure
+        fig = plt.Figure(figsize=(6.5, 3.5))
+        ax = fig.add_subplot()
+        ax.tick_params(labelrotation=0, labelsize=7)
+        fig.canvas.print_figure(io.BytesIO())
+        np.testing.assert_allclose(ax.get_position().bounds, orig_pos.bounds)
+        ax.set_yticklabels(["a", "a longer label"])
+        ax.set_xticklabels(["12345.6"] * len(ax.get_xticks()))
+        fig.canvas.print_figure(io.BytesIO())
+        np.testing.assert_allclose(ax.get_position().bounds, new_pos.bounds)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_render_batch(example_dataframe, workers, tmp_path):
+    jobs = [
+        {"input_df": example_dataframe, "filename": str(tmp_path / "race.gif")},
+        {
+            "input_df": example_dataframe,
+            "filename": str(tmp_path / "line.gif"),
+            "kind": "line",
+            "steps_per_period": 2,
+        },
+    ]
+    failing_job = {
+        "input_df": example_dataframe,
+        "filename": str(tmp_path / "failed.gif"),
+        "kind": "unknown",
+    }
+    results = pandas_alive.render_batch(jobs + [failing_job], workers=workers)
+    assert [result.filename for result in results] == [
+        job["filename"] for job in jobs + [failing_job]
+    ]
+    assert [result.frames for result in results] == [6, 3, None]
+    assert all(result.seconds > 0 for result in results)
+    assert [result.error for result in results[:2]] == [None, None]
+    assert "ValueError" in results[2].error
+
+    for job in jobs:
+        expected_file = str(tmp_path / "expected.gif")
+        pandas_alive.plot(**dict(job, filename=expected_file))
+        with open(job["filename"], "rb") as batch, open(expected_file, "rb") as expected:
+            assert batch.read() == expected.read()
+
+    with pytest.raises(ValueError):
+        pandas_alive.render_batch([{"input_df": example_dataframe}])
+
+
+@pytest.mark.skipif(
+    not FFMpegPipeWriter.is_available(), reason="ffmpeg is not installed"
+)
+@pytest.mark.parametrize("kind", ["race", "line"])
+def test_save_video(wide_dataframe, kind, tmp_path):
+    save = functools.partial(
+        wide_dataframe.plot_animated,
+        kind=kind,
+        steps_per_period=3,
+        crf=30,
+        preset="ultrafast",
+        threads=1,
+    )
+    assert_same_output(save, tmp_path, {}, {"workers": 2}, extension="mp4")
+
+
+@pytest.mark.skipif(
+    not FFMpegPipeWriter.is_available(), reason="ffmpeg is not installed"
+)
+def test_html5_video(example_dataframe):
+    video_kwargs = {"crf": 30, "preset": "ultrafast", "threads": 1}
+    serial = example_dataframe.plot_animated().get_html5_video(**video_kwargs)
+    parallel = example_dataframe.plot_animated().get_html5_video(
+        workers=2, **video_kwargs
+    )
+    assert serial.startswith("<video")
+    assert 'src="data:video/mp4;base64,' in serial
+    assert serial == parallel
+
+
+@pytest.mark.skipif(
+    not FFMpegPipeWriter.is_available(), reason="ffmpeg is not installed"
+)
+@pytest.mark.parametrize("extension", ["gif", "mp4"])
+def test_multiple_plots_workers(wide_dataframe, extension, tmp_path):
+    def save(filename, **kwargs):
+        plots = [
+            wide_dataframe.plot_animated(kind=kind, steps_per_period=3)
+            for kind in ["race", "line"]
+        ]
+        pandas_alive.animate_multiple_plots(
+            filename, plots, crf=30, preset="ultrafast", threads=1, **kwargs
+        )
+
+    assert_same_output(save, tmp_path, {}, {"workers": 2}, extension=extension)
+
+
+def test_ffmpeg_pipe_writer_args():
+    writer = FFMpegPipeWriter(
+        "out.mp4", fps=10, codec="libx264", crf=23, preset="fast", threads=2
+    )
+    args = writer.get_args(101, 50)
+    assert args[-1] == "out.mp4"
+    assert args[args.index("-s") + 1] == "101x50"
+    # Options after the input apply to the encoded video
+    output = args[args.index("pipe:") + 1 :]
+    for option, value in [
+        ("-vcodec", "libx264"),
+        ("-pix_fmt", "yuv420p"),
+        ("-crf", "23"),
+        ("-preset", "fast"),
+        ("-threads", "2"),
+    ]:
+        assert output[output.index(option) + 1] == value
+    assert "-vf" in args
+    assert "-vf" not in writer.get_args(100, 50)
+
+
+@pytest.mark.parametrize("orientation", ["h", "v"])
+def test_reuse_bars(orientation):
+    # Random walks, so bars swap places & columns move in and out of the top 5
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        np.cumsum(rng.integers(-2000, 2000, size=(10, 15)), axis=0) + 20000,
+        columns=[f"C{i:02d}" for i in range(15)],
+        index=pd.date_range("2020-01-01", periods=10, freq="W"),
+    )
+    kwargs = {"orientation": orientation, "n_visible": 5, "steps_per_period": 3}
+    full = df.plot_animated(**kwargs)
+    reuse = df.plot_animated(reuse_bars=True, **kwargs)
+
+    def get_ticks(chart):
+        axis = chart.ax.yaxis if orientation == "h" else chart.ax.xaxis
+        labels = [label.get_text() for label in axis.get_ticklabels()]
+        return list(zip(axis.get_ticklocs(), labels))
+
+    def get_bars(chart):
+        patches = [patch for patch in chart.ax.patches if patch.get_visible()]
+        return sorted(patch.get_bbox().bounds for patch in patches)
+
+    n_tied = 0
+    frames = zip(full.get_frames(), full.render_frames(), reuse.render_frames())
+    for i, full_frame, reuse_frame in frames:
+        columns = full.get_visible_columns(i)
+        ranks = full.get_ranks(i, columns)
+        visible = (ranks > 0) & (ranks < 6)
+        ranks, names = ranks[visible], full.df.columns[columns[visible]]
+        if len(np.unique(ranks)) == len(ranks):
+            np.testing.assert_array_equal(full_frame, reuse_frame)
+            continue
+        # Bars sharing a rank have a tick each, the default mode labels them all
+        # with the same category while reused bars keep their own labels
+        n_tied += 1
+        np.testing.assert_allclose(get_bars(full), get_bars(reuse))
+        reuse_ticks = get_ticks(reuse)
+        assert reuse_ticks == list(zip(ranks, names))
+        full_ticks = get_ticks(full)
+        assert [rank for rank, _ in full_ticks] == list(ranks)
+        for rank in ranks:
+            (label,) = {label for tick, label in full_ticks if tick == rank}
+            assert label in {name for tick, name in reuse_ticks if tick == rank}
+    assert 0 < n_tied < len(full.get_frames())
+
+
+def test_race_ranks():
+    df = pd.DataFrame(
+        [[np.nan, 1, 1, 3], [2, 5, 2, 0]],
+        columns=["A", "B", "C", "D"],
+        index=pd.date_range("2020-01-01", periods=2),
+    )
+    animated_plot = df.plot_animated(kind="race", n_visible=3)
+    # Ties are ranked in column order, as with `method="first"`
+    expected = 4 - df.rank(axis=1, method="first", ascending=False).clip(upper=4)
+    ranks = animated_plot.df_rank
+    assert (ranks.dtypes == np.float32).all()
+    pd.testing.assert_index_equal(ranks.index, animated_plot.df.index)
+    pd.testing.assert_index_equal(ranks.columns, df.columns)
+    assert np.array_equal(
+        ranks.values[:: animated_plot.steps_per_period], expected.values, equal_nan=True
+    )
+    for i in range(len(ranks)):
+        assert np.array_equal(
+            ranks.iloc[i].values, animated_plot.get_ranks(i), equal_nan=True
+        )
+
+
+def test_race_visible_columns():
+    df = pd.DataFrame(
+        np.random.random((5, 30)), index=pd.date_range("2020-01-01", periods=5)
+    )
+    animated_plot = df.plot_animated(kind="race", n_visible=5)
+    for i in range(len(animated_plot.df.index)):
+        ranks = animated_plot.get_ranks(i)
+        visible = np.flatnonzero((ranks > 0) & (ranks < 6))
+        columns = animated_plot.get_visible_columns(i)
+        # Only the bars visible in the periods either side of the frame are checked
+        assert np.isin(visible, columns).all()
+        assert len(columns) <= 10
+
+
+def test_largest_value_ignores_missing_values(example_dataframe, monkeypatch):
+    missing = example_dataframe.astype(float)
+    missing.iloc[0, 0] = np.nan
+    largest = missing.max().max()
+
+    max_labels = []
+    measure_axes_layout = _base_chart.measure_axes_layout
+
+    def measure(*args):
+        max_labels.append(args[3])
+        return measure_axes_layout(*args)
+
+    monkeypatch.setattr(_base_chart, "measure_axes_layout", measure)
+    missing.plot_animated(kind="line")
+    assert max_labels == [str(largest)]
+
+    animated_plot = missing.plot_animated(kind="race", fixed_max=True)
+    assert animated_plot.ax.get_xlim()[1] == largest * 1.05 * 1.11
+
+
+@pytest.mark.parametrize("kind", ["race", "pie"])
+def test_lazy_frames(wide_dataframe, kind, tmp_path):
+    # Frames are interpolated from each of the nine gaps between periods
+    save = functools.partial(wide_dataframe.plot_animated, kind=kind, steps_per_period=3)
+    assert_same_output(save, tmp_path, {}, {"lazy_frames": True})
+
+
+def test_copy(example_dataframe):
+    shared = example_dataframe.plot_animated(copy=False)
+    copied = example_dataframe.plot_animated()
+    assert np.shares_memory(shared.orig_df.values, example_dataframe.values)
+    assert not np.shares_memory(copied.orig_df.values, example_dataframe.values)
+    pd.testing.assert_frame_equal(shared.df, copied.df)
+
+
+@pytest.mark.parametrize("interpolate_method", ["linear", "time", "smoothstep", "cubic"])
+def test_interpolate_method(interpolate_method):
+    df = pd.DataFrame(
+        np.random.randint(0, 10000, size=(4, 2)),
+        # Evenly spaced, so the frames of every method fall on the periods
+        index=pd.date_range("2020-01-01", periods=4, freq="W"),
+        columns=["A", "B"],
+    )
+    animated_plot = df.plot_animated(kind="line", interpolate_method=interpolate_method)
+    steps_per_period = animated_plot.steps_per_period
+    values = animated_plot.df.values
+    periods = df.values
+    assert np.array_equal(values[::steps_per_period], periods)
+    # Every frame moves towards the next period
+    period_steps = np.repeat(np.diff(periods, axis=0), steps_per_period, axis=0)
+    assert (np.diff(values, axis=0) * period_steps >= 0).all()
+
+
+def test_interpolate_time_requires_interpolate_period(example_dataframe):
+    with pytest.raises(ValueError):
+        example_dataframe.plot_animated(
+            kind="line", interpolate_method="time", interpolate_period=False
+        )
+
+
+def test_interpolate_linear_matches_pandas(example_dataframe):
+    animated_plot = example_dataframe.plot_animated(kind="line")
+    expected = example_dataframe.reset_index()
+    expected.index = expected.index * animated_plot.steps_per_period
+    expected = expected.reindex(range(len(animated_plot.df.index)))
+    expected = expected.set_index(animated_plot.df.index).drop(columns="index")
+    expected = expected.interpolate(method="time")
+    assert np.array_equal(animated_plot.df.values, expected.values)
+
+
+def test_interpolation_coordinates_use_df_index(example_dataframe):
+    # Coordinates come from the index of `df`, not the chart's own DatetimeIndex
+    animated_plot = example_dataframe.plot_animated(kind="line")
+    periods = pd.DataFrame(index=pd.Index([0, 10, 20]))
+    _, x, xp, _ = animated_plot.get_interpolation_coordinates(periods, 2, True)
+    assert np.array_equal(x, np.arange(5))
+    assert np.array_equal(xp, [0, 2, 4])
+
+
+def test_interpolate_object_datetime_index(example_dataframe):
+    # Map charts transpose dates from columns that also hold "geometry"
+    object_index = example_dataframe.set_axis(
+        example_dataframe.index.astype(object), axis=0
+    )
+    animated_plot = object_index.plot_animated(kind="line")
+    expected = example_dataframe.plot_animated(kind="line")
+    pd.testing.assert_index_equal(animated_plot.df.index, expected.df.index)
+    pd.testing.assert_frame_equal(animated_plot.df, expected.df)
+
+
+@pytest.fixture
+def polygon_map():
+    geopandas = pytest.importorskip("geopandas")
+    pytest.importorskip("descartes")
+    from shapely.geometry import MultiPolygon, box
+
+    geometry = [
+        box(0, 0, 1, 1),
+        box(1, 0, 2, 1),
+        MultiPolygon([box(0, 1, 1, 2), box(1.5, 1.5, 2, 2)]),
+        box(2, 0, 3, 1),
+    ]
+    return geopandas.GeoDataFrame(
+        {
+            "2020-01-01": [1.0, 4.0, 2.0, np.nan],
+            "2020-01-02": [3.0, np.nan, 5.0, np.nan],
+            "2020-01-03": [2.0, 6.0, np.nan, np.nan],
+        },
+        geometry=geometry,
+    )
+
+
+@pytest.fixture
+def point_map():
+    geopandas = pytest.importorskip("geopandas")
+    pytest.importorskip("descartes")
+    from shapely.geometry import Point
+
+    return geopandas.GeoDataFrame(
+        {
+            "2020-01-01": [1.0, 4.0, 2.0, np.nan],
+            "2020-01-02": [3.0, np.nan, 5.0, np.nan],
+            "2020-01-03": [2.0, 6.0, 3.0, np.nan],
+        },
+        geometry=[Point(0, 0), Point(1, 1), Point(2, 0), Point(3, 2)],
+    )
+
+
+def assert_map_frame(chart, i, **kwargs):
+    """ Draw frame `i` of a map and assert it looks like `GeoDataFrame.plot` of its values
+
+    Args:
+        chart (MapChart): Chart to draw
+        i (int): Frame to draw
+        kwargs: Keyword arguments of `GeoDataFrame.plot` the chart was created with
+    """
+    import geopandas
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PathCollection
+
+    def get_elements(collection, get, n_elements):
+        # Properties given once apply to every element
+        values = np.asarray(getattr(collection, get)())
+        if len(values) == 1:
+            return np.broadcast_to(values, (n_elements,) + values.shape[1:])
+        return values
+
+    chart.anim_func(i)
+    values = chart._frame_values[i]
+    if chart.enable_markersize:
+        kwargs["markersize"] = values * chart.scale_markersize
+    fig, ax = plt.subplots()
+    frame = geopandas.GeoDataFrame(
+        {"value": values}, geometry=chart.get_map_geometry(chart.df)
+    )
+    if "color" not in kwargs:
+        kwargs["cmap"] = chart.cmap
+    frame.plot(column="value", ax=ax, **kwargs)
+
+    rows = {id(collection): rows for collection, rows in chart._collections}
+    assert len(chart.ax.collections) == len(ax.collections)
+    for collection, expected in zip(chart.ax.collections, ax.collections):
+        # Geopandas leaves out geometries without a value, here they are transparent
+        drawn = slice(None)
+        if id(collection) in rows and collection.get_array() is not None:
+            drawn = ~np.isnan(values[rows[id(collection)]])
+        if isinstance(collection, PathCollection):
+            elements = collection.get_offsets()
+            np.testing.assert_array_equal(elements[drawn], expected.get_offsets())
+        else:
+            elements = collection.get_paths()
+            expected_paths = expected.get_paths()
+            drawn_paths = np.array(elements, dtype=object)[drawn]
+            assert len(drawn_paths) == len(expected_paths)
+            for path, expected_path in zip(drawn_paths, expected_paths):
+                np.testing.assert_array_equal(path.vertices, expected_path.vertices)
+
+        for drawing in [collection, expected]:
+            drawing.update_scalarmappable()
+        n_drawn = len(np.arange(len(elements))[drawn])
+        for get in ["get_facecolors", "get_edgecolors", "get_sizes"]:
+            if not len(getattr(expected, get, list)()):
+                # Polygons have no sizes, faces may have no edges
+                assert not len(getattr(collection, get, list)())
+                continue
+            np.testing.assert_allclose(
+                get_elements(collection, get, len(elements))[drawn],
+                # Missing values are sized NaN by geopandas and 0 here, both unseen
+                np.nan_to_num(get_elements(expected, get, n_drawn)),
+            )
+    plt.close(fig)
+
+
+def test_map_chart_polygons(polygon_map, tmp_path):
+    filename = str(tmp_path / "map.gif")
+    chart = polygon_map.plot_animated(filename=filename, legend=True)
+    # Missing values are interpolated like `DataFrame.interpolate`
+    periods = polygon_map.drop(columns="geometry").T.interpolate().values
+    np.testing.assert_array_equal(
+        chart._frame_values[:: chart.steps_per_period], periods
+    )
+    with Image.open(filename) as gif:
+        assert gif.n_frames == len(chart._frame_values)
+
+    for i in [0, 2, 5, 8, len(chart._frame_values) - 1]:
+        chart.anim_func(i)
+        (collection,) = chart.ax.collections
+        values = chart._frame_values[i]
+        # The parts of the multipolygon are separate paths of the same row
+        np.testing.assert_array_equal(
+            collection.get_array().filled(np.nan), values[[0, 1, 2, 2, 3]]
+        )
+        assert collection.get_array().mask.tolist() == [False] * 4 + [True]
+        limits = (np.nanmin(values), np.nanmax(values))
+        assert collection.get_clim() == limits
+        assert chart._colorbar.mappable.get_clim() == limits
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"scheme": "quantiles", "k": 2},
+        {"color": "tab:red"},
+        {"missing_kwds": {"color": "lightgrey", "edgecolor": "red", "hatch": "//"}},
+    ],
+)
+def test_map_chart_polygons_geopandas_kwargs(polygon_map, kwargs):
+    if "scheme" in kwargs:
+        pytest.importorskip("mapclassify")
+    # Missing from the start, so the rows without a value change mid animation
+    polygon_map.loc[0, "2020-01-01"] = np.nan
+    chart = polygon_map.plot_animated(**kwargs)
+    for i in chart.get_frames():
+        assert_map_frame(chart, i, **kwargs)
+
+
+def test_map_chart_points(point_map, tmp_path):
+    filename = str(tmp_path / "map.gif")
+    chart = point_map.plot_animated(filename=filename, scale_markersize=10)
+    with Image.open(filename) as gif:
+        assert gif.n_frames == len(chart._frame_values)
+
+    for i in [0, 2, 5, 8, len(chart._frame_values) - 1]:
+        chart.anim_func(i)
+        (collection,) = chart.ax.collections
+        values = chart._frame_values[i]
+        np.testing.assert_array_equal(
+            collection.get_offsets(), [[0, 0], [1, 1], [2, 0], [3, 2]]
+        )
+        np.testing.assert_array_equal(collection.get_array().filled(np.nan), values)
+        assert collection.get_array().mask.tolist() == [False] * 3 + [True]
+        np.testing.assert_array_equal(
+            collection.get_sizes(), np.nan_to_num(values * 10)
+        )
+        assert collection.get_clim() == (np.nanmin(values), np.nanmax(values))
+
+
+def test_map_chart_basemap_cache(polygon_map, tmp_path, monkeypatch):
+    contextily = pytest.importorskip("contextily")
+    previous_memory = contextily.tile.memory
+    cache_dir = tmp_path / "basemap"
+    fetched = []
+    memories = []
+
+    def fetch_tile(tile_url, wait, max_retries):
+        # Stands in for downloading a tile, noting the tile cache it is fetched with
+        fetched.append(tile_url)
+        memories.append(contextily.tile.memory)
+        return np.zeros((256, 256, 3), dtype=np.uint8)
+
+    monkeypatch.setattr(contextily.tile, "_fetch_tile", fetch_tile)
+    polygon_map = polygon_map.set_crs(3857)
+    basemap_format = {"source": "http://tiles.test/{z}/{x}/{y}.png", "zoom": 1}
+
+    def plot(**kwargs):
+        chart = polygon_map.plot_animated(
+            filename=str(tmp_path / "map.gif"), basemap_format=basemap_format, **kwargs
+        )
+        assert contextily.tile.memory is previous_memory
+        chart.anim_func(0)
+        assert len(chart.ax.images) == 1
+
+    plot(basemap_cache_dir=str(cache_dir))
+    assert fetched
+    assert all(memory is not previous_memory for memory in memories)
+    # The tiles are written to `basemap_cache_dir`
+    tiles = list(cache_dir.rglob("output.pkl"))
+    assert len(tiles) == len(fetched)
+
+    # Later runs draw the cached basemap, or the cached tiles for a new extent
+    plot(basemap_cache_dir=str(cache_dir))
+    for basemap_file in cache_dir.glob("basemap-*.npz"):
+        basemap_file.unlink()
+    plot(basemap_cache_dir=str(cache_dir))
+    assert len(memories) == len(tiles)
+
+    # Without `basemap_cache_dir` contextily's own tile cache is used
+    fetched.clear()
+    plot()
+    assert fetched
+    assert memories[len(tiles) :] == [previous_memory] * len(fetched)
+
+
+def test_map_chart_simplify(polygon_map):
+    from shapely.geometry import Point
+
+    # A circle with far more vertices than pixels along its outline
+    polygon_map.loc[0, "geometry"] = Point(0.5, 0.5).buffer(0.5, resolution=4096)
+    n_vertices = len(polygon_map.geometry[0].exterior.coords)
+    simplified = polygon_map.plot_animated()
+    full = polygon_map.plot_animated(simplify_tolerance=None)
+    for chart in [simplified, full]:
+        chart.anim_func(0)
+    (simplified_collection,) = simplified.ax.collections
+    (full_collection,) = full.ax.collections
+    assert len(full_collection.get_paths()[0].vertices) >= n_vertices
+    assert len(simplified_collection.get_paths()[0].vertices) < n_vertices / 10
+    # Other frames and saves draw the cached geometry
+    assert simplified.get_map_geometry(simplified.df) is simplified.get_map_geometry(
+        simplified.df
+    )
+
+
+@pytest.mark.parametrize("interpolate_period", [True, False])
+def test_map_chart_frame_values(polygon_map, interpolate_period):
+    chart = polygon_map.plot_animated(interpolate_period=interpolate_period)
+    # Same frames as a DataFrame with a row per period and a column per geometry
+    periods = polygon_map.drop(columns="geometry").T
+    periods.index = pd.to_datetime(periods.index)
+    expected = periods.plot_animated(
+        kind="line", interpolate_period=interpolate_period
+    )
+    pd.testing.assert_index_equal(chart._frame_index, expected.df.index)
+    np.testing.assert_array_equal(chart._frame_values, expected.df.values)
+    assert list(chart.df.columns) == ["geometry"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"scheme": "quantiles", "k": 2},
+        {"scheme": "equalinterval", "classification_kwds": {"k": 3}},
+        {"color": "tab:red"},
+        {"categorical": True},
+        {"categories": list(np.arange(1, 6.5, 0.5))},
+        {"missing_kwds": {"color": "lightgrey", "marker": "x"}},
+        {"markersize": 5},
+    ],
+)
+def test_map_chart_points_geopandas_kwargs(point_map, kwargs):
+    if "scheme" in kwargs:
+        pytest.importorskip("mapclassify")
+    # Missing from the start, so the rows without a value change mid animation
+    point_map.loc[0, "2020-01-01"] = np.nan
+    # Every value between periods is a multiple of 0.5, one of `categories`
+    chart = point_map.plot_animated(steps_per_period=2, **kwargs)
+    # Keyword arguments only `GeoDataFrame.plot` accepts are drawn by geopandas
+    assert (chart._point_coordinates is None) == bool(kwargs)
+    # A fixed `markersize` isn't replaced by the values
+    assert chart.enable_markersize == ("markersize" not in kwargs)
+    for i in chart.get_frames():
+        assert_map_frame(chart, i, **kwargs)